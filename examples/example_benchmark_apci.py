@@ -0,0 +1,47 @@
+"""Micro-benchmark for resolving APCI services, parsing and serializing frames."""
+import timeit
+
+from xknx import XKNX
+from xknx.knxip import KNXIPFrame
+from xknx.telegram.apci import APCI, APCIExtendedService, APCIService, APCIUserService
+
+ROUNDS = 100_000
+# RoutingIndication carrying a GroupValueWrite with 2 byte payload
+ROUTING_INDICATION = bytes.fromhex(
+    "06 10 05 30 00 13 29 00 bc d0 12 02 01 51 03 00 80 0c 3f"
+)
+
+
+def benchmark_resolve_apci() -> None:
+    """Print time per APCI.resolve_apci() call for every known service."""
+    for service in (*APCIService, *APCIUserService, *APCIExtendedService):
+        if service in (APCIService.USER_MESSAGE, APCIService.ESCAPE):
+            continue
+        seconds = timeit.timeit(
+            lambda value=service.value: APCI.resolve_apci(value), number=ROUNDS
+        )
+        print(f"resolve_apci {service.name:<35} {seconds / ROUNDS * 1e9:8.0f} ns")
+
+
+def benchmark_frame_parsing() -> None:
+    """Print time to parse a RoutingIndication frame."""
+    xknx = XKNX()
+    seconds = timeit.timeit(
+        lambda: KNXIPFrame(xknx).from_knx(ROUTING_INDICATION), number=ROUNDS
+    )
+    print(f"KNXIPFrame.from_knx RoutingIndication {seconds / ROUNDS * 1e6:8.2f} µs")
+
+
+def benchmark_frame_serialization() -> None:
+    """Print time to serialize a RoutingIndication frame."""
+    xknx = XKNX()
+    knxipframe = KNXIPFrame(xknx)
+    knxipframe.from_knx(ROUTING_INDICATION)
+    seconds = timeit.timeit(knxipframe.to_knx, number=ROUNDS)
+    print(f"KNXIPFrame.to_knx RoutingIndication   {seconds / ROUNDS * 1e6:8.2f} µs")
+
+
+if __name__ == "__main__":
+    benchmark_resolve_apci()
+    benchmark_frame_parsing()
+    benchmark_frame_serialization()
@@ -0,0 +1,123 @@
+"""Unit test for BoundedTelegramQueue."""
+import asyncio
+
+from xknx.core import BoundedTelegramQueue, OverflowPolicy
+from xknx.dpt import DPTBinary
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection
+from xknx.telegram.apci import GroupValueWrite
+
+
+def _telegram(address, value=1, direction=TelegramDirection.INCOMING):
+    """Return a GroupValueWrite telegram."""
+    return Telegram(
+        destination_address=GroupAddress(address),
+        direction=direction,
+        payload=GroupValueWrite(DPTBinary(value)),
+    )
+
+
+def _get_all(queue):
+    """Return all queued items."""
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+        queue.task_done()
+    return items
+
+
+class TestBoundedTelegramQueue:
+    """Test class for BoundedTelegramQueue."""
+
+    async def test_unbounded(self):
+        """Test queue without maxsize never drops telegrams."""
+        queue = BoundedTelegramQueue()
+        for address in range(100):
+            queue.put_nowait(_telegram(address))
+        assert queue.qsize() == 100
+        assert queue.dropped_telegrams == 0
+
+    async def test_drop_newest(self):
+        """Test received telegrams are dropped if the queue is full."""
+        queue = BoundedTelegramQueue(
+            maxsize=2, overflow_policy=OverflowPolicy.DROP_NEWEST
+        )
+        for address in range(4):
+            queue.put_nowait(_telegram(address))
+        assert queue.dropped_telegrams == 2
+        assert _get_all(queue) == [_telegram(0), _telegram(1)]
+
+    async def test_drop_oldest(self):
+        """Test the oldest incoming telegram is dropped if the queue is full."""
+        queue = BoundedTelegramQueue(
+            maxsize=3, overflow_policy=OverflowPolicy.DROP_OLDEST
+        )
+        outgoing = _telegram(0, direction=TelegramDirection.OUTGOING)
+        await queue.put(outgoing)
+        for address in range(1, 6):
+            queue.put_nowait(_telegram(address))
+        assert queue.dropped_telegrams == 2
+        # outgoing telegrams are never dropped
+        assert _get_all(queue) == [outgoing, _telegram(3), _telegram(4), _telegram(5)]
+        # dropped telegrams don't block join()
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+    async def test_outgoing_not_counted(self):
+        """Test outgoing telegrams don't count against maxsize."""
+        queue = BoundedTelegramQueue(maxsize=1)
+        outgoing = _telegram(0, direction=TelegramDirection.OUTGOING)
+        await queue.put(outgoing)
+        await queue.put(outgoing)
+        queue.put_nowait(_telegram(1))
+        assert queue.dropped_telegrams == 0
+        assert queue.incoming_full()
+        assert _get_all(queue) == [outgoing, outgoing, _telegram(1)]
+        assert not queue.incoming_full()
+
+    async def test_coalesce(self):
+        """Test queued telegrams for the same address are replaced if the queue is full."""
+        queue = BoundedTelegramQueue(maxsize=2, overflow_policy=OverflowPolicy.COALESCE)
+        queue.put_nowait(_telegram(1, value=0))
+        queue.put_nowait(_telegram(2, value=0))
+        queue.put_nowait(_telegram(2, value=1))
+        assert queue.dropped_telegrams == 1
+        assert list(queue._queue) == [_telegram(1, value=0), _telegram(2, value=1)]
+        # no telegram for this address - drop oldest
+        queue.put_nowait(_telegram(3))
+        assert queue.dropped_telegrams == 2
+        assert _get_all(queue) == [_telegram(2, value=1), _telegram(3)]
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+    async def test_outgoing_doesnt_wait(self):
+        """Test outgoing telegrams don't wait if the queue is full of incoming telegrams."""
+        queue = BoundedTelegramQueue(maxsize=1)
+        queue.put_nowait(_telegram(1))
+        outgoing = _telegram(0, direction=TelegramDirection.OUTGOING)
+        # eg. a device answering a GroupValueRead from within the consumer
+        await asyncio.wait_for(queue.put(outgoing), timeout=1)
+        queue.put_nowait(None)
+        assert _get_all(queue) == [_telegram(1), outgoing, None]
+        assert queue.dropped_telegrams == 0
+
+    async def test_held_telegrams(self):
+        """Test taken telegrams count against maxsize until they are released."""
+        queue = BoundedTelegramQueue(maxsize=2)
+        queue.put_nowait(_telegram(1))
+        queue.get_nowait()
+        queue.hold()
+        queue.put_nowait(_telegram(2))
+        assert queue.incoming_full()
+        # held telegrams can't be dropped - drop the oldest queued one
+        queue.put_nowait(_telegram(3))
+        assert queue.dropped_telegrams == 1
+        assert list(queue._queue) == [_telegram(3)]
+        queue.get_nowait()
+        queue.hold()
+        # only held telegrams left - drop the received one
+        queue.put_nowait(_telegram(4))
+        assert queue.dropped_telegrams == 2
+        assert queue.empty()
+
+        queue.release()
+        queue.put_nowait(_telegram(5))
+        assert queue.dropped_telegrams == 2
+        assert queue.incoming_full()
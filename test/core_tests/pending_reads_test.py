@@ -0,0 +1,116 @@
+"""Unit test for PendingReads."""
+import asyncio
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection
+from xknx.telegram.address import InternalGroupAddress
+from xknx.telegram.apci import GroupValueRead, GroupValueResponse, GroupValueWrite
+
+
+class TestPendingReads:
+    """Test class for PendingReads."""
+
+    @patch("logging.Logger.warning")
+    async def test_read_many(self, logger_warning_mock, time_travel):
+        """Test reading multiple group addresses."""
+        xknx = XKNX()
+        addresses = [
+            GroupAddress("1/2/3"),
+            GroupAddress("1/2/4"),
+            GroupAddress("1/2/5"),
+        ]
+        response = Telegram(
+            destination_address=addresses[0],
+            direction=TelegramDirection.INCOMING,
+            payload=GroupValueResponse(DPTBinary(1)),
+        )
+        write = Telegram(
+            destination_address=addresses[1],
+            direction=TelegramDirection.INCOMING,
+            payload=GroupValueWrite(DPTBinary(0)),
+        )
+
+        read_task = asyncio.create_task(xknx.read_many(addresses, timeout=2))
+        await time_travel(0)
+        assert [xknx.telegrams.get_nowait() for _ in addresses] == [
+            Telegram(destination_address=address, payload=GroupValueRead())
+            for address in addresses
+        ]
+        assert len(xknx.pending_reads) == 3
+        # one shared callback for all pending reads
+        assert len(xknx.telegram_queue.telegram_received_cbs) == 1
+
+        await xknx.telegram_queue.process_telegram_incoming(response)
+        await xknx.telegram_queue.process_telegram_incoming(write)
+        assert len(xknx.pending_reads) == 1
+        assert not read_task.done()
+
+        await time_travel(2)
+        assert read_task.result() == {
+            addresses[0]: response,
+            addresses[1]: write,
+            addresses[2]: None,
+        }
+        logger_warning_mock.assert_called_once_with(
+            "Error: KNX bus did not respond in time (%s secs) to GroupValueRead request for: %s",
+            2,
+            "1/2/5",
+        )
+        assert len(xknx.pending_reads) == 0
+        assert not xknx.telegram_queue.telegram_received_cbs
+
+    async def test_read_many_concurrent(self, time_travel):
+        """Test concurrent reads of the same address are resolved by one response."""
+        xknx = XKNX()
+        address = InternalGroupAddress("i-test")
+        first_read = asyncio.create_task(xknx.read_many([address]))
+        second_read = asyncio.create_task(xknx.read_many([address]))
+        await time_travel(0)
+        assert len(xknx.pending_reads) == 1
+
+        # outgoing telegrams to internal group addresses resolve reads too
+        write = Telegram(
+            destination_address=address,
+            direction=TelegramDirection.OUTGOING,
+            payload=GroupValueWrite(DPTBinary(1)),
+        )
+        await xknx.telegram_queue.process_telegram_outgoing(write)
+        await time_travel(0)
+        assert first_read.result() == {address: write}
+        assert second_read.result() == {address: write}
+        assert not xknx.telegram_queue.telegram_received_cbs
+
+    async def test_read_many_cancelled(self, time_travel):
+        """Test pending reads are removed when the caller is cancelled."""
+        xknx = XKNX()
+        read_task = asyncio.create_task(xknx.read_many([GroupAddress("1/2/3")]))
+        await time_travel(0)
+        assert len(xknx.pending_reads) == 1
+
+        read_task.cancel()
+        await time_travel(0)
+        assert read_task.cancelled()
+        assert len(xknx.pending_reads) == 0
+        assert not xknx.telegram_queue.telegram_received_cbs
+
+    async def test_read_many_empty(self):
+        """Test reading no addresses."""
+        xknx = XKNX()
+        assert await xknx.read_many([]) == {}
+        assert xknx.telegrams.empty()
+
+    async def test_read_many_duplicates(self, time_travel):
+        """Test duplicate addresses are read once."""
+        xknx = XKNX()
+        address = GroupAddress("1/2/3")
+        read_task = asyncio.create_task(xknx.read_many([address, address], 2))
+        await time_travel(0)
+        assert xknx.telegrams.qsize() == 1
+        assert len(xknx.pending_reads._pending[address]) == 1
+
+        await time_travel(2)
+        assert read_task.result() == {address: None}
+        assert len(xknx.pending_reads) == 0
+        assert not xknx.telegram_queue.telegram_received_cbs
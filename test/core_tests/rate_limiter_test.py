@@ -0,0 +1,119 @@
+"""Unit test for RateLimiter objects."""
+import asyncio
+
+from xknx import XKNX
+from xknx.core import RateLimiter
+from xknx.core.rate_limiter import destination_line
+from xknx.dpt import DPTBinary
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram
+from xknx.telegram.apci import GroupValueWrite
+
+
+async def _send(rate_limiter, telegram, count=1):
+    """Start `count` waits for telegram concurrently."""
+    return [asyncio.create_task(rate_limiter.wait(telegram)) for _ in range(count)]
+
+
+class TestRateLimiter:
+    """Test class for RateLimiter objects."""
+
+    def setup_method(self):
+        """Set up test class."""
+        # pylint: disable=attribute-defined-outside-init
+        self.xknx = XKNX(rate_limit=10)
+        self.telegram = Telegram(
+            GroupAddress("1/2/3"), payload=GroupValueWrite(DPTBinary(1))
+        )
+
+    async def test_rate(self, time_travel):
+        """Test telegrams are spaced by 1 / rate_limit."""
+        rate_limiter = RateLimiter(self.xknx)
+        tasks = await _send(rate_limiter, self.telegram, 3)
+        await time_travel(0)
+        assert [task.done() for task in tasks] == [True, False, False]
+        await time_travel(0.1)
+        assert [task.done() for task in tasks] == [True, True, False]
+        await time_travel(0.1)
+        assert all(task.done() for task in tasks)
+
+    async def test_burst(self, time_travel):
+        """Test burst of telegrams is sent at once."""
+        self.xknx.rate_limit_burst = 3
+        rate_limiter = RateLimiter(self.xknx)
+        tasks = await _send(rate_limiter, self.telegram, 4)
+        await time_travel(0)
+        assert [task.done() for task in tasks] == [True, True, True, False]
+        await time_travel(0.1)
+        assert tasks[3].done()
+        # bucket refills to burst size
+        await time_travel(1)
+        tasks = await _send(rate_limiter, self.telegram, 4)
+        await time_travel(0)
+        assert [task.done() for task in tasks] == [True, True, True, False]
+        await time_travel(0.1)
+
+    async def test_bucket_key(self, time_travel):
+        """Test telegrams to different lines use separate buckets."""
+        self.xknx.rate_limit = 20
+        self.xknx.rate_limit_burst = 2
+        rate_limiter = RateLimiter(
+            self.xknx, bucket_key=destination_line, bucket_rate_limit=10
+        )
+        telegram_line_1 = Telegram(
+            IndividualAddress("1.1.1"), payload=GroupValueWrite(DPTBinary(1))
+        )
+        telegram_line_2 = Telegram(
+            IndividualAddress("1.2.1"), payload=GroupValueWrite(DPTBinary(1))
+        )
+        assert destination_line(telegram_line_1) == (1, 1)
+        assert destination_line(self.telegram) is None
+
+        tasks = await _send(rate_limiter, telegram_line_1, 1)
+        await time_travel(0.05)
+        tasks += await _send(rate_limiter, telegram_line_1, 1)
+        tasks += await _send(rate_limiter, telegram_line_2, 1)
+        await time_travel(0)
+        # global bucket has 1 + 1 refilled tokens, line 1 bucket is empty
+        assert [task.done() for task in tasks] == [True, False, True]
+        await time_travel(0.05)
+        assert all(task.done() for task in tasks)
+
+    async def test_pause(self, time_travel):
+        """Test pausing sending of telegrams."""
+        rate_limiter = RateLimiter(self.xknx)
+        rate_limiter.pause(1)
+        tasks = await _send(rate_limiter, self.telegram)
+        await time_travel(0.9)
+        assert not tasks[0].done()
+        await time_travel(0.1)
+        assert tasks[0].done()
+
+    async def test_no_rate_limit(self, time_travel):
+        """Test rate_limit 0 doesn't limit."""
+        self.xknx.rate_limit = 0
+        rate_limiter = RateLimiter(self.xknx)
+        tasks = await _send(rate_limiter, self.telegram, 5)
+        await time_travel(0)
+        assert all(task.done() for task in tasks)
+        # pause still applies
+        rate_limiter.pause(1)
+        tasks = await _send(rate_limiter, self.telegram)
+        await time_travel(0.9)
+        assert not tasks[0].done()
+        await time_travel(0.1)
+        assert tasks[0].done()
+
+    def test_confirmation_received(self):
+        """Test adapting the rate to L_DATA_CON latency."""
+        rate_limiter = RateLimiter(self.xknx)
+        assert rate_limiter.rate == 10
+        rate_limiter.confirmation_received(1)
+        assert rate_limiter.rate == 5
+        for _ in range(10):
+            rate_limiter.confirmation_received(3)
+        assert rate_limiter.rate == 1
+        rate_limiter.confirmation_received(0.05)
+        assert rate_limiter.rate == 2
+        for _ in range(10):
+            rate_limiter.confirmation_received(0.05)
+        assert rate_limiter.rate == 10
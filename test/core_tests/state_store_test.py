@@ -0,0 +1,140 @@
+"""Unit test for StateStore."""
+import sqlite3
+import time
+from unittest.mock import AsyncMock, patch
+
+from xknx import XKNX
+from xknx.core import StateStore, XknxConnectionState
+from xknx.devices import Light, Sensor
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.remote_value import RemoteValue
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection
+from xknx.telegram.apci import GroupValueResponse, GroupValueWrite
+
+
+def _telegram(address, payload):
+    """Return an incoming GroupValueWrite telegram."""
+    return Telegram(
+        destination_address=GroupAddress(address),
+        direction=TelegramDirection.INCOMING,
+        payload=GroupValueWrite(payload),
+    )
+
+
+def _devices(xknx):
+    """Create devices with state addresses."""
+    light = Light(
+        xknx,
+        "light",
+        group_address_switch="1/1/1",
+        group_address_switch_state="1/1/2",
+    )
+    sensor = Sensor(
+        xknx, "sensor", group_address_state="1/1/3", value_type="temperature"
+    )
+    return light, sensor
+
+
+class TestStateStore:
+    """Test class for StateStore."""
+
+    async def test_save_restore(self, tmp_path):
+        """Test values are restored as stale."""
+        path = str(tmp_path / "state.db")
+        xknx = XKNX()
+        light, sensor = _devices(xknx)
+        store = StateStore(xknx, path)
+        await light.process(_telegram("1/1/1", DPTBinary(1)))
+        await sensor.process(_telegram("1/1/3", DPTArray((0x0C, 0x1A))))
+        await store.save()
+
+        with sqlite3.connect(path) as connection:
+            rows = connection.execute(
+                "SELECT group_address, apdu FROM state ORDER BY group_address"
+            ).fetchall()
+        assert rows == [("1/1/1", b"\x00\x81"), ("1/1/3", b"\x00\x80\x0c\x1a")]
+
+        xknx = XKNX()
+        light, sensor = _devices(xknx)
+        after_update_cb = AsyncMock()
+        xknx.devices.register_device_updated_cb(after_update_cb)
+        await StateStore(xknx, path).restore()
+        assert light.state is True
+        assert light.switch.stale
+        assert sensor.resolve_state() == 21.0
+        assert sensor.sensor_value.stale
+        assert after_update_cb.call_count == 2
+        # received telegrams are not stale
+        await sensor.process(
+            Telegram(
+                destination_address=GroupAddress("1/1/3"),
+                direction=TelegramDirection.INCOMING,
+                payload=GroupValueResponse(DPTArray((0x0C, 0x1B))),
+            )
+        )
+        assert not sensor.sensor_value.stale
+
+    async def test_save_changed(self, tmp_path):
+        """Test only changed telegrams are saved with the time of the previous snapshot."""
+        path = str(tmp_path / "state.db")
+        xknx = XKNX()
+        light, _ = _devices(xknx)
+        with patch("time.time", return_value=1000):
+            store = StateStore(xknx, path)
+        await light.process(_telegram("1/1/1", DPTBinary(1)))
+        with patch("time.time", return_value=1060):
+            await store.save()
+        with patch("time.time", return_value=1120), patch.object(
+            store, "_write"
+        ) as write_mock:
+            await store.save()
+        write_mock.assert_not_called()
+
+        await light.process(_telegram("1/1/2", DPTBinary(0)))
+        with patch("time.time", return_value=1180):
+            await store.save()
+        with sqlite3.connect(path) as connection:
+            rows = connection.execute(
+                "SELECT group_address, timestamp FROM state ORDER BY group_address"
+            ).fetchall()
+        assert rows == [("1/1/1", 1000), ("1/1/2", 1120)]
+
+    @patch.object(RemoteValue, "read_state", new_callable=AsyncMock)
+    async def test_skip_recent_reads(self, read_state_mock, tmp_path, time_travel):
+        """Test StateUpdater reads only states older than their interval."""
+        path = str(tmp_path / "state.db")
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "CREATE TABLE state (group_address TEXT PRIMARY KEY, apdu BLOB NOT NULL, timestamp REAL NOT NULL)"
+            )
+            connection.executemany(
+                "INSERT INTO state VALUES (?, ?, ?)",
+                [
+                    ("1/1/2", b"\x00\x81", time.time() - 30 * 60),
+                    ("1/1/3", b"\x00\x80\x0c\x1a", time.time() - 90 * 60),
+                ],
+            )
+        xknx = XKNX()
+        light, sensor = _devices(xknx)
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        await StateStore(xknx, path).restore()
+        xknx.state_updater.start()
+        await time_travel(1)
+        # default interval is 60 minutes
+        read_state_mock.assert_called_once_with(wait_for_result=True)
+        read_state_mock.reset_mock()
+        await time_travel(30 * 60)
+        read_state_mock.assert_called_once_with(wait_for_result=True)
+        xknx.state_updater.stop()
+
+    @patch("logging.Logger.warning")
+    async def test_invalid_database(self, logger_warning_mock, tmp_path):
+        """Test an unreadable file doesn't prevent starting."""
+        path = tmp_path / "state.db"
+        path.write_bytes(b"no database")
+        xknx = XKNX()
+        light, _ = _devices(xknx)
+        store = StateStore(xknx, str(path))
+        await store.restore()
+        assert light.state is None
+        assert logger_warning_mock.call_count == 1
@@ -1,9 +1,17 @@
 """Unit test for StateUpdater."""
-from unittest.mock import Mock, patch
+import asyncio
+import math
+from unittest.mock import AsyncMock, Mock, patch
 
 from xknx import XKNX
 from xknx.core import XknxConnectionState
-from xknx.core.state_updater import StateTrackerType, _StateTracker
+from xknx.core.state_updater import (
+    SHORT_OUTAGE_DURATION,
+    StateTrackerType,
+    _BusLoad,
+    _StateTracker,
+)
+from xknx.devices import Climate, Light, Sensor
 from xknx.remote_value import RemoteValue
 from xknx.telegram import GroupAddress
 
@@ -195,3 +203,244 @@ class TestStateUpdater:
         )
 
         assert xknx.state_updater.started
+
+    @patch.object(RemoteValue, "read_state", new_callable=AsyncMock)
+    async def test_resync_after_outage(self, read_state_mock, time_travel):
+        """Test only expired states are read after a short outage."""
+        xknx = XKNX()
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        remote_value_1 = RemoteValue(
+            xknx, sync_state="expire 1", group_address_state=GroupAddress("1/1/1")
+        )
+        remote_value_2 = RemoteValue(
+            xknx, sync_state="expire 5", group_address_state=GroupAddress("1/1/2")
+        )
+        xknx.state_updater.start()
+        for _ in range(10):
+            await time_travel(0.1)
+        assert read_state_mock.call_count == 2
+        read_state_mock.reset_mock()
+
+        # short outage - state of remote_value_1 expired meanwhile
+        await time_travel(30)
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTING
+        )
+        await time_travel(40)
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTED
+        )
+        for _ in range(10):
+            await time_travel(0.1)
+        assert read_state_mock.call_count == 1
+        # remote_value_2 still waits for its deadline
+        tracker_2 = xknx.state_updater._workers[id(remote_value_2)]
+        assert tracker_2.deadline > asyncio.get_running_loop().time() + 3 * 60
+        read_state_mock.reset_mock()
+
+        # long outage - all states are read
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.DISCONNECTED
+        )
+        await time_travel(SHORT_OUTAGE_DURATION + 1)
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTED
+        )
+        for _ in range(10):
+            await time_travel(0.1)
+        assert read_state_mock.call_count == 2
+        assert xknx.state_updater._workers[id(remote_value_1)].deadline is not None
+        xknx.state_updater.stop()
+
+    @patch.object(RemoteValue, "read_state", new_callable=AsyncMock)
+    async def test_expire_tracker(self, read_state_mock, time_travel):
+        """Test expire tracker reads state when no update was received."""
+        xknx = XKNX()
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        remote_value = RemoteValue(
+            xknx, sync_state="expire 1", group_address_state=GroupAddress("1/1/1")
+        )
+        xknx.state_updater.start()
+        # initial read
+        await time_travel(0)
+        read_state_mock.assert_called_once_with(wait_for_result=True)
+        read_state_mock.reset_mock()
+
+        # update resets the expiry time without rescheduling
+        await time_travel(30)
+        for _ in range(5):
+            xknx.state_updater.update_received(remote_value)
+        assert len(xknx.state_updater._scheduler._heap) == 1
+        await time_travel(30)
+        read_state_mock.assert_not_called()
+        await time_travel(30)
+        read_state_mock.assert_called_once_with(wait_for_result=True)
+        read_state_mock.reset_mock()
+        # no response - read again after interval
+        await time_travel(60)
+        read_state_mock.assert_called_once_with(wait_for_result=True)
+        read_state_mock.reset_mock()
+
+        xknx.state_updater.stop()
+        await time_travel(120)
+        read_state_mock.assert_not_called()
+        assert not xknx.state_updater._scheduler._heap
+
+    @patch.object(RemoteValue, "read_state", new_callable=AsyncMock)
+    async def test_init_and_periodic_tracker(self, read_state_mock, time_travel):
+        """Test init tracker reads only once, periodic tracker ignores updates."""
+        xknx = XKNX()
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        RemoteValue(xknx, sync_state="init", group_address_state=GroupAddress("1/1/1"))
+        remote_value_every = RemoteValue(
+            xknx, sync_state="every 1", group_address_state=GroupAddress("1/1/2")
+        )
+        xknx.state_updater.start()
+        await time_travel(1)
+        assert read_state_mock.call_count == 2
+        read_state_mock.reset_mock()
+
+        await time_travel(29)
+        xknx.state_updater.update_received(remote_value_every)
+        await time_travel(31)
+        read_state_mock.assert_called_once_with(wait_for_result=True)
+        await time_travel(60)
+        assert read_state_mock.call_count == 2
+        xknx.state_updater.stop()
+
+    async def test_parallel_reads(self, time_travel):
+        """Test reads waiting for a response are limited to parallel_reads."""
+        xknx = XKNX()
+        xknx.state_updater._scheduler.parallel_reads = 2
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        reading = 0
+        max_reading = 0
+        release = asyncio.Event()
+
+        async def read_state(wait_for_result):
+            nonlocal reading, max_reading
+            reading += 1
+            max_reading = max(max_reading, reading)
+            await release.wait()
+            reading -= 1
+
+        with patch.object(RemoteValue, "read_state", side_effect=read_state):
+            for index in range(5):
+                RemoteValue(
+                    xknx,
+                    sync_state=True,
+                    group_address_state=GroupAddress(f"1/1/{index}"),
+                )
+            xknx.state_updater.start()
+            await time_travel(2)
+            assert reading == 2
+            release.set()
+            await time_travel(2)
+            assert reading == 0
+            assert max_reading == 2
+        xknx.state_updater.stop()
+
+    async def test_restart_while_reading(self, time_travel):
+        """Test a cancelled read loop doesn't clear the task of a restarted loop."""
+        xknx = XKNX()
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        scheduler = xknx.state_updater._scheduler
+        pacing = asyncio.Event()
+
+        async def pace():
+            await pacing.wait()
+
+        with patch.object(RemoteValue, "read_state", AsyncMock()), patch.object(
+            scheduler, "_pace", side_effect=pace
+        ):
+            RemoteValue(
+                xknx, sync_state=True, group_address_state=GroupAddress("1/1/1")
+            )
+            xknx.state_updater.start()
+            await time_travel(0)
+            first_task = scheduler._read_task
+            assert first_task is not None
+            xknx.state_updater.stop()
+            xknx.state_updater.start()
+            second_task = scheduler._read_task
+            assert second_task not in (None, first_task)
+            await time_travel(0)
+            assert first_task.cancelled()
+            assert scheduler._read_task is second_task
+        xknx.state_updater.stop()
+
+    async def test_sync_priority(self, time_travel):
+        """Test initial reads are ordered by device class priority."""
+        xknx = XKNX()
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        read_order = []
+
+        async def read_state(remote_value, wait_for_result):
+            read_order.append(remote_value.group_address_state)
+
+        sensor = Sensor(
+            xknx, "sensor", group_address_state="1/1/1", value_type="temperature"
+        )
+        climate = Climate(xknx, "climate", group_address_temperature="1/1/2")
+        light = Light(xknx, "light", group_address_switch_state="1/1/3")
+        with patch.object(RemoteValue, "read_state", read_state):
+            xknx.state_updater.start()
+            for _ in range(10):
+                await time_travel(0.1)
+        assert read_order == [
+            light.switch.group_address_state,
+            climate.temperature.group_address_state,
+            sensor.sensor_value.group_address_state,
+        ]
+        xknx.state_updater.stop()
+
+    def test_update_interval_jitter(self):
+        """Test expiry times are spread below the update interval."""
+        scheduler = Mock()
+        tracker = _StateTracker(
+            scheduler=scheduler,
+            read_state_awaitable=AsyncMock(),
+            tracker_type=StateTrackerType.PERIODICALLY,
+            interval_min=1,
+        )
+        tracker.active = True
+        loop = Mock()
+        loop.time.return_value = 100
+        with patch("asyncio.get_running_loop", return_value=loop):
+            for _ in range(50):
+                tracker.reset()
+                assert 154 <= tracker.deadline <= 160
+
+    def test_bus_load_time_until(self):
+        """Test the time until the measured bus load decays to a rate."""
+        bus_load = _BusLoad(Mock(bus_telegram_count=0))
+        bus_load._rate = 40
+        assert bus_load.time_until(40) == 0
+        assert bus_load.time_until(20) == _BusLoad.TIME_CONSTANT * math.log(2)
+        assert bus_load.time_until(0) == math.inf
+
+    async def test_pace_by_bus_load(self, time_travel):
+        """Test reads are paused while the bus is busy."""
+        xknx = XKNX()
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        read_state_mock = AsyncMock()
+        with patch.object(RemoteValue, "read_state", read_state_mock):
+            for index in range(5):
+                RemoteValue(
+                    xknx,
+                    sync_state=True,
+                    group_address_state=GroupAddress(f"1/1/{index}"),
+                )
+            xknx.state_updater.start()
+            await time_travel(0)
+            assert read_state_mock.call_count == 1
+            # 1000 telegrams per second
+            xknx.telegram_queue.bus_telegram_count += 100
+            for _ in range(10):
+                await time_travel(0.1)
+            assert read_state_mock.call_count == 1
+            # bus is idle again
+            for _ in range(100):
+                await time_travel(0.1)
+            assert read_state_mock.call_count == 5
+        xknx.state_updater.stop()
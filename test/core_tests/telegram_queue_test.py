@@ -5,11 +5,17 @@ from unittest.mock import AsyncMock, MagicMock, call, patch
 import pytest
 
 from xknx import XKNX
+from xknx.core import XknxConnectionState
+from xknx.core.telegram_queue import _OutgoingLanes
 from xknx.dpt import DPTBinary
 from xknx.exceptions import CommunicationError, CouldNotParseTelegram
-from xknx.telegram import AddressFilter, Telegram, TelegramDirection
-from xknx.telegram.address import GroupAddress, InternalGroupAddress
-from xknx.telegram.apci import GroupValueWrite
+from xknx.telegram import AddressFilter, Telegram, TelegramDirection, TelegramPriority
+from xknx.telegram.address import (
+    GroupAddress,
+    InternalGroupAddress,
+    parse_device_group_address,
+)
+from xknx.telegram.apci import GroupValueRead, GroupValueResponse, GroupValueWrite
 
 
 class TestTelegramQueue:
@@ -46,6 +52,113 @@ class TestTelegramQueue:
         await xknx.telegram_queue.stop()
         assert xknx.telegram_queue._consumer_task.done()
 
+    async def test_incoming_workers(self):
+        """Test incoming telegrams are processed concurrently per destination address."""
+        xknx = XKNX(incoming_workers=2)
+        blocked_address = GroupAddress(1)  # second worker
+        other_address = GroupAddress(2)  # first worker
+        unblock = asyncio.Event()
+        processed = []
+
+        async def telegram_received(telegram):
+            if telegram.payload.value == DPTBinary(0):
+                await unblock.wait()
+            if telegram.destination_address == other_address:
+                unblock.set()
+            processed.append(telegram)
+
+        xknx.telegram_queue.register_telegram_received_cb(telegram_received)
+
+        def _incoming(address, value):
+            return Telegram(
+                destination_address=address,
+                direction=TelegramDirection.INCOMING,
+                payload=GroupValueWrite(DPTBinary(value)),
+            )
+
+        await xknx.telegram_queue.start()
+        xknx.telegrams.put_nowait(_incoming(blocked_address, 0))
+        xknx.telegrams.put_nowait(_incoming(blocked_address, 1))
+        await asyncio.sleep(0)
+        assert xknx.telegram_queue.incoming_queue_depths == [0, 1]
+
+        xknx.telegrams.put_nowait(_incoming(other_address, 1))
+        await xknx.telegrams.join()
+        assert processed == [
+            _incoming(other_address, 1),
+            _incoming(blocked_address, 0),
+            _incoming(blocked_address, 1),
+        ]
+        assert xknx.telegram_queue.incoming_queue_depths == [0, 0]
+
+        await xknx.telegram_queue.stop()
+        assert xknx.telegram_queue._consumer_task.done()
+
+    async def test_full_queue_response(self):
+        """Test answering a GroupValueRead doesn't block if the queue is full."""
+        xknx = XKNX(rate_limit=0, telegram_queue_size=1)
+        xknx.knxip_interface = AsyncMock()
+        response = Telegram(
+            destination_address=GroupAddress("1/2/3"),
+            payload=GroupValueResponse(DPTBinary(1)),
+        )
+
+        async def answer_read(telegram):
+            await asyncio.sleep(0)
+            await xknx.telegrams.put(response)
+
+        xknx.telegram_queue.register_telegram_received_cb(
+            answer_read, group_addresses=[GroupAddress("1/2/3")]
+        )
+        await xknx.telegram_queue.start()
+        read = Telegram(
+            destination_address=GroupAddress("1/2/3"),
+            direction=TelegramDirection.INCOMING,
+            payload=GroupValueRead(),
+        )
+        xknx.telegrams.put_nowait(read)
+        await asyncio.sleep(0)
+        # queue is full while the consumer answers the first read
+        xknx.telegrams.put_nowait(read)
+        assert xknx.telegrams.incoming_full()
+        await asyncio.wait_for(xknx.telegrams.join(), timeout=1)
+        assert xknx.telegrams.dropped_telegrams == 0
+        assert xknx.knxip_interface.send_telegram.call_count == 2
+        await xknx.telegram_queue.stop()
+
+    async def test_incoming_workers_bounded(self):
+        """Test telegrams processed by workers count against the queue size."""
+        xknx = XKNX(incoming_workers=4, telegram_queue_size=10)
+        unblock = asyncio.Event()
+        processed = []
+
+        async def telegram_received(telegram):
+            await unblock.wait()
+            processed.append(telegram)
+
+        xknx.telegram_queue.register_telegram_received_cb(telegram_received)
+        await xknx.telegram_queue.start()
+        for index in range(1000):
+            xknx.telegrams.put_nowait(
+                Telegram(
+                    destination_address=GroupAddress(index),
+                    direction=TelegramDirection.INCOMING,
+                    payload=GroupValueWrite(DPTBinary(1)),
+                )
+            )
+            await asyncio.sleep(0)
+        assert (
+            sum(xknx.telegram_queue.incoming_queue_depths) + xknx.telegrams.qsize()
+            <= 10
+        )
+        assert xknx.telegrams.dropped_telegrams >= 990
+
+        unblock.set()
+        await xknx.telegrams.join()
+        assert len(processed) + xknx.telegrams.dropped_telegrams == 1000
+        assert not xknx.telegrams.incoming_full()
+        await xknx.telegram_queue.stop()
+
     @patch("asyncio.sleep", new_callable=AsyncMock)
     async def test_rate_limit(self, async_sleep_mock):
         """Test rate limit."""
@@ -75,12 +188,12 @@ class TestTelegramQueue:
         await xknx.telegrams.join()
         assert async_sleep_mock.call_count == 0
 
-        # sleep for outgoing telegrams
+        # sleep for outgoing telegrams - first one is sent immediately
         xknx.telegrams.put_nowait(telegram_out)
         xknx.telegrams.put_nowait(telegram_out)
         await xknx.telegrams.join()
-        assert async_sleep_mock.call_count == 2
-        async_sleep_mock.assert_called_with(sleep_time)
+        assert async_sleep_mock.call_count == 1
+        assert async_sleep_mock.call_args[0][0] == pytest.approx(sleep_time, abs=0.01)
 
         async_sleep_mock.reset_mock()
         # no sleep for internal group address telegrams
@@ -91,6 +204,171 @@ class TestTelegramQueue:
 
         await xknx.telegram_queue.stop()
 
+    @patch("xknx.core.TelegramQueue.process_telegram_outgoing")
+    async def test_coalesce_group_writes(self, process_telegram_outgoing_mock):
+        """Test pending GroupValueWrites are replaced by newer ones."""
+        xknx = XKNX(coalesce_group_writes=True)
+        xknx.rate_limit = False
+
+        def _write(group_address, value):
+            return Telegram(
+                destination_address=GroupAddress(group_address),
+                direction=TelegramDirection.OUTGOING,
+                payload=GroupValueWrite(DPTBinary(value)),
+            )
+
+        read = Telegram(
+            destination_address=GroupAddress("1/2/3"),
+            direction=TelegramDirection.OUTGOING,
+            payload=GroupValueRead(),
+        )
+        xknx.telegrams.put_nowait(_write("1/2/3", 1))
+        xknx.telegrams.put_nowait(_write("1/2/4", 1))
+        xknx.telegrams.put_nowait(read)
+        xknx.telegrams.put_nowait(_write("1/2/3", 2))
+        xknx.telegrams.put_nowait(_write("1/2/3", 3))
+
+        await xknx.telegram_queue.start()
+        await xknx.telegrams.join()
+        assert process_telegram_outgoing_mock.call_args_list == [
+            call(_write("1/2/3", 3)),
+            call(_write("1/2/4", 1)),
+            call(read),
+        ]
+        assert not xknx.telegram_queue._pending_group_writes
+
+        # a write queued after the pending one was sent is not coalesced
+        process_telegram_outgoing_mock.reset_mock()
+        xknx.telegrams.put_nowait(_write("1/2/3", 1))
+        await xknx.telegrams.join()
+        process_telegram_outgoing_mock.assert_called_once_with(_write("1/2/3", 1))
+
+        await xknx.telegram_queue.stop()
+
+    @patch("logging.Logger.warning")
+    async def test_reconnect_buffer(self, _logger_warning_mock):
+        """Test outgoing telegrams are buffered while the connection is lost."""
+        xknx = XKNX(reconnect_buffer_ttl=30)
+        xknx.rate_limit = False
+        xknx.knxip_interface = AsyncMock()
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        xknx.telegram_queue.rate_limiter.wait = AsyncMock()
+        await xknx.telegram_queue.start()
+
+        def _telegram(group_address, payload):
+            return Telegram(
+                destination_address=parse_device_group_address(group_address),
+                direction=TelegramDirection.OUTGOING,
+                payload=payload,
+            )
+
+        # sending failed while connected - not buffered
+        xknx.knxip_interface.send_telegram.side_effect = CommunicationError("failed")
+        xknx.telegrams.put_nowait(_telegram("1/2/3", GroupValueWrite(DPTBinary(0))))
+        await xknx.telegrams.join()
+        assert not len(xknx.telegram_queue._reconnect_buffer)
+
+        # sending failed because the connection was lost
+        async def connection_lost(telegram):
+            await xknx.connection_manager.connection_state_changed(
+                XknxConnectionState.CONNECTING
+            )
+            raise CommunicationError("lost")
+
+        xknx.knxip_interface.send_telegram.side_effect = connection_lost
+        xknx.telegrams.put_nowait(_telegram("1/2/6", GroupValueWrite(DPTBinary(1))))
+        await xknx.telegrams.join()
+        assert len(xknx.telegram_queue._reconnect_buffer) == 1
+        xknx.knxip_interface.send_telegram.side_effect = None
+        xknx.knxip_interface.send_telegram.reset_mock()
+
+        expired = _telegram("1/2/5", GroupValueWrite(DPTBinary(1)))
+        expired.monotonic_time -= xknx.reconnect_buffer_ttl + 1
+        telegrams = [
+            expired,
+            _telegram("1/2/3", GroupValueWrite(DPTBinary(1))),
+            _telegram("1/2/4", GroupValueWrite(DPTBinary(1))),
+            _telegram("1/2/3", GroupValueRead()),
+            _telegram("1/2/3", GroupValueWrite(DPTBinary(2))),
+            # internal group addresses are processed
+            _telegram("i-internal", GroupValueWrite(DPTBinary(1))),
+        ]
+        for telegram in telegrams:
+            xknx.telegrams.put_nowait(telegram)
+        await xknx.telegrams.join()
+        xknx.knxip_interface.send_telegram.assert_not_called()
+
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTED
+        )
+        await xknx.telegrams.join()
+        # newest telegram per address and service in order of their last update
+        # GroupValueRead was queued in the background lane after the writes
+        replayed = [
+            call(_telegram("1/2/6", GroupValueWrite(DPTBinary(1)))),
+            call(_telegram("1/2/4", GroupValueWrite(DPTBinary(1)))),
+            call(_telegram("1/2/3", GroupValueWrite(DPTBinary(2)))),
+            call(_telegram("1/2/3", GroupValueRead())),
+        ]
+        assert xknx.knxip_interface.send_telegram.call_args_list == replayed
+        # replayed telegrams are rate limited
+        assert xknx.telegram_queue.rate_limiter.wait.call_args_list[-4:] == replayed
+        assert not len(xknx.telegram_queue._reconnect_buffer)
+        await xknx.telegram_queue.stop()
+
+    async def test_reconnect_buffer_disabled(self):
+        """Test outgoing telegrams are not buffered by default."""
+        xknx = XKNX()
+        xknx.rate_limit = False
+        xknx.knxip_interface = AsyncMock()
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        await xknx.telegram_queue.start()
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTING
+        )
+        telegram = Telegram(
+            destination_address=GroupAddress("1/2/3"),
+            direction=TelegramDirection.OUTGOING,
+            payload=GroupValueWrite(DPTBinary(1)),
+        )
+        xknx.telegrams.put_nowait(telegram)
+        await xknx.telegrams.join()
+        xknx.knxip_interface.send_telegram.assert_called_once_with(telegram)
+        await xknx.telegram_queue.stop()
+
+    async def test_outgoing_lanes(self):
+        """Test outgoing telegrams are taken from priority lanes."""
+        outgoing_lanes = _OutgoingLanes()
+        writes = [
+            Telegram(GroupAddress(i), payload=GroupValueWrite(DPTBinary(1)))
+            for i in range(6)
+        ]
+        reads = [Telegram(GroupAddress(i), payload=GroupValueRead()) for i in range(2)]
+        response = Telegram(GroupAddress(1), payload=GroupValueResponse(DPTBinary(1)))
+        urgent_read = Telegram(
+            GroupAddress(2), payload=GroupValueRead(), priority=TelegramPriority.URGENT
+        )
+        for telegram in (reads[0], response, *writes, reads[1]):
+            outgoing_lanes.put_nowait(telegram)
+        outgoing_lanes.put_nowait(None)
+        assert outgoing_lanes.qsize() == 10
+        # higher lanes first - waiting lanes are served after 4 skips
+        assert [outgoing_lanes.get_nowait() for _ in range(9)] == [
+            *writes[:4],
+            response,
+            reads[0],
+            *writes[4:],
+            reads[1],
+        ]
+        # priority above LOW uses the first lane
+        outgoing_lanes.put_nowait(reads[0])
+        outgoing_lanes.put_nowait(urgent_read)
+        assert outgoing_lanes.get_nowait() is urgent_read
+        assert outgoing_lanes.get_nowait() is reads[0]
+        # stop signal is returned when all lanes are empty
+        assert outgoing_lanes.get_nowait() is None
+        assert outgoing_lanes.empty()
+
     #
     # TEST REGISTER
     #
@@ -384,6 +662,105 @@ class TestTelegramQueue:
         async_telegram_received_cb_one.assert_not_called()
         async_telegram_received_cb_two.assert_called_once_with(telegram)
 
+    async def test_callback_modify_address_filters(self):
+        """Test telegram_received_callback with changed address filters."""
+        xknx = XKNX()
+        async_telegram_received_cb = AsyncMock()
+
+        callback = xknx.telegram_queue.register_telegram_received_cb(
+            async_telegram_received_cb,
+            address_filters=[],
+            group_addresses=[GroupAddress("1/2/3")],
+        )
+        telegram = Telegram(
+            destination_address=GroupAddress("2/4/6"),
+            direction=TelegramDirection.INCOMING,
+            payload=GroupValueWrite(DPTBinary(1)),
+        )
+        await xknx.telegram_queue.process_telegram_incoming(telegram)
+        async_telegram_received_cb.assert_not_called()
+
+        callback.address_filters.append(AddressFilter("2/4-8/*"))
+        await xknx.telegram_queue.process_telegram_incoming(telegram)
+        async_telegram_received_cb.assert_called_once_with(telegram)
+
+        async_telegram_received_cb.reset_mock()
+        callback.address_filters = [AddressFilter("i-*")]
+        await xknx.telegram_queue.process_telegram_incoming(telegram)
+        async_telegram_received_cb.assert_not_called()
+
+        xknx.telegram_queue.unregister_telegram_received_cb(callback)
+        assert not xknx.telegram_queue._unindexed_cbs
+        assert not xknx.telegram_queue._indexed_cbs
+        assert not xknx.telegram_queue._address_cbs
+
+    async def test_callback_indexed_group_addresses(self):
+        """Test callbacks with group addresses are looked up by address."""
+        xknx = XKNX()
+        async_telegram_received_cb_one = AsyncMock()
+        async_telegram_received_cb_two = AsyncMock()
+
+        callback_one = xknx.telegram_queue.register_telegram_received_cb(
+            async_telegram_received_cb_one,
+            group_addresses=[GroupAddress("1/2/3"), InternalGroupAddress("i-test")],
+        )
+        callback_two = xknx.telegram_queue.register_telegram_received_cb(
+            async_telegram_received_cb_two,
+            group_addresses=[GroupAddress("1/2/3")],
+        )
+        assert xknx.telegram_queue._indexed_cbs == {
+            GroupAddress("1/2/3"): [callback_one, callback_two],
+            InternalGroupAddress("i-test"): [callback_one],
+        }
+
+        telegram = Telegram(
+            destination_address=InternalGroupAddress("i-test"),
+            direction=TelegramDirection.INCOMING,
+            payload=GroupValueWrite(DPTBinary(1)),
+        )
+        await xknx.telegram_queue.process_telegram_incoming(telegram)
+        async_telegram_received_cb_one.assert_called_once_with(telegram)
+        async_telegram_received_cb_two.assert_not_called()
+
+        xknx.telegram_queue.unregister_telegram_received_cb(callback_one)
+        assert xknx.telegram_queue._indexed_cbs == {
+            GroupAddress("1/2/3"): [callback_two],
+        }
+
+    async def test_callback_order(self):
+        """Test callbacks are run in order of registration."""
+        xknx = XKNX()
+        order = []
+
+        def callback_appending(name):
+            async def callback(telegram):
+                order.append(name)
+
+            return callback
+
+        xknx.telegram_queue.register_telegram_received_cb(
+            callback_appending("indexed_one"),
+            group_addresses=[GroupAddress("1/2/3")],
+        )
+        xknx.telegram_queue.register_telegram_received_cb(
+            callback_appending("match_all")
+        )
+        xknx.telegram_queue.register_telegram_received_cb(
+            callback_appending("indexed_two"),
+            group_addresses=[GroupAddress("1/2/3")],
+        )
+        xknx.telegram_queue.register_telegram_received_cb(
+            callback_appending("filter"),
+            address_filters=[AddressFilter("1/2/*")],
+        )
+        telegram = Telegram(
+            destination_address=GroupAddress("1/2/3"),
+            direction=TelegramDirection.INCOMING,
+            payload=GroupValueWrite(DPTBinary(1)),
+        )
+        await xknx.telegram_queue.process_telegram_incoming(telegram)
+        assert order == ["indexed_one", "match_all", "indexed_two", "filter"]
+
     #
     # TEST EXCEPTION HANDLING
     #
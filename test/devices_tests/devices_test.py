@@ -63,6 +63,26 @@ class TestDevices:
             sensor2,
         )
 
+    def test_device_by_group_address_index_update(self):
+        """Test group address index is updated when devices or addresses change."""
+        xknx = XKNX()
+        switch1 = Switch(xknx, "Switch1", group_address="1/2/3")
+        switch2 = Switch(xknx, "Switch2", group_address="1/2/3")
+
+        assert tuple(xknx.devices.devices_by_group_address(GroupAddress("1/2/3"))) == (
+            switch1,
+            switch2,
+        )
+        switch2.switch.group_address = GroupAddress("1/2/4")
+        assert tuple(xknx.devices.devices_by_group_address(GroupAddress("1/2/3"))) == (
+            switch1,
+        )
+        assert tuple(xknx.devices.devices_by_group_address(GroupAddress("1/2/4"))) == (
+            switch2,
+        )
+        switch1.shutdown()
+        assert tuple(xknx.devices.devices_by_group_address(GroupAddress("1/2/3"))) == ()
+
     def test_iter(self):
         """Test __iter__() function."""
         xknx = XKNX()
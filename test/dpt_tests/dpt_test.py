@@ -125,6 +125,25 @@ class TestDPTBase:
                 dpt_tuples.append((dpt.dpt_main_number, dpt.dpt_sub_number))
         assert len(dpt_tuples) == len(set(dpt_tuples))
 
+    def test_transcoder_lookup_new_subclass(self):
+        """Test subclasses defined after a lookup are found."""
+        assert DPTBase.parse_transcoder("test_lookup") is None
+        assert DPTNumeric.transcoder_by_dpt(9, 900) is None
+
+        class DPTTestLookup(DPT2ByteFloat):
+            """Test DPT defined by user code."""
+
+            dpt_main_number = 9
+            dpt_sub_number = 900
+            value_type = "test_lookup"
+
+        assert DPTBase.parse_transcoder("test_lookup") is DPTTestLookup
+        assert DPTNumeric.transcoder_by_dpt(9, 900) is DPTTestLookup
+        assert DPTBase.parse_transcoder("9.900") is DPTTestLookup
+        # lookups are limited to subclasses of the called class
+        assert DPT2ByteFloat.parse_transcoder("temperature") is DPTTemperature
+        assert DPT2ByteFloat.parse_transcoder("string") is None
+
     def test_dpt_alternative_notations(self):
         """Test the parser for accepting alternateive notations for the same DPT class."""
         dpt1 = DPTBase.parse_transcoder("2byte_unsigned")
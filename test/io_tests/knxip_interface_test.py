@@ -1,11 +1,14 @@
 """Unit test for KNX/IP Interface."""
+import asyncio
 import threading
 from unittest.mock import DEFAULT, Mock, patch
 
 from xknx import XKNX
 from xknx.io import ConnectionConfig, ConnectionType, knx_interface_factory
+from xknx.io.multi_gateway import MultiGateway
 from xknx.io.routing import Routing
 from xknx.io.tunnel import TCPTunnel, UDPTunnel
+from xknx.io.tunnel_pool import TunnelPool
 
 
 class TestKNXIPInterface:
@@ -64,6 +67,44 @@ class TestKNXIPInterface:
             )
             connect_udp.assert_called_once_with()
 
+    async def test_start_udp_tunnel_pool(self):
+        """Test starting multiple UDP tunnels."""
+        connection_config = ConnectionConfig(
+            ConnectionType.TUNNELING,
+            gateway_ip="127.0.0.2",
+            local_port=3700,
+            tunnel_pool_size=3,
+        )
+        with patch("xknx.io.TunnelPool.connect") as connect_pool:
+            interface = knx_interface_factory(self.xknx, connection_config)
+            await interface.start()
+            assert isinstance(interface._interface, TunnelPool)
+            assert [tunnel.local_port for tunnel in interface._interface.tunnels] == [
+                3700,
+                3701,
+                3702,
+            ]
+            assert all(
+                isinstance(tunnel, UDPTunnel) for tunnel in interface._interface.tunnels
+            )
+            connect_pool.assert_called_once_with()
+
+    async def test_start_multi_gateway(self):
+        """Test starting connections to multiple gateways."""
+        gateway_configs = [
+            ConnectionConfig(ConnectionType.TUNNELING, gateway_ip="127.0.0.2"),
+            ConnectionConfig(ConnectionType.ROUTING, local_ip="127.0.0.1"),
+        ]
+        connection_config = ConnectionConfig(gateways=gateway_configs)
+        with patch("xknx.io.MultiGateway.connect") as connect_multi_gateway:
+            interface = knx_interface_factory(self.xknx, connection_config)
+            await interface.start()
+            assert isinstance(interface._interface, MultiGateway)
+            assert [
+                gateway.connection_config for gateway in interface._interface.gateways
+            ] == gateway_configs
+            connect_multi_gateway.assert_called_once_with()
+
     async def test_start_tcp_tunnel_connection(self):
         """Test starting TCP tunnel connection."""
         # without gateway_ip automatic is called
@@ -118,6 +159,26 @@ class TestKNXIPInterface:
             )
             connect_routing.assert_called_once_with()
 
+    async def test_start_routing_batch_receive(self):
+        """Test starting routing connection receiving datagrams in batches."""
+        connection_config = ConnectionConfig(
+            ConnectionType.ROUTING, local_ip="127.0.0.1", batch_receive=True
+        )
+        with patch("xknx.io.routing.Routing.connect"):
+            interface = knx_interface_factory(self.xknx, connection_config)
+            await interface.start()
+            assert interface._interface.udp_transport.batch_receive
+            assert (  # pylint: disable=comparison-with-callable
+                interface._interface.telegrams_received_callback
+                == interface.telegrams_received
+            )
+
+        telegrams = [Mock(), Mock()]
+        interface.telegrams_received(telegrams)
+        assert self.xknx.telegrams.qsize() == 2
+        assert self.xknx.telegrams.get_nowait() is telegrams[0]
+        assert self.xknx.telegrams.get_nowait() is telegrams[1]
+
     async def test_threaded_connection(self):
         """Test starting threaded connection."""
         # pylint: disable=attribute-defined-outside-init
@@ -136,6 +197,28 @@ class TestKNXIPInterface:
             await interface.start()
             start_automatic_mock.assert_called_once_with()
 
+    async def test_threaded_telegrams_received(self):
+        """Test receiving a batch of telegrams in the connection thread."""
+        connection_config = ConnectionConfig(
+            ConnectionType.ROUTING, local_ip="127.0.0.1", threaded=True
+        )
+        interface = knx_interface_factory(self.xknx, connection_config)
+        telegrams = [Mock(), Mock()]
+        with patch.object(
+            interface._main_loop,
+            "call_soon_threadsafe",
+            wraps=interface._main_loop.call_soon_threadsafe,
+        ) as call_soon_mock:
+            interface._thread_loop.call_soon_threadsafe(
+                interface.telegrams_received, telegrams
+            )
+            while self.xknx.telegrams.qsize() < 2:
+                await asyncio.sleep(0.001)
+        # both telegrams are put into the queue from a single callback
+        call_soon_mock.assert_called_once()
+        assert self.xknx.telegrams.get_nowait() is telegrams[0]
+        assert self.xknx.telegrams.get_nowait() is telegrams[1]
+
     async def test_threaded_send_telegram(self):
         """Test sending telegram with threaded connection."""
         # pylint: disable=attribute-defined-outside-init
@@ -0,0 +1,210 @@
+"""Unit test for KNX/IP MultiGateway."""
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from xknx import XKNX
+from xknx.core import XknxConnectionState
+from xknx.dpt import DPTBinary
+from xknx.exceptions import CommunicationError
+from xknx.io import ConnectionConfig, MultiGateway
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram
+from xknx.telegram.apci import GroupValueWrite
+
+
+def _gateway(connection_config=None, connect_error=None):
+    """Return a mocked KNXIPInterface."""
+    gateway = Mock()
+    gateway.connection_config = connection_config or ConnectionConfig()
+
+    async def start():
+        if connect_error is not None:
+            await gateway.connection_state_changed_cb(XknxConnectionState.DISCONNECTED)
+            raise connect_error
+        await gateway.connection_state_changed_cb(XknxConnectionState.CONNECTED)
+
+    gateway.start = AsyncMock(side_effect=start)
+    gateway.send_telegram = AsyncMock()
+    gateway.stop = AsyncMock()
+    return gateway
+
+
+def _telegram(destination, source="1.1.5"):
+    """Return a GroupValueWrite telegram."""
+    return Telegram(
+        destination_address=destination,
+        source_address=IndividualAddress(source),
+        payload=GroupValueWrite(DPTBinary(1)),
+    )
+
+
+class TestMultiGateway:
+    """Test class for xknx/io/MultiGateway objects."""
+
+    def setup_method(self):
+        """Set up test class."""
+        # pylint: disable=attribute-defined-outside-init
+        self.xknx = XKNX()
+        self.telegram_received_mock = Mock()
+        self.gateways = [
+            _gateway(ConnectionConfig(group_addresses=["1/0/1"])),
+            _gateway(),
+        ]
+        self.multi_gateway = MultiGateway(
+            self.xknx,
+            self.gateways,
+            telegram_received_callback=self.telegram_received_mock,
+        )
+
+    def _sent_to(self, telegram):
+        """Return indices of gateways telegram was sent to."""
+        return [
+            index
+            for index, gateway in enumerate(self.gateways)
+            if any(
+                call.args == (telegram,) for call in gateway.send_telegram.mock_calls
+            )
+        ]
+
+    async def test_send_by_group_address(self, time_travel):
+        """Test telegrams are sent to configured, learned or all gateways."""
+        await self.multi_gateway.connect()
+        assert self.xknx.connection_manager.state is XknxConnectionState.CONNECTED
+        # only the first gateway sets xknx.current_address
+        assert [gateway.primary for gateway in self.gateways] == [True, False]
+
+        # unknown group address
+        unknown = _telegram(GroupAddress("2/0/1"))
+        await self.multi_gateway.send_telegram(unknown)
+        # configured group address
+        configured = _telegram(GroupAddress("1/0/1"))
+        await self.multi_gateway.send_telegram(configured)
+        # learned group address and line
+        self.gateways[1].telegram_received_callback(
+            _telegram(GroupAddress("3/0/1"), source="1.2.3")
+        )
+        learned = _telegram(GroupAddress("3/0/1"))
+        await self.multi_gateway.send_telegram(learned)
+        individual = _telegram(IndividualAddress("1.2.10"))
+        await self.multi_gateway.send_telegram(individual)
+        await time_travel(0)
+
+        assert self._sent_to(unknown) == [0, 1]
+        assert self._sent_to(configured) == [0]
+        assert self._sent_to(learned) == [1]
+        assert self._sent_to(individual) == [1]
+        assert self.multi_gateway.learned_lines == {(1, 2): 1}
+
+        await self.multi_gateway.disconnect()
+        assert self.xknx.connection_manager.state is XknxConnectionState.DISCONNECTED
+        for gateway in self.gateways:
+            gateway.stop.assert_awaited_once()
+
+    async def test_gateway_disconnected(self, time_travel):
+        """Test telegrams are only sent to connected gateways."""
+        await self.multi_gateway.connect()
+        await self.gateways[0].connection_state_changed_cb(
+            XknxConnectionState.DISCONNECTED
+        )
+        assert self.xknx.connection_manager.state is XknxConnectionState.CONNECTED
+
+        unknown = _telegram(GroupAddress("2/0/1"))
+        await self.multi_gateway.send_telegram(unknown)
+        await time_travel(0)
+        assert self._sent_to(unknown) == [1]
+        with pytest.raises(CommunicationError):
+            await self.multi_gateway.send_telegram(_telegram(GroupAddress("1/0/1")))
+        await self.multi_gateway.disconnect()
+
+    async def test_rate_limit(self, time_travel):
+        """Test rate limit of a gateway doesn't delay other gateways."""
+        self.gateways[0].connection_config.rate_limit = 2
+        await self.multi_gateway.connect()
+        telegrams = [_telegram(GroupAddress(f"2/0/{sub}")) for sub in range(3)]
+        tasks = [
+            asyncio.create_task(self.multi_gateway.send_telegram(telegram))
+            for telegram in telegrams
+        ]
+        await time_travel(0)
+        assert self.gateways[0].send_telegram.call_count == 1
+        assert self.gateways[1].send_telegram.call_count == 3
+        # telegrams sent only to other gateways are not delayed
+        self.gateways[1].telegram_received_callback(
+            _telegram(GroupAddress("3/0/1"), source="1.2.3")
+        )
+        await self.multi_gateway.send_telegram(_telegram(GroupAddress("3/0/1")))
+        await time_travel(0.5)
+        assert self.gateways[0].send_telegram.call_count == 2
+        await time_travel(0.5)
+        assert self.gateways[0].send_telegram.call_count == 3
+        assert all(task.done() for task in tasks)
+        await self.multi_gateway.disconnect()
+
+    async def test_send_error(self, time_travel):
+        """Test errors of sending are raised to the caller."""
+        await self.multi_gateway.connect()
+        self.gateways[0].send_telegram.side_effect = CommunicationError("failed")
+        # sent to both gateways - one failed
+        with pytest.raises(CommunicationError):
+            await self.multi_gateway.send_telegram(_telegram(GroupAddress("2/0/1")))
+        assert self.gateways[1].send_telegram.call_count == 1
+        await self.multi_gateway.disconnect()
+
+    async def test_bounded_queue(self, time_travel):
+        """Test sending waits for room in the queue of a gateway."""
+        await self.multi_gateway.connect()
+        unblock = asyncio.Event()
+
+        async def send_telegram(telegram):
+            await unblock.wait()
+
+        self.gateways[0].send_telegram.side_effect = send_telegram
+        tasks = [
+            asyncio.create_task(
+                self.multi_gateway.send_telegram(_telegram(GroupAddress("1/0/1")))
+            )
+            for _ in range(5)
+        ]
+        await time_travel(0)
+        # one telegram is sent, the queue is full and the other callers wait for room
+        assert self.multi_gateway._queues[0].full()
+        assert self.gateways[0].send_telegram.call_count == 1
+        unblock.set()
+        await time_travel(0)
+        assert all(task.done() for task in tasks)
+        assert self.gateways[0].send_telegram.call_count == 5
+        await self.multi_gateway.disconnect()
+
+    async def test_connect_failed(self):
+        """Test connecting succeeds if at least one gateway is connected."""
+        gateways = [
+            _gateway(connect_error=CommunicationError("failed")),
+            _gateway(),
+        ]
+        multi_gateway = MultiGateway(self.xknx, gateways)
+        await multi_gateway.connect()
+        assert self.xknx.connection_manager.state is XknxConnectionState.CONNECTED
+        await multi_gateway.disconnect()
+
+        gateways = [_gateway(connect_error=CommunicationError("failed"))]
+        multi_gateway = MultiGateway(self.xknx, gateways)
+        with pytest.raises(CommunicationError):
+            await multi_gateway.connect()
+        assert self.xknx.connection_manager.state is XknxConnectionState.DISCONNECTED
+
+    async def test_telegram_received(self):
+        """Test telegrams received from all gateways are passed on."""
+        telegrams = [
+            _telegram(GroupAddress("1/0/1"), source="1.1.1"),
+            _telegram(GroupAddress("2/0/1"), source="1.2.1"),
+        ]
+        for gateway, telegram in zip(self.gateways, telegrams):
+            gateway.telegram_received_callback(telegram)
+        assert [
+            call.args[0] for call in self.telegram_received_mock.call_args_list
+        ] == telegrams
+        assert self.multi_gateway.learned_group_addresses == {
+            GroupAddress("1/0/1"): {0},
+            GroupAddress("2/0/1"): {1},
+        }
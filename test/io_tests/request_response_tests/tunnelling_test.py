@@ -72,6 +72,7 @@ class TestTunnelling:
         # Response KNX/IP-Frame with error:
         err_knxipframe = KNXIPFrame(xknx)
         err_knxipframe.init(KNXIPServiceType.TUNNELLING_ACK)
+        err_knxipframe.body.sequence_counter = sequence_counter
         err_knxipframe.body.status_code = ErrorCode.E_CONNECTION_ID
         with patch("logging.Logger.debug") as mock_warning:
             tunnelling.response_rec_callback(err_knxipframe, HPAI(), None)
@@ -82,8 +83,16 @@ class TestTunnelling:
                 ErrorCode.E_CONNECTION_ID,
             )
 
+        # Response KNX/IP-Frame for other sequence counter is ignored:
+        other_knxipframe = KNXIPFrame(xknx)
+        other_knxipframe.init(KNXIPServiceType.TUNNELLING_ACK)
+        other_knxipframe.body.sequence_counter = sequence_counter + 1
+        tunnelling.response_rec_callback(other_knxipframe, HPAI(), None)
+        assert not tunnelling.success
+
         # Correct Response KNX/IP-Frame:
         res_knxipframe = KNXIPFrame(xknx)
         res_knxipframe.init(KNXIPServiceType.TUNNELLING_ACK)
+        res_knxipframe.body.sequence_counter = sequence_counter
         tunnelling.response_rec_callback(res_knxipframe, HPAI(), None)
         assert tunnelling.success
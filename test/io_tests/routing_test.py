@@ -0,0 +1,83 @@
+"""Unit test for KNX/IP Routing."""
+from unittest.mock import AsyncMock, Mock, patch
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.io import Routing
+from xknx.knxip import KNXIPFrame, RoutingBusy, RoutingLostMessage
+from xknx.telegram import GroupAddress, Telegram
+from xknx.telegram.apci import GroupValueWrite
+
+
+class TestRouting:
+    """Test class for xknx/io/Routing objects."""
+
+    def setup_method(self):
+        """Set up test class."""
+        # pylint: disable=attribute-defined-outside-init
+        self.xknx = XKNX()
+        self.routing = Routing(
+            self.xknx,
+            telegram_received_callback=Mock(),
+            local_ip="192.168.1.1",
+        )
+
+    def _receive(self, body):
+        """Pass a KNX/IP frame with body to the routing transport."""
+        self.routing.udp_transport.data_received_callback(
+            KNXIPFrame.init_from_body(body).to_knx(), ("192.168.1.2", 3671)
+        )
+
+    @patch("random.random", return_value=1)
+    async def test_routing_busy(self, _random_mock, time_travel):
+        """Test sending is paused after ROUTING_BUSY."""
+        rate_limiter = self.xknx.telegram_queue.rate_limiter
+        with patch.object(rate_limiter, "pause") as pause_mock:
+            self._receive(RoutingBusy(self.xknx, wait_time=100))
+            pause_mock.assert_called_once_with(0.1 + 0.05)
+            pause_mock.reset_mock()
+            # busy frames within 10 ms increment the counter once
+            self._receive(RoutingBusy(self.xknx, wait_time=100))
+            assert self.routing.busy_counter == 1
+            await time_travel(0.01)
+            self._receive(RoutingBusy(self.xknx, wait_time=20))
+            assert self.routing.busy_counter == 2
+            pause_mock.assert_called_with(0.02 + 2 * 0.05)
+            # counter is decremented every 5 ms after 2 * 100 ms without busy frames
+            await time_travel(0.2 + 0.005)
+            self._receive(RoutingBusy(self.xknx, wait_time=20))
+            assert self.routing.busy_counter == 2
+            await time_travel(1)
+            self._receive(RoutingBusy(self.xknx, wait_time=20))
+            assert self.routing.busy_counter == 1
+            pause_mock.reset_mock()
+            # only control field 0 applies to all devices
+            self._receive(RoutingBusy(self.xknx, wait_time=20, control_field=1))
+            pause_mock.assert_not_called()
+
+    @patch("random.random", return_value=1)
+    async def test_routing_busy_no_rate_limit(self, _random_mock, time_travel):
+        """Test ROUTING_BUSY pauses sending if rate_limit is 0."""
+        self.xknx.rate_limit = 0
+        self.xknx.knxip_interface = AsyncMock()
+        await self.xknx.telegram_queue.start()
+        self._receive(RoutingBusy(self.xknx, wait_time=100))
+        await self.xknx.telegrams.put(
+            Telegram(
+                destination_address=GroupAddress("1/2/3"),
+                payload=GroupValueWrite(DPTBinary(1)),
+            )
+        )
+        await time_travel(0.1)
+        self.xknx.knxip_interface.send_telegram.assert_not_called()
+        await time_travel(0.05)
+        self.xknx.knxip_interface.send_telegram.assert_called_once()
+        await self.xknx.telegram_queue.stop()
+
+    @patch("logging.Logger.warning")
+    def test_routing_lost_message(self, logger_warning_mock):
+        """Test lost messages are counted."""
+        self._receive(RoutingLostMessage(self.xknx, lost_messages=3))
+        self._receive(RoutingLostMessage(self.xknx, lost_messages=2))
+        assert self.routing.lost_messages == 5
+        assert logger_warning_mock.call_count == 2
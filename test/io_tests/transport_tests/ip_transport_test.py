@@ -48,3 +48,42 @@ class TestKNXIPTransport:
         callback_mock.assert_called_once_with(
             correct_service_type_frame, HPAI(), transport
         )
+
+    @patch.multiple(KNXIPTransport, __abstractmethods__=set())
+    def test_batch_callback(self):
+        """Test if batches of frames are passed to the correct callbacks."""
+        xknx = Mock()
+        transport = KNXIPTransport()
+        transport.callbacks = []
+        callback_mock = Mock()
+        batch_callback_mock = Mock()
+        single_callback_mock = Mock()
+        transport.register_callback(
+            callback_mock,
+            [KNXIPServiceType.ROUTING_INDICATION],
+            batch_callback=batch_callback_mock,
+        )
+        transport.register_callback(
+            single_callback_mock, [KNXIPServiceType.ROUTING_INDICATION]
+        )
+
+        routing_frame_1 = KNXIPFrame(xknx)
+        routing_frame_1.header.service_type_ident = KNXIPServiceType.ROUTING_INDICATION
+        routing_frame_2 = KNXIPFrame(xknx)
+        routing_frame_2.header.service_type_ident = KNXIPServiceType.ROUTING_INDICATION
+        other_frame = KNXIPFrame(xknx)
+        other_frame.header.service_type_ident = KNXIPServiceType.SEARCH_REQUEST
+
+        transport.handle_knxipframes(
+            [
+                (routing_frame_1, HPAI()),
+                (other_frame, HPAI()),
+                (routing_frame_2, HPAI()),
+            ]
+        )
+        callback_mock.assert_not_called()
+        batch_callback_mock.assert_called_once_with(
+            [(routing_frame_1, HPAI()), (routing_frame_2, HPAI())], transport
+        )
+        assert single_callback_mock.call_count == 2
+        single_callback_mock.assert_called_with(routing_frame_2, HPAI(), transport)
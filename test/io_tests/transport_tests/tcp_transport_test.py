@@ -0,0 +1,68 @@
+"""Unit test for TCP transport."""
+from unittest.mock import Mock
+
+from xknx import XKNX
+from xknx.io.transport import TCPTransport
+from xknx.knxip import KNXIPServiceType
+
+# TunnellingRequest LDataInd GroupValueWrite from 1.1.22 to 5/1/22
+TUNNELLING_REQUEST = bytes.fromhex(
+    "0610 0420 0017 04 02 21 00 2900bcd011162916030080 0c 3f"
+)
+# unsupported service type with valid length
+UNSUPPORTED_FRAME = bytes.fromhex("0610 0999 000a 01020304")
+
+
+class TestTCPTransport:
+    """Test class for TCPTransport."""
+
+    def setup_method(self):
+        """Set up test class."""
+        # pylint: disable=attribute-defined-outside-init
+        self.xknx = XKNX()
+        self.transport = TCPTransport(self.xknx, ("192.168.1.2", 3671))
+        self.callback = Mock()
+        self.transport.register_callback(
+            self.callback, [KNXIPServiceType.TUNNELLING_REQUEST]
+        )
+
+    def test_multiple_frames_in_one_segment(self):
+        """Test parsing many coalesced frames without recursion."""
+        self.transport.data_received_callback(TUNNELLING_REQUEST * 5000)
+        assert self.callback.call_count == 5000
+        assert not self.transport._buffer
+
+    def test_split_frames(self):
+        """Test reassembling frames split over multiple segments."""
+        data = TUNNELLING_REQUEST * 3
+        for index in range(len(data)):
+            self.transport.data_received_callback(data[index : index + 1])
+        assert self.callback.call_count == 3
+        assert not self.transport._buffer
+
+        self.callback.reset_mock()
+        self.transport.data_received_callback(data[:30])
+        assert self.callback.call_count == 1
+        assert self.transport._buffer == data[23:30]
+        self.transport.data_received_callback(data[30:])
+        assert self.callback.call_count == 3
+        assert not self.transport._buffer
+
+    def test_unsupported_frame(self):
+        """Test skipping unsupported frames."""
+        data = TUNNELLING_REQUEST + UNSUPPORTED_FRAME + TUNNELLING_REQUEST
+        self.transport.data_received_callback(data[:27])
+        assert self.callback.call_count == 1
+        self.transport.data_received_callback(data[27:])
+        assert self.callback.call_count == 2
+        assert not self.transport._buffer
+
+    def test_invalid_header(self):
+        """Test discarding data if frame boundary is unknown."""
+        self.transport.data_received_callback(
+            bytes.fromhex("0710 0420 0017") + TUNNELLING_REQUEST
+        )
+        self.callback.assert_not_called()
+        assert not self.transport._buffer
+        self.transport.data_received_callback(TUNNELLING_REQUEST)
+        self.callback.assert_called_once()
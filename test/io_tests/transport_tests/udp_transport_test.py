@@ -0,0 +1,52 @@
+"""Unit test for UDP transport."""
+from unittest.mock import Mock
+
+from xknx import XKNX
+from xknx.io.transport import UDPTransport
+from xknx.knxip import HPAI, KNXIPServiceType
+
+ROUTING_INDICATION = bytes.fromhex("06 10 05 30 00 11 29 00 bc d0 12 02 01 51 01 00 81")
+
+
+class TestUDPTransport:
+    """Test class for UDPTransport."""
+
+    def test_batch_received_callback(self):
+        """Test reading and handling pending datagrams at once."""
+        xknx = XKNX()
+        transport = UDPTransport(
+            xknx,
+            ("127.0.0.1", 0),
+            ("224.0.23.12", 3671),
+            multicast=True,
+            batch_receive=True,
+        )
+        batch_callback = Mock()
+        transport.register_callback(
+            Mock(), [KNXIPServiceType.ROUTING_INDICATION], batch_callback
+        )
+        source = ("192.168.1.2", 3671)
+        pending = [ROUTING_INDICATION, b"invalid", ROUTING_INDICATION]
+
+        def recvfrom_into(buffer):
+            if not pending:
+                raise BlockingIOError
+            data = pending.pop(0)
+            buffer[: len(data)] = data
+            return len(data), source
+
+        transport._sock = Mock()
+        transport._sock.recvfrom_into.side_effect = recvfrom_into
+        transport._receive_buffer = bytearray(UDPTransport.MAX_DATAGRAM_SIZE)
+
+        transport.batch_received_callback(ROUTING_INDICATION, source)
+        batch_callback.assert_called_once()
+        knxipframes, _transport = batch_callback.call_args[0]
+        assert _transport is transport
+        assert len(knxipframes) == 3
+        for knxipframe, hpai in knxipframes:
+            assert knxipframe.header.service_type_ident == (
+                KNXIPServiceType.ROUTING_INDICATION
+            )
+            assert hpai == HPAI(*source)
+        assert transport._sock.recvfrom_into.call_count == 4
@@ -0,0 +1,193 @@
+"""Unit test for KNX/IP TunnelPool."""
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from xknx import XKNX
+from xknx.core import XknxConnectionState
+from xknx.dpt import DPTBinary
+from xknx.exceptions import CommunicationError
+from xknx.io import TunnelPool
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram
+from xknx.telegram.apci import GroupValueWrite
+
+
+def _tunnel(address, connect_error=None):
+    """Return a mocked tunnel with individual address."""
+    tunnel = Mock()
+    tunnel._src_address = IndividualAddress(address)
+
+    async def connect():
+        if connect_error is not None:
+            await tunnel.connection_state_changed_cb(XknxConnectionState.DISCONNECTED)
+            raise connect_error
+        await tunnel.connection_state_changed_cb(XknxConnectionState.CONNECTED)
+        return True
+
+    tunnel.connect = AsyncMock(side_effect=connect)
+    tunnel.send_telegram = AsyncMock()
+    tunnel.disconnect = AsyncMock()
+    return tunnel
+
+
+def _telegram(address, source="1.1.5", value=1):
+    """Return a GroupValueWrite telegram."""
+    return Telegram(
+        destination_address=GroupAddress(address),
+        source_address=IndividualAddress(source),
+        payload=GroupValueWrite(DPTBinary(value)),
+    )
+
+
+class TestTunnelPool:
+    """Test class for xknx/io/TunnelPool objects."""
+
+    def setup_method(self):
+        """Set up test class."""
+        # pylint: disable=attribute-defined-outside-init
+        self.xknx = XKNX()
+        self.telegram_received_mock = Mock()
+        self.tunnels = [_tunnel(f"1.1.{index}") for index in range(1, 4)]
+        self.pool = TunnelPool(
+            self.xknx,
+            self.tunnels,
+            telegram_received_callback=self.telegram_received_mock,
+        )
+
+    def _sent_by(self, telegram):
+        """Return tunnels telegram was sent by."""
+        return [
+            tunnel
+            for tunnel in self.tunnels
+            if any(call.args == (telegram,) for call in tunnel.send_telegram.mock_calls)
+        ]
+
+    async def test_send_by_destination(self, time_travel):
+        """Test telegrams for the same destination are sent over the same tunnel."""
+        await self.pool.connect()
+        assert self.xknx.connection_manager.state is XknxConnectionState.CONNECTED
+
+        telegrams = [_telegram(f"1/2/{address}") for address in range(6)]
+        for telegram in telegrams + telegrams:
+            await self.pool.send_telegram(telegram)
+            await time_travel(0)
+        for telegram in telegrams:
+            sent_by = self._sent_by(telegram)
+            assert len(sent_by) == 1
+            assert sent_by[0].send_telegram.call_count >= 2
+        # every tunnel is used
+        assert all(tunnel.send_telegram.called for tunnel in self.tunnels)
+
+        await self.pool.disconnect()
+        assert self.xknx.connection_manager.state is XknxConnectionState.DISCONNECTED
+        for tunnel in self.tunnels:
+            tunnel.disconnect.assert_awaited_once()
+
+    async def test_failover(self, time_travel):
+        """Test telegrams are sent over other tunnels if a tunnel is disconnected."""
+        await self.pool.connect()
+        telegram = _telegram("1/2/3")
+        await self.pool.send_telegram(telegram)
+        await time_travel(0)
+        (tunnel,) = self._sent_by(telegram)
+        tunnel.send_telegram.reset_mock()
+
+        await tunnel.connection_state_changed_cb(XknxConnectionState.DISCONNECTED)
+        assert self.xknx.connection_manager.state is XknxConnectionState.CONNECTED
+        await self.pool.send_telegram(telegram)
+        await time_travel(0)
+        tunnel.send_telegram.assert_not_called()
+        assert len(self._sent_by(telegram)) == 1
+
+        # sending failed because the tunnel was lost while the telegram was sent
+        (other_tunnel,) = self._sent_by(telegram)
+        other_tunnel.send_telegram.reset_mock()
+
+        async def connection_lost(_telegram):
+            await other_tunnel.connection_state_changed_cb(
+                XknxConnectionState.CONNECTING
+            )
+            raise CommunicationError("Resending the telegram repeatedly failed.")
+
+        other_tunnel.send_telegram.side_effect = connection_lost
+        await self.pool.send_telegram(telegram)
+        await time_travel(0)
+        other_tunnel.send_telegram.assert_called_once_with(telegram)
+        (last_tunnel,) = [
+            tunnel
+            for tunnel in self.tunnels
+            if tunnel is not other_tunnel and tunnel.send_telegram.called
+        ]
+        last_tunnel.send_telegram.assert_called_once_with(telegram)
+
+        await last_tunnel.connection_state_changed_cb(XknxConnectionState.DISCONNECTED)
+        assert self.xknx.connection_manager.state is XknxConnectionState.CONNECTING
+        with pytest.raises(CommunicationError):
+            await self.pool.send_telegram(telegram)
+        await self.pool.disconnect()
+
+    async def test_send_error(self, time_travel):
+        """Test errors of sending are raised to the caller."""
+        await self.pool.connect()
+        for tunnel in self.tunnels:
+            tunnel.send_telegram.side_effect = CommunicationError("failed")
+        with pytest.raises(CommunicationError):
+            await self.pool.send_telegram(_telegram("1/2/3"))
+        # not retried on another tunnel while the tunnel is connected
+        assert len(self._sent_by(_telegram("1/2/3"))) == 1
+
+        for tunnel in self.tunnels:
+            tunnel.send_telegram.side_effect = ValueError
+        with pytest.raises(ValueError):
+            await self.pool.send_telegram(_telegram("1/2/3"))
+        await self.pool.disconnect()
+
+    async def test_primary_tunnel(self):
+        """Test only the first tunnel of the pool sets xknx.current_address."""
+        await self.pool.connect()
+        assert [tunnel.primary for tunnel in self.tunnels] == [True, False, False]
+        await self.pool.disconnect()
+
+        self.pool.primary = False
+        await self.pool.connect()
+        assert not any(tunnel.primary for tunnel in self.tunnels)
+        await self.pool.disconnect()
+
+    async def test_connect_failed(self):
+        """Test connecting succeeds if at least one tunnel is connected."""
+        self.tunnels[0].connect.side_effect = CommunicationError("failed")
+        await self.pool.connect()
+        assert self.xknx.connection_manager.state is XknxConnectionState.CONNECTED
+        await self.pool.disconnect()
+
+        tunnels = [
+            _tunnel("1.1.1", connect_error=CommunicationError("failed")),
+            _tunnel("1.1.2", connect_error=CommunicationError("failed")),
+        ]
+        pool = TunnelPool(self.xknx, tunnels)
+        with pytest.raises(CommunicationError):
+            await pool.connect()
+        assert self.xknx.connection_manager.state is XknxConnectionState.DISCONNECTED
+
+    async def test_incoming_duplicates(self, time_travel):
+        """Test telegrams received by multiple tunnels are passed once."""
+        telegram = _telegram("1/2/3")
+        for tunnel in self.tunnels:
+            tunnel.telegram_received_callback(telegram)
+        self.telegram_received_mock.assert_called_once_with(telegram)
+        self.telegram_received_mock.reset_mock()
+
+        # the same telegram sent again
+        self.tunnels[1].telegram_received_callback(telegram)
+        self.tunnels[0].telegram_received_callback(telegram)
+        self.telegram_received_mock.assert_called_once_with(telegram)
+        self.telegram_received_mock.reset_mock()
+
+        # telegrams sent by tunnels of the pool are received by the other tunnels
+        self.tunnels[1].telegram_received_callback(_telegram("1/2/3", source="1.1.1"))
+        self.telegram_received_mock.assert_not_called()
+
+        await time_travel(self.pool.DUPLICATE_WINDOW)
+        self.tunnels[2].telegram_received_callback(telegram)
+        self.telegram_received_mock.assert_called_once_with(telegram)
+        assert len(self.pool._received) == 1
@@ -5,7 +5,9 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from xknx import XKNX
+from xknx.core import XknxConnectionState
 from xknx.dpt import DPTArray
+from xknx.exceptions import CommunicationError
 from xknx.io import UDPTunnel
 from xknx.io.gateway_scanner import GatewayDescriptor
 from xknx.knxip import (
@@ -89,6 +91,7 @@ class TestUDPTunnel:
         """Test tunnel waits for L_DATA.con before sending another L_DATA.req."""
         self.tunnel.transport.send = Mock()
         self.tunnel.communication_channel = 1
+        self.tunnel.sequence_number = 23
 
         test_telegram = Telegram(payload=GroupValueWrite(DPTArray((1,))))
         test_ack = KNXIPFrame.init_from_body(
@@ -117,6 +120,131 @@ class TestUDPTunnel:
         assert self.tunnel.transport.send.call_count == 2
         await task
 
+    async def test_tunnel_pipelined_send(self, time_travel):
+        """Test tunnel sending telegrams within a send window."""
+        tunnel = UDPTunnel(
+            self.xknx,
+            gateway_ip="192.168.1.2",
+            gateway_port=3671,
+            local_ip="192.168.1.1",
+            auto_reconnect=False,
+            send_window_size=2,
+        )
+        tunnel.transport.send = Mock()
+        tunnel.communication_channel = 1
+
+        def sent_sequence_counters():
+            return [
+                call.args[0].body.sequence_counter
+                for call in tunnel.transport.send.call_args_list
+                if isinstance(call.args[0].body, TunnellingRequest)
+            ]
+
+        def confirmation(telegram):
+            return KNXIPFrame.init_from_body(
+                TunnellingRequest(
+                    self.xknx,
+                    communication_channel_id=1,
+                    sequence_counter=0,
+                    cemi=CEMIFrame.init_from_telegram(
+                        self.xknx, telegram, code=CEMIMessageCode.L_DATA_CON
+                    ),
+                )
+            )
+
+        telegrams = [
+            Telegram(payload=GroupValueWrite(DPTArray((value,)))) for value in range(3)
+        ]
+        await tunnel.send_telegram(telegrams[0])
+        await tunnel.send_telegram(telegrams[1])
+        send_task = asyncio.create_task(tunnel.send_telegram(telegrams[2]))
+        await time_travel(0)
+        # window is full
+        assert not send_task.done()
+        assert sent_sequence_counters() == [0, 1]
+
+        # ACK for sequence counter 0 only - 1 is repeated after timeout
+        tunnel.transport.handle_knxipframe(
+            KNXIPFrame.init_from_body(TunnellingAck(self.xknx, sequence_counter=0)),
+            HPAI(),
+        )
+        await time_travel(1)
+        assert sent_sequence_counters() == [0, 1, 1]
+        tunnel.transport.handle_knxipframe(
+            KNXIPFrame.init_from_body(TunnellingAck(self.xknx, sequence_counter=1)),
+            HPAI(),
+        )
+        await time_travel(0)
+        assert not send_task.done()
+
+        # confirmation of the second telegram frees its slot
+        tunnel.transport.handle_knxipframe(confirmation(telegrams[1]), HPAI())
+        await time_travel(0)
+        assert send_task.done()
+        assert sent_sequence_counters() == [0, 1, 1, 2]
+        assert tunnel._pending_confirmations == [
+            (telegrams[0], tunnel._pending_confirmations[0][1]),
+            (telegrams[2], tunnel._pending_confirmations[1][1]),
+        ]
+
+        tunnel.transport.handle_knxipframe(
+            KNXIPFrame.init_from_body(TunnellingAck(self.xknx, sequence_counter=2)),
+            HPAI(),
+        )
+        tunnel.transport.handle_knxipframe(confirmation(telegrams[0]), HPAI())
+        tunnel.transport.handle_knxipframe(confirmation(telegrams[2]), HPAI())
+        await time_travel(0)
+        assert not tunnel._pending_confirmations
+        assert not tunnel._pipelined_requests
+
+    @patch("logging.Logger.exception")
+    async def test_tunnel_pipelined_send_error(self, logging_exception_mock):
+        """Test unexpected errors of pipelined sends are logged and free their slot."""
+        tunnel = UDPTunnel(
+            self.xknx,
+            gateway_ip="192.168.1.2",
+            gateway_port=3671,
+            local_ip="192.168.1.1",
+            auto_reconnect=False,
+            send_window_size=2,
+        )
+        tunnel._send_tunnelling_request = AsyncMock(side_effect=ValueError)
+
+        for value in range(3):
+            await tunnel.send_telegram(
+                Telegram(payload=GroupValueWrite(DPTArray((value,))))
+            )
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert logging_exception_mock.call_count == 3
+        assert not tunnel._pending_confirmations
+        assert not tunnel._pipelined_requests
+        assert not tunnel._send_window.locked()
+
+    @patch("logging.Logger.warning")
+    async def test_tunnel_pipelined_send_failed(self, logging_warning_mock):
+        """Test pipelined sends don't wait for the reconnect if the tunnel is lost."""
+        tunnel = UDPTunnel(
+            self.xknx,
+            gateway_ip="192.168.1.2",
+            gateway_port=3671,
+            local_ip="192.168.1.1",
+            auto_reconnect=False,
+            send_window_size=2,
+        )
+        tunnel._send_tunnelling_request = AsyncMock(return_value=False)
+        tunnel._tunnel_lost = Mock()
+
+        await tunnel.send_telegram(Telegram(payload=GroupValueWrite(DPTArray((1,)))))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert tunnel._send_tunnelling_request.call_count == 2
+        tunnel._tunnel_lost.assert_called_once_with()
+        logging_warning_mock.assert_called_once()
+        assert not tunnel._pending_confirmations
+        assert not tunnel._pipelined_requests
+        assert not tunnel._send_window.locked()
+
     @pytest.mark.parametrize(
         "route_back,data_endpoint_addr,local_endpoint",
         [
@@ -164,6 +292,7 @@ class TestUDPTunnel:
         await connection_task
         assert self.tunnel._data_endpoint_addr == data_endpoint_addr
         assert self.tunnel._src_address == IndividualAddress(7)
+        assert self.xknx.current_address == IndividualAddress(7)
 
         # Send - use data endpoint
         self.tunnel.transport.send.reset_mock()
@@ -210,6 +339,56 @@ class TestUDPTunnel:
         assert self.tunnel._data_endpoint_addr is None
         self.tunnel.transport.stop.assert_called_once()
 
+    @patch("random.random", return_value=0)
+    async def test_tunnel_reconnect(self, _random_mock, time_travel):
+        """Test reconnecting immediately, then with backoff reusing the open socket."""
+        self.tunnel.auto_reconnect = True
+        self.tunnel._initial_connection = False
+        self.tunnel.transport.connect = AsyncMock(side_effect=OSError("unreachable"))
+        self.tunnel.transport.is_connected = Mock(return_value=False)
+        self.tunnel.transport.getsockname = Mock(return_value=("192.168.1.1", 12345))
+        self.tunnel._connect_request = AsyncMock(return_value=True)
+
+        self.tunnel._tunnel_lost()
+        await time_travel(0)
+        assert self.tunnel.transport.connect.call_count == 1
+        # auto_reconnect_wait is 3 seconds - doubled for every attempt
+        for attempts, wait in enumerate((3, 6, 12, 24, 48, 60, 60), start=1):
+            await time_travel(wait - 0.1)
+            assert self.tunnel.transport.connect.call_count == attempts
+            await time_travel(0.1)
+            assert self.tunnel.transport.connect.call_count == attempts + 1
+
+        # socket is still open
+        self.tunnel.transport.connect.reset_mock()
+        self.tunnel.transport.is_connected.return_value = True
+        await time_travel(self.tunnel.RECONNECT_MAX_WAIT)
+        self.tunnel.transport.connect.assert_not_called()
+        self.tunnel._connect_request.assert_awaited_once()
+        assert self.tunnel._reconnect_attempts == 0
+        self.tunnel.stop_heartbeat()
+
+    async def test_tunnel_send_failed(self):
+        """Test sending doesn't wait for the reconnect if the tunnel is lost."""
+        self.tunnel.auto_reconnect = True
+        self.tunnel._tunnelling_request = AsyncMock(return_value=False)
+        self.tunnel._reconnect = AsyncMock()
+        self.tunnel.connection_state_changed_cb = AsyncMock()
+        with pytest.raises(CommunicationError):
+            await self.tunnel.send_telegram(
+                Telegram(payload=GroupValueWrite(DPTArray((1,))))
+            )
+        assert self.tunnel._tunnelling_request.call_count == 2
+        # DISCONNECTED is reported once - before the error is raised
+        self.tunnel.connection_state_changed_cb.assert_awaited_once_with(
+            XknxConnectionState.DISCONNECTED
+        )
+        await asyncio.sleep(0)
+        self.tunnel._reconnect.assert_awaited_once_with()
+        self.tunnel.connection_state_changed_cb.assert_awaited_once_with(
+            XknxConnectionState.DISCONNECTED
+        )
+
     async def test_tunnel_request_description(self, time_travel):
         """Test tunnel requesting and returning description of connected interface."""
         local_addr = ("192.168.1.1", 12345)
@@ -1,13 +1,13 @@
 """Tests for the CEMIFrame object."""
 from unittest.mock import MagicMock
 
-from pytest import fixture, raises
+from pytest import fixture, mark, raises
 
 from xknx.dpt import DPTBinary
 from xknx.exceptions import ConversionError, CouldNotParseKNXIP, UnsupportedCEMIMessage
 from xknx.knxip.cemi_frame import CEMIFrame
 from xknx.knxip.knxip_enum import CEMIFlags, CEMIMessageCode
-from xknx.telegram import GroupAddress, IndividualAddress, Telegram
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram, TelegramPriority
 from xknx.telegram.apci import GroupValueRead
 
 
@@ -160,3 +160,27 @@ def test_telegram_unsupported_address(frame):
     """Test telegram conversion flags with an unsupported address."""
     with raises(TypeError):
         frame.telegram = Telegram(destination_address=object())
+
+
+@mark.parametrize(
+    "priority,flag",
+    [
+        (TelegramPriority.SYSTEM, CEMIFlags.PRIORITY_SYSTE),
+        (TelegramPriority.NORMAL, CEMIFlags.PRIORITY_NORMAL),
+        (TelegramPriority.URGENT, CEMIFlags.PRIORITY_URGENT),
+        (TelegramPriority.LOW, CEMIFlags.PRIORITY_LOW),
+    ],
+)
+def test_telegram_priority(frame, priority, flag):
+    """Test telegram priority is mapped to cemi priority flags."""
+    frame.src_addr = IndividualAddress(0)
+    frame.telegram = Telegram(
+        destination_address=GroupAddress(0),
+        payload=GroupValueRead(),
+        priority=priority,
+    )
+    assert frame.flags & 0x0C00 == flag
+    assert frame.telegram.priority is priority
+
+    frame.from_knx(get_data(0x29, 0, 0x80 | flag, 0, 0, 1, 0, []))
+    assert frame.telegram.priority is priority
@@ -28,6 +28,16 @@ class TestKNXIPDIB:
         assert dib.to_knx() == raw
         assert dib.calculated_length() == 12
 
+    def test_dib_base_memoryview(self):
+        """Test parsing KNX/IP DIB packet from a memoryview copies data."""
+        raw = bytearray(
+            (0x0C, 0x02, 0x02, 0x01, 0x03, 0x02, 0x04, 0x01, 0x05, 0x01, 0x07, 0x01)
+        )
+        dib = DIBGeneric()
+        assert dib.from_knx(memoryview(raw)) == 12
+        assert isinstance(dib.data, bytes)
+        assert dib.to_knx() == raw
+
     def test_dib_wrong_input(self):
         """Test parsing of wrong KNX/IP DIB packet."""
         raw = (0x08, 0x01, 0xC0, 0xA8, 0x2A)
@@ -2,8 +2,9 @@
 import pytest
 
 from xknx import XKNX
+from xknx.dpt import DPTArray
 from xknx.exceptions import CouldNotParseKNXIP, IncompleteKNXIPFrame
-from xknx.knxip import KNXIPFrame
+from xknx.knxip import KNXIPBody, KNXIPFrame
 from xknx.knxip.knxip_enum import KNXIPServiceType
 
 
@@ -21,6 +22,31 @@ class TestKNXIPFrame:
             # this is not yet implemented in xknx
             knxipframe.init(KNXIPServiceType.SEARCH_REQUEST_EXTENDED)
 
+    def test_register_body_class(self):
+        """Test body classes defining a SERVICE_TYPE are used for parsing."""
+
+        class RemoteResetRequest(KNXIPBody):
+            """Body for a service type not implemented in xknx."""
+
+            SERVICE_TYPE = KNXIPServiceType.REMOTE_RESET_REQUEST
+
+            def calculated_length(self):
+                return 0
+
+            def from_knx(self, raw):
+                return 0
+
+            def to_knx(self):
+                return b""
+
+        try:
+            xknx = XKNX()
+            knxipframe = KNXIPFrame(xknx)
+            assert knxipframe.from_knx(bytes.fromhex("06 10 07 43 00 06")) == 6
+            assert isinstance(knxipframe.body, RemoteResetRequest)
+        finally:
+            del KNXIPBody.body_classes[KNXIPServiceType.REMOTE_RESET_REQUEST.value]
+
     def test_double_frame(self):
         """Test parsing KNX/IP frame from streaming data containing two frames."""
         xknx = XKNX()
@@ -34,6 +60,46 @@ class TestKNXIPFrame:
         assert knxipframe.from_knx(raw) == 21
         assert knxipframe.from_knx(raw[21:]) == 21
 
+    def test_parsed_frame_does_not_reference_buffer(self):
+        """Test parsed values are copied out of the received buffer."""
+        xknx = XKNX()
+        knxipframe = KNXIPFrame(xknx)
+        raw = bytearray.fromhex(
+            "06 10 05 30 00 13 29 00 bc d0 12 02 01 51 03 00 80 0c 3f"
+        )
+        assert knxipframe.from_knx(raw) == 19
+        raw[:] = bytes(len(raw))
+
+        assert knxipframe.body.cemi.payload.value == DPTArray((0x0C, 0x3F))
+        assert knxipframe.body.cemi.payload.value.value == (0x0C, 0x3F)
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            # TunnellingRequest
+            "06 10 04 20 00 15 04 01 17 00 11 00 BC E0 00 00 48 08 01 00 81",
+            # TunnellingAck
+            "06 10 04 21 00 0A 04 2A 17 00",
+            # RoutingIndication
+            "06 10 05 30 00 13 29 00 bc d0 12 02 01 51 03 00 80 0c 3f",
+            # ConnectionStateRequest - generic KNXIPBody.to_knx_into
+            "06 10 02 07 00 10 15 00 08 01 C0 A8 C8 0C C3 B4",
+        ],
+    )
+    def test_to_knx_into(self, raw):
+        """Test serializing into a preallocated buffer at an offset."""
+        raw = bytes.fromhex(raw)
+        xknx = XKNX()
+        knxipframe = KNXIPFrame(xknx)
+        knxipframe.from_knx(raw)
+        assert knxipframe.calculated_length() == len(raw)
+
+        buffer = bytearray(len(raw) + 4)
+        assert knxipframe.to_knx_into(buffer, 2) == len(raw)
+        assert buffer == bytes(2) + raw + bytes(2)
+        assert knxipframe.to_knx() == raw
+        assert isinstance(knxipframe.to_knx(), bytes)
+
     def test_parsing_too_short_knxip(self):
         """Test parsing and streaming connection state request KNX/IP packet."""
         raw = bytes.fromhex("06 10 02 07 00 10 15 00 08 01 C0 A8 C8 0C C3")
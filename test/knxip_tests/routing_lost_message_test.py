@@ -0,0 +1,36 @@
+"""Unit test for KNX/IP RoutingLostMessage objects."""
+import pytest
+
+from xknx import XKNX
+from xknx.exceptions import CouldNotParseKNXIP
+from xknx.knxip import KNXIPFrame, RoutingLostMessage
+
+
+class TestKNXIPRoutingLostMessage:
+    """Test class for KNX/IP RoutingLostMessage objects."""
+
+    def test_routing_lost_message(self):
+        """Test parsing and streaming RoutingLostMessage KNX/IP packet."""
+        raw = bytes((0x06, 0x10, 0x05, 0x31, 0x00, 0x0A, 0x04, 0x01, 0x01, 0x02))
+        xknx = XKNX()
+        knxipframe = KNXIPFrame(xknx)
+        knxipframe.from_knx(raw)
+
+        assert isinstance(knxipframe.body, RoutingLostMessage)
+        assert knxipframe.body.device_state == 1
+        assert knxipframe.body.lost_messages == 258
+
+        routing_lost_message = RoutingLostMessage(
+            xknx, device_state=1, lost_messages=258
+        )
+        knxipframe2 = KNXIPFrame.init_from_body(routing_lost_message)
+
+        assert knxipframe2.to_knx() == raw
+
+    def test_from_knx_wrong_length(self):
+        """Test parsing RoutingLostMessage with wrong structure length."""
+        raw = bytes((0x06, 0x10, 0x05, 0x31, 0x00, 0x09, 0x04, 0x01, 0x01))
+        xknx = XKNX()
+        knxipframe = KNXIPFrame(xknx)
+        with pytest.raises(CouldNotParseKNXIP):
+            knxipframe.from_knx(raw)
@@ -3,7 +3,7 @@ import pytest
 
 from xknx.exceptions import ConversionError
 from xknx.telegram import AddressFilter
-from xknx.telegram.address import GroupAddress, InternalGroupAddress
+from xknx.telegram.address import GroupAddress, GroupAddressType, InternalGroupAddress
 
 
 class TestAddressFilter:
@@ -210,3 +210,26 @@ class TestAddressFilter:
         assert not af4.match("i testx")
         assert not af4.match("i-11test")
         assert not af4.match(InternalGroupAddress("i-11"))
+
+    @pytest.mark.parametrize(
+        "pattern", ["1/*/2-5", "1/1-3,4,5/*", "*/2-5", "2/-10", "1-3,4,5", "*"]
+    )
+    @pytest.mark.parametrize("levels", list(GroupAddressType))
+    def test_match_table(self, pattern, levels):
+        """Test match_table is equivalent to match()."""
+        address_filter = AddressFilter(pattern)
+        table = address_filter.match_table(levels)
+        assert len(table) == GroupAddress.MAX_FREE + 1
+        for raw in range(0, GroupAddress.MAX_FREE + 1, 7):
+            address = GroupAddress(raw, levels=levels)
+            try:
+                expected = address_filter.match(address)
+            except ConnectionError:
+                # incompatible level types never match
+                expected = False
+            assert bool(table[raw]) == expected
+        assert address_filter.match_table(levels) is table
+
+    def test_match_table_internal(self):
+        """Test match_table of InternalGroupAddress filter is empty."""
+        assert not any(AddressFilter("i-t*t").match_table())
@@ -145,6 +145,18 @@ class TestAPCI:
             # Unsupported extended service.
             APCI.resolve_apci(0x03C0)
 
+    def test_resolve_apci_with_payload_bits(self):
+        """Test resolve_apci ignores the 6 payload bits of simple services."""
+        for payload in range(0x40):
+            assert isinstance(
+                APCI.resolve_apci(APCIService.GROUP_WRITE.value | payload),
+                GroupValueWrite,
+            )
+            assert isinstance(
+                APCI.resolve_apci(APCIService.MEMORY_READ.value | payload),
+                MemoryRead,
+            )
+
 
 class TestGroupValueRead:
     """Test class for GroupValueRead objects."""
@@ -168,6 +180,10 @@ class TestGroupValueRead:
 
         assert payload.to_knx() == bytes([0x00, 0x00])
 
+        buffer = bytearray(3)
+        assert payload.to_knx_into(buffer, 1) == 2
+        assert buffer == bytes([0x00, 0x00, 0x00])
+
     def test_str(self):
         """Test the __str__ method."""
         payload = GroupValueRead()
@@ -212,6 +228,12 @@ class TestGroupValueWrite:
         assert payload_a.to_knx() == bytes([0x00, 0x80, 0x01, 0x02, 0x03])
         assert payload_b.to_knx() == bytes([0x00, 0x81])
 
+        buffer = bytearray(6)
+        assert payload_a.to_knx_into(buffer, 1) == 5
+        assert buffer == bytes([0x00, 0x00, 0x80, 0x01, 0x02, 0x03])
+        assert payload_b.to_knx_into(buffer, 4) == 2
+        assert buffer == bytes([0x00, 0x00, 0x80, 0x01, 0x00, 0x81])
+
     def test_to_knx_exception(self):
         """Test the to_knx method for unsupported dpt."""
         payload = GroupValueWrite(object())
@@ -263,6 +285,12 @@ class TestGroupValueResponse:
         assert payload_a.to_knx() == bytes([0x00, 0x40, 0x01, 0x02, 0x03])
         assert payload_b.to_knx() == bytes([0x00, 0x41])
 
+        buffer = bytearray(6)
+        assert payload_a.to_knx_into(buffer, 1) == 5
+        assert buffer == bytes([0x00, 0x00, 0x40, 0x01, 0x02, 0x03])
+        assert payload_b.to_knx_into(buffer, 4) == 2
+        assert buffer == bytes([0x00, 0x00, 0x40, 0x01, 0x00, 0x41])
+
     def test_to_knx_exception(self):
         """Test the to_knx method for unsupported dpt."""
         payload = GroupValueResponse(object())
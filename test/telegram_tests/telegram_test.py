@@ -1,6 +1,8 @@
 """Unit test for Telegram objects."""
+from datetime import datetime
+
 from xknx.dpt import DPTBinary
-from xknx.telegram import GroupAddress, Telegram, TelegramDirection
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection, TelegramPriority
 from xknx.telegram.apci import GroupValueRead, GroupValueWrite
 
 
@@ -29,3 +31,19 @@ class TestTelegram:
             TelegramDirection.INCOMING,
             payload=GroupValueRead(),
         )
+        assert Telegram(GroupAddress("1/2/3"), payload=GroupValueRead()) != Telegram(
+            GroupAddress("1/2/3"),
+            payload=GroupValueRead(),
+            priority=TelegramPriority.NORMAL,
+        )
+
+    def test_timestamp(self):
+        """Test timestamp is derived from the monotonic receive time."""
+        telegram = Telegram(GroupAddress("1/2/3"), payload=GroupValueRead())
+        assert isinstance(telegram.monotonic_time, float)
+        assert isinstance(telegram.timestamp, datetime)
+        assert abs((datetime.now() - telegram.timestamp).total_seconds()) < 1
+
+        timestamp = datetime(2021, 1, 1, 12, 0)
+        telegram.timestamp = timestamp
+        assert telegram.timestamp == timestamp
@@ -47,6 +47,19 @@ class TestXknxModule:
         start_mock.assert_called_once()
         await xknx.stop()
 
+    @patch("xknx.io.KNXIPInterface._start", new_callable=AsyncMock)
+    async def test_xknx_start_restores_states_first(self, start_mock, tmp_path):
+        """Test saved states are restored before telegrams are received."""
+        xknx = XKNX(state_store_path=str(tmp_path / "states.db"))
+        calls = []
+        start_mock.side_effect = lambda: calls.append("interface")
+        with patch.object(
+            xknx.state_store, "restore", side_effect=lambda: calls.append("restore")
+        ):
+            await xknx.start()
+        assert calls == ["restore", "interface"]
+        await xknx.stop()
+
     @patch("xknx.io.KNXIPInterface._start", new_callable=AsyncMock)
     async def test_xknx_start_as_context_manager(self, ipinterface_mock):
         """Test xknx start."""
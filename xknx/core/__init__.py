@@ -1,8 +1,12 @@
 """Module for the automations and business logic of XKNX."""
 # flake8: noqa
+from .bounded_queue import BoundedTelegramQueue, OverflowPolicy
 from .connection_manager import ConnectionManager
 from .connection_state import XknxConnectionState
 from .payload_reader import PayloadReader
+from .pending_reads import PendingReads
+from .rate_limiter import RateLimiter
+from .state_store import StateStore
 from .state_updater import StateUpdater
 from .task_registry import Task, TaskRegistry
 from .telegram_queue import TelegramQueue
@@ -0,0 +1,142 @@
+"""
+Queue for incoming and outgoing telegrams with an optional maximum size.
+
+Only incoming telegrams count against `maxsize`. They are put with `put_nowait()` from
+the transport callbacks. If the queue is full they are handled according to the
+`OverflowPolicy` so processing latency and memory stay bounded when the consumers fall
+behind (eg. on a bus storm).
+Incoming telegrams handed on to a worker task (`XKNX(incoming_workers=...)`) still
+count against `maxsize` until `release()` is called when the worker is done with them.
+They can't be dropped anymore - if only those are left, the received telegram is
+dropped.
+Outgoing telegrams are never dropped and never wait for room in the queue - they are
+also put from the consumer itself (eg. a device answering a GroupValueRead) which would
+otherwise wait for itself.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from enum import Enum
+import logging
+
+from xknx.telegram import Telegram, TelegramDirection
+
+logger = logging.getLogger("xknx.log")
+
+
+class OverflowPolicy(Enum):
+    """Enum class for handling incoming telegrams when the queue is full."""
+
+    # discard the oldest queued incoming telegram
+    DROP_OLDEST = "drop_oldest"
+    # discard the received telegram
+    DROP_NEWEST = "drop_newest"
+    # replace a queued incoming telegram for the same destination address - DROP_OLDEST if there is none
+    COALESCE = "coalesce"
+
+
+class BoundedTelegramQueue(asyncio.Queue["Telegram | None"]):
+    """Class for a telegram queue dropping incoming telegrams if it is full."""
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        """Initialize BoundedTelegramQueue class. `maxsize` 0 is unbounded."""
+        # the underlying asyncio.Queue is unbounded - maxsize only limits incoming telegrams
+        super().__init__()
+        self._max_incoming = maxsize
+        self._incoming = 0
+        # incoming telegrams taken from the queue but not processed yet
+        self._held = 0
+        self.overflow_policy = overflow_policy
+        self.dropped_telegrams = 0
+        self._overflowing = False
+
+    def _init(self, maxsize: int) -> None:
+        """Initialize the queue storage. Called from asyncio.Queue.__init__."""
+        self._queue: deque[Telegram | None] = deque()
+
+    @property
+    def maxsize(self) -> int:
+        """Return number of incoming telegrams allowed in the queue."""
+        return self._max_incoming
+
+    def incoming_full(self) -> bool:
+        """Return True if there are `maxsize` incoming telegrams in the queue."""
+        return 0 < self._max_incoming <= self._incoming + self._held
+
+    def hold(self) -> None:
+        """Count a taken incoming telegram against `maxsize` until `release()` is called."""
+        self._held += 1
+
+    def release(self) -> None:
+        """Stop counting a held incoming telegram against `maxsize`."""
+        self._held -= 1
+
+    def _put(self, item: Telegram | None) -> None:
+        """Append item to the queue."""
+        if _is_incoming(item):
+            self._incoming += 1
+        self._queue.append(item)
+
+    def _get(self) -> Telegram | None:
+        """Get oldest item from the queue."""
+        item = self._queue.popleft()
+        if _is_incoming(item):
+            self._incoming -= 1
+        return item
+
+    def put_nowait(self, item: Telegram | None) -> None:
+        """Put item into the queue. Apply the overflow policy for incoming telegrams."""
+        if item is None or item.direction is not TelegramDirection.INCOMING:
+            super().put_nowait(item)
+            return
+        if not self.incoming_full():
+            self._overflowing = False
+            super().put_nowait(item)
+            return
+        if not self._overflowing:
+            self._overflowing = True
+            logger.warning(
+                "Telegram queue is full (%s telegrams). Dropping incoming telegrams (%s).",
+                self.maxsize,
+                self.overflow_policy.value,
+            )
+        self.dropped_telegrams += 1
+        if self.overflow_policy is OverflowPolicy.DROP_NEWEST:
+            return
+        if self.overflow_policy is OverflowPolicy.COALESCE and self._replace(item):
+            return
+        if self._remove_oldest_incoming():
+            super().put_nowait(item)
+
+    def _replace(self, telegram: Telegram) -> bool:
+        """Replace a queued incoming telegram for the same destination address."""
+        for index, queued in enumerate(self._queue):
+            if (
+                queued is not None
+                and queued.direction is TelegramDirection.INCOMING
+                and queued.destination_address == telegram.destination_address
+            ):
+                self._queue[index] = telegram
+                return True
+        return False
+
+    def _remove_oldest_incoming(self) -> bool:
+        """Remove the oldest incoming telegram. Return False if there is none."""
+        for index, queued in enumerate(self._queue):
+            if _is_incoming(queued):
+                del self._queue[index]
+                self._incoming -= 1
+                # the removed telegram will never be processed
+                self.task_done()
+                return True
+        return False
+
+
+def _is_incoming(item: Telegram | None) -> bool:
+    """Return if item is an incoming telegram."""
+    return item is not None and item.direction is TelegramDirection.INCOMING
@@ -0,0 +1,134 @@
+"""
+Module for reading the values of many KNX group addresses at once.
+
+All pending reads share one table from group address to futures and one telegram
+received callback. A received GroupValueResponse or GroupValueWrite resolves the
+futures of its destination address by a single dict lookup.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Iterable
+
+from xknx.telegram import Telegram
+from xknx.telegram.address import GroupAddress, InternalGroupAddress
+from xknx.telegram.apci import GroupValueRead, GroupValueResponse, GroupValueWrite
+
+if TYPE_CHECKING:
+    from xknx.xknx import XKNX
+
+    from .telegram_queue import TelegramQueue
+
+logger = logging.getLogger("xknx.log")
+
+
+class PendingReads:
+    """Class for correlating GroupValueRead requests with their responses."""
+
+    def __init__(self, xknx: XKNX):
+        """Initialize PendingReads class."""
+        self.xknx = xknx
+        self._pending: dict[
+            GroupAddress | InternalGroupAddress, list[asyncio.Future[Telegram]]
+        ] = {}
+        self._callback: TelegramQueue.Callback | None = None
+
+    def __len__(self) -> int:
+        """Return number of group addresses waiting for a response."""
+        return len(self._pending)
+
+    async def read_many(
+        self,
+        addresses: Iterable[GroupAddress | InternalGroupAddress],
+        timeout_in_seconds: float = 2.0,
+    ) -> dict[GroupAddress | InternalGroupAddress, Telegram | None]:
+        """
+        Send GroupValueRead to every address and wait for the responses.
+
+        The timeout starts when all GroupValueRead telegrams are queued.
+        Return received telegrams by address - None if there was no response in time.
+        """
+        # one GroupValueRead and pending future per address
+        addresses = list(dict.fromkeys(addresses))
+        futures = {address: self._add(address) for address in addresses}
+        try:
+            for address in futures:
+                await self.xknx.telegrams.put(
+                    Telegram(
+                        destination_address=address,
+                        payload=GroupValueRead(),
+                        source_address=self.xknx.current_address,
+                    )
+                )
+            if futures:
+                await asyncio.wait(futures.values(), timeout=timeout_in_seconds)
+        finally:
+            # cleanup for timeouts and asyncio.CancelledError
+            for address, future in futures.items():
+                if not future.done():
+                    future.cancel()
+                    self._remove(address, future)
+
+        timed_out = [
+            address for address, future in futures.items() if future.cancelled()
+        ]
+        if timed_out:
+            logger.warning(
+                "Error: KNX bus did not respond in time (%s secs) to GroupValueRead request for: %s",
+                timeout_in_seconds,
+                ", ".join(str(address) for address in timed_out),
+            )
+        return {
+            address: None if future.cancelled() else future.result()
+            for address, future in futures.items()
+        }
+
+    def _add(
+        self, address: GroupAddress | InternalGroupAddress
+    ) -> asyncio.Future[Telegram]:
+        """Add a pending read for address."""
+        if self._callback is None:
+            self._callback = self.xknx.telegram_queue.register_telegram_received_cb(
+                self.telegram_received,
+                match_for_outgoing=True,
+            )
+        future: asyncio.Future[Telegram] = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(address, []).append(future)
+        return future
+
+    def _remove(
+        self,
+        address: GroupAddress | InternalGroupAddress,
+        future: asyncio.Future[Telegram],
+    ) -> None:
+        """Remove a pending read that was not resolved."""
+        futures = self._pending.get(address)
+        if futures is None:
+            return
+        futures.remove(future)
+        if not futures:
+            del self._pending[address]
+            self._unregister_if_idle()
+
+    def _unregister_if_idle(self) -> None:
+        """Unregister the callback if no read is pending."""
+        if not self._pending and self._callback is not None:
+            self.xknx.telegram_queue.unregister_telegram_received_cb(self._callback)
+            self._callback = None
+
+    async def telegram_received(self, telegram: Telegram) -> None:
+        """Resolve pending reads for the destination address of telegram."""
+        if not isinstance(
+            telegram.payload, (GroupValueResponse, GroupValueWrite)
+        ) or not isinstance(
+            telegram.destination_address, (GroupAddress, InternalGroupAddress)
+        ):
+            return
+        futures = self._pending.pop(telegram.destination_address, None)
+        if futures is None:
+            return
+        for future in futures:
+            if not future.done():
+                future.set_result(telegram)
+        self._unregister_if_idle()
@@ -0,0 +1,131 @@
+"""
+Token bucket rate limiter for outgoing telegrams.
+
+Tokens are refilled at `xknx.rate_limit` per second up to `xknx.rate_limit_burst`.
+Every outgoing telegram consumes one token - if no token is available sending is
+delayed until the bucket is refilled.
+The rate adapts to the load of the KNX bus:
+* a slow L_DATA_CON confirmation halves the rate, fast confirmations restore it step by step
+* `pause()` stops sending for a given time (eg. when a KNX/IP router signals it is busy)
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Callable, Hashable
+
+from xknx.telegram import IndividualAddress
+
+if TYPE_CHECKING:
+    from xknx.telegram import Telegram
+    from xknx.xknx import XKNX
+
+BucketKeyType = Callable[["Telegram"], Hashable]
+
+
+def destination_line(telegram: Telegram) -> Hashable:
+    """Return the line of the destination of individually addressed telegrams."""
+    if isinstance(telegram.destination_address, IndividualAddress):
+        return (telegram.destination_address.area, telegram.destination_address.main)
+    return None
+
+
+class TokenBucket:
+    """Token bucket allowing bursts of up to `burst` tokens."""
+
+    def __init__(self, burst: int) -> None:
+        """Initialize TokenBucket class."""
+        self.tokens = float(burst)
+        self.last_refill: float | None = None
+
+    def reserve(self, now: float, rate: float, burst: int) -> float:
+        """Consume one token. Return seconds to wait until the token is available."""
+        if self.last_refill is not None:
+            self.tokens = min(
+                float(burst), self.tokens + (now - self.last_refill) * rate
+            )
+        self.last_refill = now
+        # tokens may become negative to reserve them for waiting callers
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0
+        return -self.tokens / rate
+
+
+class RateLimiter:
+    """Class for limiting the rate of outgoing telegrams."""
+
+    # L_DATA_CON confirmations slower than this reduce the rate
+    LATENCY_THRESHOLD = 0.5
+    # the rate is never reduced below this fraction of `xknx.rate_limit`
+    MIN_RATE_FACTOR = 0.1
+    RATE_FACTOR_STEP = 0.1
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        bucket_key: BucketKeyType | None = None,
+        bucket_rate_limit: float = 0,
+        bucket_rate_limit_burst: int = 1,
+    ) -> None:
+        """
+        Initialize RateLimiter class.
+
+        `bucket_key` returns a key for additional token buckets limiting telegrams
+        with the same key (eg. `destination_line`) to `bucket_rate_limit` telegrams
+        per second. Telegrams with key None are only limited by the global bucket.
+        """
+        self.xknx = xknx
+        self.bucket_key = bucket_key
+        self.bucket_rate_limit = bucket_rate_limit
+        self.bucket_rate_limit_burst = bucket_rate_limit_burst
+        self.rate_factor = 1.0
+        self._buckets: dict[Hashable, TokenBucket] = {}
+        self._paused_until = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Return current rate in telegrams per second."""
+        return self.xknx.rate_limit * self.rate_factor
+
+    def _bucket(self, key: Hashable, burst: int) -> TokenBucket:
+        """Return token bucket for key."""
+        try:
+            return self._buckets[key]
+        except KeyError:
+            bucket = self._buckets[key] = TokenBucket(burst)
+            return bucket
+
+    async def wait(self, telegram: Telegram) -> None:
+        """Wait until telegram may be sent."""
+        now = asyncio.get_running_loop().time()
+        # pause() applies even if rate limiting is disabled
+        delay = self._paused_until - now
+        rate = self.rate
+        if rate:
+            burst = self.xknx.rate_limit_burst
+            delay = max(delay, self._bucket(None, burst).reserve(now, rate, burst))
+        if self.bucket_key is not None and self.bucket_rate_limit:
+            key = self.bucket_key(telegram)
+            if key is not None:
+                bucket_burst = self.bucket_rate_limit_burst
+                delay = max(
+                    delay,
+                    self._bucket(key, bucket_burst).reserve(
+                        now, self.bucket_rate_limit * self.rate_factor, bucket_burst
+                    ),
+                )
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Don't send telegrams for `seconds`."""
+        self._paused_until = max(
+            self._paused_until, asyncio.get_running_loop().time() + seconds
+        )
+
+    def confirmation_received(self, latency: float) -> None:
+        """Adapt rate to the time it took to receive a L_DATA_CON confirmation."""
+        if latency > self.LATENCY_THRESHOLD:
+            self.rate_factor = max(self.MIN_RATE_FACTOR, self.rate_factor / 2)
+        else:
+            self.rate_factor = min(1.0, self.rate_factor + self.RATE_FACTOR_STEP)
@@ -0,0 +1,170 @@
+"""
+Module for persisting the states of RemoteValues between restarts.
+
+The last telegram of every RemoteValue is saved per group address to a SQLite
+database periodically and when XKNX is stopped. On start the telegrams are
+processed again so devices have a value before the bus is read. Restored values
+are marked as `stale` until a telegram is received from the bus. StateUpdater
+only reads states whose snapshot is older than the trackers interval.
+"""
+from __future__ import annotations
+
+import asyncio
+from contextlib import closing
+import logging
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Any, Iterator
+
+from xknx.exceptions import ConversionError
+from xknx.telegram import Telegram, TelegramDirection
+from xknx.telegram.address import parse_device_group_address
+from xknx.telegram.apci import APCI
+
+if TYPE_CHECKING:
+    from xknx.remote_value import RemoteValue
+    from xknx.xknx import XKNX
+
+logger = logging.getLogger("xknx.log")
+
+# group address -> (APDU of GroupValueWrite or GroupValueResponse, unix time)
+SnapshotType = dict[str, tuple[bytes, float]]
+
+
+class StateStore:
+    """Class for saving and restoring the states of RemoteValues."""
+
+    def __init__(self, xknx: XKNX, path: str, save_interval: float = 60):
+        """Initialize StateStore class."""
+        self.xknx = xknx
+        self.path = path
+        self.save_interval = save_interval
+        # last saved telegram per group address - unchanged telegrams are not saved again
+        self._saved: dict[str, Telegram] = {}
+        # received telegrams are at most as old as the previous snapshot
+        self._last_save_time = time.time()
+        self._save_task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Restore states and start saving periodically."""
+        await self.restore()
+        self._save_task = asyncio.create_task(self._save_periodically())
+
+    async def stop(self) -> None:
+        """Stop saving periodically and save current states."""
+        if self._save_task is not None:
+            self._save_task.cancel()
+            self._save_task = None
+        await self.save()
+
+    async def _save_periodically(self) -> None:
+        """Save states every `save_interval` seconds."""
+        while True:
+            await asyncio.sleep(self.save_interval)
+            await self.save()
+
+    def _iter_remote_values(self) -> Iterator[RemoteValue[Any, Any]]:
+        """Yield RemoteValues of all devices."""
+        for device in self.xknx.devices:
+            # pylint: disable=protected-access
+            yield from device._iter_remote_values()
+
+    async def save(self) -> None:
+        """Save telegrams of RemoteValues that changed since the last snapshot."""
+        now = time.time()
+        changed: dict[str, Telegram] = {}
+        rows: list[tuple[str, bytes, float]] = []
+        for remote_value in self._iter_remote_values():
+            telegram = remote_value.telegram
+            if telegram is None or telegram.payload is None or remote_value.stale:
+                continue
+            address = str(telegram.destination_address)
+            if address in changed or self._saved.get(address) is telegram:
+                continue
+            changed[address] = telegram
+            rows.append((address, telegram.payload.to_knx(), self._last_save_time))
+        if rows:
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._write, rows
+                )
+            except sqlite3.Error as err:
+                logger.warning(
+                    "Could not save state snapshot to %s: %s", self.path, err
+                )
+                return
+            self._saved.update(changed)
+        self._last_save_time = now
+
+    async def restore(self) -> None:
+        """Process saved telegrams for RemoteValues. Mark their values as stale."""
+        try:
+            snapshot = await asyncio.get_running_loop().run_in_executor(
+                None, self._read
+            )
+        except sqlite3.Error as err:
+            logger.warning("Could not read state snapshot from %s: %s", self.path, err)
+            return
+        now = time.time()
+        restored = 0
+        for remote_value in self._iter_remote_values():
+            rows = [
+                (snapshot[address][1], address)
+                for address in map(str, remote_value.group_addresses())
+                if address in snapshot
+            ]
+            if not rows:
+                continue
+            timestamp, address = max(rows)
+            telegram = self._telegram(address, snapshot[address][0])
+            if telegram is None or not await remote_value.process(
+                telegram, always_callback=True
+            ):
+                continue
+            self._saved[address] = telegram
+            remote_value.stale = True
+            self.xknx.state_updater.set_state_age(remote_value, now - timestamp)
+            restored += 1
+        logger.debug("Restored %s states from %s", restored, self.path)
+
+    @staticmethod
+    def _telegram(address: str, apdu: bytes) -> Telegram | None:
+        """Return telegram from saved group address and APDU."""
+        try:
+            payload = APCI.resolve_apci(int.from_bytes(apdu[:2], "big"))
+            payload.from_knx(apdu)
+            return Telegram(
+                destination_address=parse_device_group_address(address),
+                direction=TelegramDirection.INCOMING,
+                payload=payload,
+            )
+        except (ConversionError, IndexError) as err:
+            logger.warning("Could not restore state of %s: %s", address, err)
+            return None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the table if it doesn't exist."""
+        connection = sqlite3.connect(self.path)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS state "
+            "(group_address TEXT PRIMARY KEY, apdu BLOB NOT NULL, timestamp REAL NOT NULL)"
+        )
+        return connection
+
+    def _read(self) -> SnapshotType:
+        """Read all saved states. Called from executor."""
+        with closing(self._connect()) as connection:
+            return {
+                address: (apdu, timestamp)
+                for address, apdu, timestamp in connection.execute(
+                    "SELECT group_address, apdu, timestamp FROM state"
+                )
+            }
+
+    def _write(self, rows: list[tuple[str, bytes, float]]) -> None:
+        """Insert or replace states. Called from executor."""
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO state VALUES (?, ?, ?)",
+                rows,
+            )
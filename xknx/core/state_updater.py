@@ -1,33 +1,71 @@
-"""Module for keeping the value of a RemoteValue from KNX bus up to date."""
+"""
+Module for keeping the value of a RemoteValue from KNX bus up to date.
+
+Expiry times of all trackers are kept in one heap served by a single event loop
+timer. Resetting a tracker only updates its expiry time - outdated heap entries
+are rescheduled when they are reached.
+
+Expired states are read in order of the priority of their device class. Reads are
+started as long as the measured bus load leaves room for them.
+
+After a short connection outage trackers keep their expiry times so only expired
+states are read - after longer outages all states are read again.
+"""
 from __future__ import annotations
 
 import asyncio
 from enum import Enum
+import heapq
+import itertools
 import logging
+import math
+import random
 from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
 from xknx.core import XknxConnectionState
 from xknx.remote_value import RemoteValue
 
 if TYPE_CHECKING:
+    from xknx.devices import Device
     from xknx.xknx import XKNX
 
+    from .telegram_queue import TelegramQueue
+
 
 logger = logging.getLogger("xknx.state_updater")
 
 DEFAULT_UPDATE_INTERVAL = 60
 MAX_UPDATE_INTERVAL = 1440
+# expiry times are reduced by up to this fraction of the interval so reads don't synchronize
+UPDATE_INTERVAL_JITTER = 0.1
+# seconds - after longer outages all states are read on reconnect
+SHORT_OUTAGE_DURATION = 60
+# lower values are read first - by device class name (including base classes)
+DEFAULT_SYNC_PRIORITY = 2
+DEFAULT_SYNC_PRIORITIES = {
+    "Light": 0,
+    "Switch": 0,
+    "Cover": 0,
+    "Fan": 0,
+    "Climate": 1,
+    "ClimateMode": 1,
+}
 
 
 class StateUpdater:
     """Class for keeping the states of RemoteValues up to date."""
 
-    def __init__(self, xknx: XKNX, parallel_reads: int = 2):
+    def __init__(self, xknx: XKNX, parallel_reads: int = 10):
         """Initialize StateUpdater class."""
         self.xknx = xknx
         self.started = False
+        self.sync_priorities = dict(DEFAULT_SYNC_PRIORITIES)
+        # loop time when the connection was lost
+        self._outage_time: float | None = None
         self._workers: dict[int, _StateTracker] = {}
-        self._semaphore = asyncio.Semaphore(value=parallel_reads)
+        self._scheduler = _TrackerScheduler(
+            xknx.telegram_queue, parallel_reads=parallel_reads
+        )
 
     def register_remote_value(
         self,
@@ -81,24 +119,22 @@ class StateUpdater:
                 update_interval = MAX_UPDATE_INTERVAL
             return (tracker_type, update_interval)
 
-        async def read_state_mutex() -> None:
-            """Schedule to read the state from the KNX bus - one at a time."""
-            async with self._semaphore:
-                # wait until there is nothing else to send to the bus
-                await self.xknx.telegram_queue.outgoing_queue.join()
-                logger.debug(
-                    "StateUpdater reading %s for %s - %s",
-                    remote_value.group_address_state,
-                    remote_value.device_name,
-                    remote_value.feature_name,
-                )
-                # shield from cancellation so update_received() don't cancel the
-                # ValueReader leaving the telegram_received_cb until next telegram
-                await asyncio.shield(remote_value.read_state(wait_for_result=True))
+        async def read_state() -> None:
+            """Read the state from the KNX bus. Called by the scheduler."""
+            logger.debug(
+                "StateUpdater reading %s for %s - %s",
+                remote_value.group_address_state,
+                remote_value.device_name,
+                remote_value.feature_name,
+            )
+            # shield from cancellation so stopping the StateUpdater doesn't cancel
+            # the ValueReader leaving the telegram_received_cb until next telegram
+            await asyncio.shield(remote_value.read_state(wait_for_result=True))
 
         tracker_type, update_interval = parse_tracker_options(tracker_options)
         tracker = _StateTracker(
-            read_state_awaitable=read_state_mutex,
+            scheduler=self._scheduler,
+            read_state_awaitable=read_state,
             tracker_type=tracker_type,
             interval_min=update_interval,
         )
@@ -117,6 +153,11 @@ class StateUpdater:
         """Unregister a RemoteValue from StateUpdater."""
         self._workers.pop(id(remote_value)).stop()
 
+    def set_state_age(self, remote_value: RemoteValue[Any, Any], age: float) -> None:
+        """Set age in seconds of a restored state. It is read when its interval expires."""
+        if (tracker := self._workers.get(id(remote_value))) is not None:
+            tracker.restored_time = asyncio.get_running_loop().time() - age
+
     def update_received(self, remote_value: RemoteValue[Any, Any]) -> None:
         """Reset the timer when a state update was received."""
         if self.started and id(remote_value) in self._workers:
@@ -126,15 +167,49 @@ class StateUpdater:
         """Start internal StateUpdater. Initialize states."""
         logger.debug("StateUpdater initializing values")
         self.started = True
+        if (
+            self._outage_time is not None
+            and asyncio.get_running_loop().time() - self._outage_time
+            > SHORT_OUTAGE_DURATION
+        ):
+            # states may have changed unnoticed - read all of them
+            for worker in self._workers.values():
+                worker.restored_time = None
+        self._outage_time = None
+        self._update_sync_priorities()
         for worker in self._workers.values():
             worker.start()
 
-    def _stop(self) -> None:
-        """Stop internal StateUpdater."""
+    def _update_sync_priorities(self) -> None:
+        """Set the priority of trackers by the class of the device using the RemoteValue."""
+        for device in self.xknx.devices:
+            priority = self._device_sync_priority(device)
+            # pylint: disable=protected-access
+            for remote_value in device._iter_remote_values():
+                tracker = self._workers.get(id(remote_value))
+                if tracker is not None:
+                    tracker.priority = priority
+
+    def _device_sync_priority(self, device: Device) -> int:
+        """Return sync priority of device from `sync_priorities`."""
+        for device_class in type(device).__mro__:
+            try:
+                return self.sync_priorities[device_class.__name__]
+            except KeyError:
+                pass
+        return DEFAULT_SYNC_PRIORITY
+
+    def _stop(self, outage: bool = False) -> None:
+        """Stop internal StateUpdater. Keep expiry times to resume after a short `outage`."""
         logger.debug("StateUpdater stopping")
         self.started = False
+        self._outage_time = asyncio.get_running_loop().time() if outage else None
         for worker in self._workers.values():
-            worker.stop()
+            if outage:
+                worker.suspend()
+            else:
+                worker.stop()
+        self._scheduler.stop()
 
     def start(self) -> None:
         """Start StateUpdater."""
@@ -163,7 +238,7 @@ class StateUpdater:
             state in (XknxConnectionState.DISCONNECTED, XknxConnectionState.CONNECTING)
             and self.started
         ):
-            self._stop()
+            self._stop(outage=True)
 
 
 class StateTrackerType(Enum):
@@ -179,6 +254,7 @@ class _StateTracker:
 
     def __init__(
         self,
+        scheduler: _TrackerScheduler,
         read_state_awaitable: Callable[[], Awaitable[None]],
         tracker_type: StateTrackerType = StateTrackerType.EXPIRE,
         interval_min: float = 60,
@@ -187,40 +263,252 @@ class _StateTracker:
         self.tracker_type = tracker_type
         self.update_interval = interval_min * 60
         self._read_state = read_state_awaitable
-        self._task: asyncio.Task[None] | None = None
+        self._scheduler = scheduler
+        self.priority = DEFAULT_SYNC_PRIORITY
+        # loop time of the last known update - used once on start
+        # set from StateStore or when stopped to resume after a short outage
+        self.restored_time: float | None = None
+        self.active = False
+        # loop time when the state expires - None if no read is scheduled
+        self.deadline: float | None = None
+        # used by _TrackerScheduler
+        self.scheduled = False
+        self.read_pending = False
 
     def start(self) -> None:
-        """Start StateTracker - read state on call."""
-        self.stop()
-        self._task = asyncio.create_task(self._start_init())
-
-    async def _start_init(self) -> None:
-        """Initialize state, start update loop if appropriate."""
-        await self._read_state()
-        if self.tracker_type is not StateTrackerType.INIT:
-            self.reset()
+        """Start StateTracker - read state if there is no recent restored state."""
+        self.active = True
+        self.deadline = None
+        if self.restored_time is not None:
+            deadline = self.restored_time + self.update_interval
+            self.restored_time = None
+            if deadline > asyncio.get_running_loop().time():
+                self.deadline = deadline
+                self._scheduler.schedule(self)
+                return
+        self._scheduler.read(self)
 
     def reset(self) -> None:
         """Start / Restart StateTracker timer - wait for value to expire."""
-        self.stop()
-        self._task = asyncio.create_task(self._update_loop())
+        if not self.active:
+            return
+        self.deadline = asyncio.get_running_loop().time() + self.update_interval * (
+            1 - UPDATE_INTERVAL_JITTER * random.random()
+        )
+        self._scheduler.schedule(self)
 
     def stop(self) -> None:
         """Stop StateTracker."""
-        if self._task:
-            self._task.cancel()
-            self._task = None
+        self.active = False
+        self.deadline = None
+
+    def suspend(self) -> None:
+        """Stop StateTracker. Resume waiting for the current deadline on start."""
+        if self.deadline is not None:
+            self.restored_time = self.deadline - self.update_interval
+        self.stop()
 
     def update_received(self) -> None:
         """Reset the timer if a telegram was received for a "expire" typed StateUpdater."""
         if self.tracker_type == StateTrackerType.EXPIRE:
             self.reset()
 
-    async def _update_loop(self) -> None:
-        """Wait for the update_interval to expire. Endless loop for updating states."""
-        # for StateUpdaterType.EXPIRE:
-        #   on successfull read the while loop gets canceled when the callback calls update_received()
-        #   when no telegram was received it will try again endlessly
+    async def read(self) -> None:
+        """Read state. Wait for the update_interval to expire again if appropriate."""
+        await self._read_state()
+        # for StateTrackerType.EXPIRE a successful read already called update_received()
+        # when no telegram was received it will try again after update_interval
+        if self.tracker_type is not StateTrackerType.INIT:
+            self.reset()
+
+
+class _BusLoad:
+    """Measure telegrams per second on the KNX bus from the TelegramQueue counter."""
+
+    # seconds - time constant of the exponential moving average
+    TIME_CONSTANT = 2.0
+    MIN_SAMPLE_TIME = 0.1
+
+    def __init__(self, telegram_queue: TelegramQueue) -> None:
+        """Initialize _BusLoad class."""
+        self._telegram_queue = telegram_queue
+        self._rate = 0.0
+        self._last_count = 0
+        self._last_time: float | None = None
+
+    def rate(self) -> float:
+        """Return average telegrams per second."""
+        now = asyncio.get_running_loop().time()
+        count = self._telegram_queue.bus_telegram_count
+        if self._last_time is None:
+            self._last_time = now
+            self._last_count = count
+            return self._rate
+        elapsed = now - self._last_time
+        if elapsed < self.MIN_SAMPLE_TIME:
+            return self._rate
+        sample = (count - self._last_count) / elapsed
+        self._rate += (1 - math.exp(-elapsed / self.TIME_CONSTANT)) * (
+            sample - self._rate
+        )
+        self._last_time = now
+        self._last_count = count
+        return self._rate
+
+    def time_until(self, rate: float) -> float:
+        """Return seconds until the average falls to `rate` if no more telegrams are received."""
+        if rate <= 0:
+            return math.inf
+        if self._rate <= rate:
+            return 0
+        return self.TIME_CONSTANT * math.log(self._rate / rate)
+
+
+class _TrackerScheduler:
+    """Schedule state reads of _StateTrackers from one heap of expiry times."""
+
+    # telegrams per second a KNX TP1 line can transport
+    BUS_CAPACITY = 40
+    # fraction of BUS_CAPACITY state reads may use
+    MAX_BUS_LOAD = 0.5
+    # telegrams per read - GroupValueRead and GroupValueResponse
+    TELEGRAMS_PER_READ = 2
+
+    def __init__(self, telegram_queue: TelegramQueue, parallel_reads: int) -> None:
+        """Initialize _TrackerScheduler class."""
+        # maximum number of reads waiting for a response
+        self.parallel_reads = parallel_reads
+        # at most one entry per tracker - the entry may be older than `tracker.deadline`
+        self._heap: list[tuple[float, int, _StateTracker]] = []
+        self._counter = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._read_queue: list[tuple[int, int, _StateTracker]] = []
+        self._read_task: asyncio.Task[None] | None = None
+        self._reads: set[asyncio.Task[None]] = set()
+        self._bus_load = _BusLoad(telegram_queue)
+        self._last_read_time = -math.inf
+
+    def schedule(self, tracker: _StateTracker) -> None:
+        """Add a heap entry for the deadline of tracker if it has none."""
+        if tracker.scheduled or tracker.deadline is None:
+            return
+        self._push(tracker, tracker.deadline)
+        self._start_timer()
+
+    def _push(self, tracker: _StateTracker, deadline: float) -> None:
+        """Push heap entry for tracker."""
+        tracker.scheduled = True
+        heapq.heappush(self._heap, (deadline, next(self._counter), tracker))
+
+    def _start_timer(self) -> None:
+        """Start the timer for the earliest heap entry."""
+        if not self._heap:
+            return
+        when = self._heap[0][0]
+        if self._timer is not None:
+            if self._timer.when() <= when:
+                return
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_at(when, self._expire)
+
+    def _expire(self) -> None:
+        """Read states of expired trackers. Reschedule entries of reset trackers."""
+        self._timer = None
+        now = asyncio.get_running_loop().time()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, tracker = heapq.heappop(self._heap)
+            tracker.scheduled = False
+            if tracker.deadline is None:
+                # stopped
+                continue
+            if tracker.deadline > now:
+                # reset since the entry was pushed
+                self._push(tracker, tracker.deadline)
+                continue
+            tracker.deadline = None
+            self.read(tracker)
+        self._start_timer()
+
+    def read(self, tracker: _StateTracker) -> None:
+        """Queue reading the state of tracker."""
+        if tracker.read_pending:
+            return
+        tracker.read_pending = True
+        heapq.heappush(
+            self._read_queue, (tracker.priority, next(self._counter), tracker)
+        )
+        if self._read_task is None:
+            self._read_task = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self) -> None:
+        """Start reads of queued trackers by priority until the queue is empty."""
+        try:
+            while self._read_queue:
+                await self._pace()
+                _, _, tracker = heapq.heappop(self._read_queue)
+                tracker.read_pending = False
+                if not tracker.active:
+                    continue
+                task = asyncio.create_task(self._read(tracker))
+                self._reads.add(task)
+                task.add_done_callback(self._reads.discard)
+        finally:
+            # stop() followed by read() may have started a new task already
+            if self._read_task is asyncio.current_task():
+                self._read_task = None
+
+    async def _pace(self) -> None:
+        """Wait until the bus load allows starting another read."""
+        loop = asyncio.get_running_loop()
+        max_rate = self.BUS_CAPACITY * self.MAX_BUS_LOAD
         while True:
-            await asyncio.sleep(self.update_interval)
-            await self._read_state()
+            if len(self._reads) >= self.parallel_reads:
+                await asyncio.wait(
+                    set(self._reads), return_when=asyncio.FIRST_COMPLETED
+                )
+                continue
+            rate = self._bus_load.rate()
+            headroom = max_rate - rate
+            if headroom > 0:
+                # spread reads so they use at most the remaining headroom
+                delay = (
+                    self._last_read_time
+                    + self.TELEGRAMS_PER_READ / headroom
+                    - loop.time()
+                )
+                if delay <= 0:
+                    break
+                # headroom grows while the bus load decays - measure again when doubled
+                delay = min(delay, self._bus_load.time_until(rate - headroom))
+            else:
+                # wait until the bus load decayed below the limit
+                delay = max(
+                    self._bus_load.time_until(max_rate), _BusLoad.MIN_SAMPLE_TIME
+                )
+            await asyncio.sleep(delay)
+        self._last_read_time = loop.time()
+
+    @staticmethod
+    async def _read(tracker: _StateTracker) -> None:
+        """Read state of tracker. Log exceptions."""
+        try:
+            await tracker.read()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Unexpected error while reading state")
+
+    def stop(self) -> None:
+        """Stop timer and pending reads."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for _, _, tracker in self._heap:
+            tracker.scheduled = False
+        self._heap.clear()
+        for _, _, tracker in self._read_queue:
+            tracker.read_pending = False
+        self._read_queue.clear()
+        if self._read_task is not None:
+            self._read_task.cancel()
+            self._read_task = None
+        for task in self._reads:
+            task.cancel()
@@ -6,16 +6,36 @@ When a device wants to sends a telegram to the KNX bus, it has to queue it to th
 The underlaying KNXIPInterface will poll the queue and send the packets to the correct KNX/IP abstraction (Tunneling or Routing).
 
 You may register callbacks to be notified if a telegram was pushed to the queue.
+
+If `xknx.reconnect_buffer_ttl` is set, outgoing telegrams are kept in a reconnect
+buffer while the connection is lost - only the newest telegram per destination
+address and service. When the connection is reestablished, buffered telegrams not
+older than `xknx.reconnect_buffer_ttl` are sent again.
 """
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 import logging
-from typing import TYPE_CHECKING, Awaitable, Callable
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    SupportsIndex,
+    TypeVar,
+)
 
+from xknx.core.connection_state import XknxConnectionState
 from xknx.exceptions import CommunicationError, XKNXException
-from xknx.telegram import AddressFilter, Telegram, TelegramDirection
-from xknx.telegram.address import GroupAddress, InternalGroupAddress
+from xknx.telegram import AddressFilter, Telegram, TelegramDirection, TelegramPriority
+from xknx.telegram.address import GroupAddress, GroupAddressType, InternalGroupAddress
+from xknx.telegram.apci import GroupValueResponse, GroupValueWrite
+
+from .rate_limiter import RateLimiter
 
 if TYPE_CHECKING:
     from xknx.xknx import XKNX
@@ -25,6 +45,162 @@ if TYPE_CHECKING:
 logger = logging.getLogger("xknx.log")
 telegram_logger = logging.getLogger("xknx.telegram")
 
+_T = TypeVar("_T")
+
+
+class _FilterList(list[_T]):
+    """List of callback filters calling `on_change` after its items were modified."""
+
+    def __init__(self, items: Iterable[_T], on_change: Callable[[], None]) -> None:
+        """Initialize _FilterList."""
+        super().__init__(items)
+        self._on_change = on_change
+
+    def append(self, item: _T) -> None:
+        """Append item to the end of the list."""
+        super().append(item)
+        self._on_change()
+
+    def extend(self, items: Iterable[_T]) -> None:
+        """Extend list by appending items from the iterable."""
+        super().extend(items)
+        self._on_change()
+
+    def insert(self, index: SupportsIndex, item: _T) -> None:
+        """Insert item before index."""
+        super().insert(index, item)
+        self._on_change()
+
+    def remove(self, item: _T) -> None:
+        """Remove first occurrence of item."""
+        super().remove(item)
+        self._on_change()
+
+    def pop(self, index: SupportsIndex = -1) -> _T:
+        """Remove and return item at index."""
+        item = super().pop(index)
+        self._on_change()
+        return item
+
+    def clear(self) -> None:
+        """Remove all items from list."""
+        super().clear()
+        self._on_change()
+
+    def __setitem__(self, index: Any, item: Any) -> None:
+        """Set self[index] to item."""
+        super().__setitem__(index, item)
+        self._on_change()
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        """Delete self[index]."""
+        super().__delitem__(index)
+        self._on_change()
+
+    def __iadd__(self, items: Iterable[_T]) -> _FilterList[_T]:
+        """Implement self += items."""
+        super().__iadd__(items)
+        self._on_change()
+        return self
+
+
+class _OutgoingLanes(asyncio.Queue["Telegram | None"]):
+    """
+    Queue of outgoing telegrams with priority lanes.
+
+    Lanes are drained in this order:
+    * interactive - GroupValueWrite and telegrams with a priority above LOW
+    * responses - GroupValueResponse
+    * background - GroupValueRead (eg. from StateUpdater) and other services
+    A waiting lane is served after it was passed over `MAX_SKIPS` times so lower
+    lanes get a minimum share of the bandwidth.
+    `None` (stop signal) is returned only when all lanes are empty.
+    """
+
+    LANES = 3
+    MAX_SKIPS = 4
+
+    def _init(self, maxsize: int) -> None:
+        """Initialize the lanes. Called from asyncio.Queue.__init__."""
+        self._lanes: tuple[deque[Telegram], ...] = tuple(
+            deque() for _ in range(self.LANES)
+        )
+        self._skipped = [0] * self.LANES
+        self._stop_signals = 0
+
+    @staticmethod
+    def lane(telegram: Telegram) -> int:
+        """Return lane index for telegram."""
+        if telegram.priority is not TelegramPriority.LOW or isinstance(
+            telegram.payload, GroupValueWrite
+        ):
+            return 0
+        if isinstance(telegram.payload, GroupValueResponse):
+            return 1
+        return 2
+
+    def _put(self, item: Telegram | None) -> None:
+        """Put item into its lane."""
+        if item is None:
+            self._stop_signals += 1
+            return
+        self._lanes[self.lane(item)].append(item)
+
+    def _get(self) -> Telegram | None:
+        """Get item from the highest lane or from a lane that was passed over too often."""
+        waiting = [index for index, lane in enumerate(self._lanes) if lane]
+        if not waiting:
+            self._stop_signals -= 1
+            return None
+        chosen = next(
+            (index for index in waiting if self._skipped[index] >= self.MAX_SKIPS),
+            waiting[0],
+        )
+        for index in waiting:
+            self._skipped[index] += 1
+        self._skipped[chosen] = 0
+        return self._lanes[chosen].popleft()
+
+    def qsize(self) -> int:
+        """Number of items in the queue."""
+        return sum(len(lane) for lane in self._lanes) + self._stop_signals
+
+    def empty(self) -> bool:
+        """Return True if the queue is empty."""
+        return not self.qsize()
+
+
+class _ReconnectBuffer:
+    """Outgoing telegrams waiting for the connection - the newest per address and service."""
+
+    def __init__(self) -> None:
+        """Initialize _ReconnectBuffer class."""
+        # set from losing the connection until it is reestablished
+        self.active = False
+        self._telegrams: dict[Hashable, Telegram] = {}
+
+    def __len__(self) -> int:
+        """Return number of buffered telegrams."""
+        return len(self._telegrams)
+
+    def add(self, telegram: Telegram) -> None:
+        """Buffer telegram. Replace an older telegram to the same address and service."""
+        key = (telegram.destination_address, type(telegram.payload))
+        # replaced telegrams move to the end to keep the order of the newest values
+        self._telegrams.pop(key, None)
+        self._telegrams[key] = telegram
+
+    def pop_all(self, ttl: float) -> list[Telegram]:
+        """Remove all telegrams. Return those not older than `ttl` seconds."""
+        oldest = time.monotonic() - ttl
+        telegrams = [
+            telegram
+            for telegram in self._telegrams.values()
+            if telegram.monotonic_time >= oldest
+        ]
+        self._telegrams.clear()
+        return telegrams
+
 
 class TelegramQueue:
     """Class for telegram queue."""
@@ -43,8 +219,86 @@ class TelegramQueue:
             self.callback = callback
             self._match_all = address_filters is None and group_addresses is None
             self._match_outgoing = match_for_outgoing_telegrams
-            self.address_filters = [] if address_filters is None else address_filters
-            self.group_addresses = [] if group_addresses is None else group_addresses
+            # called with self when filters changed - used to update the queues index
+            self.filters_changed_cb: Callable[
+                [TelegramQueue.Callback], None
+            ] | None = None
+            # modifying the lists in place recompiles the filters
+            self._address_filters = _FilterList(
+                [] if address_filters is None else address_filters,
+                self._compile_filters,
+            )
+            self._group_addresses = _FilterList(
+                [] if group_addresses is None else group_addresses,
+                self._compile_filters,
+            )
+            self._group_address_set: frozenset[
+                GroupAddress | InternalGroupAddress
+            ] = frozenset()
+            self._internal_filters: list[AddressFilter] = []
+            self._match_tables: dict[GroupAddressType, bytes] = {}
+            self._compile_filters()
+
+        @property
+        def address_filters(self) -> list[AddressFilter]:
+            """Return address filters."""
+            return self._address_filters
+
+        @address_filters.setter
+        def address_filters(self, address_filters: list[AddressFilter]) -> None:
+            """Set address filters."""
+            self._address_filters = _FilterList(address_filters, self._compile_filters)
+            self._compile_filters()
+
+        @property
+        def group_addresses(self) -> list[GroupAddress | InternalGroupAddress]:
+            """Return group addresses."""
+            return self._group_addresses
+
+        @group_addresses.setter
+        def group_addresses(
+            self, group_addresses: list[GroupAddress | InternalGroupAddress]
+        ) -> None:
+            """Set group addresses."""
+            self._group_addresses = _FilterList(group_addresses, self._compile_filters)
+            self._compile_filters()
+
+        @property
+        def indexable(self) -> bool:
+            """Return if the callback matches only explicit group addresses."""
+            return not self._match_all and not self._address_filters
+
+        def indexed_group_addresses(
+            self,
+        ) -> frozenset[GroupAddress | InternalGroupAddress]:
+            """Return the set of explicit group addresses."""
+            return self._group_address_set
+
+        def _compile_filters(self) -> None:
+            """Prepare lookup structures after filters have changed."""
+            self._group_address_set = frozenset(self._group_addresses)
+            self._internal_filters = [
+                address_filter
+                for address_filter in self._address_filters
+                if address_filter.internal_group_address_pattern
+            ]
+            self._match_tables = {}
+            if self.filters_changed_cb is not None:
+                self.filters_changed_cb(self)
+
+        def _match_table(self, levels: GroupAddressType) -> bytes:
+            """Return combined lookup table of all address filters."""
+            try:
+                return self._match_tables[levels]
+            except KeyError:
+                pass
+            combined = 0
+            for address_filter in self._address_filters:
+                combined |= int.from_bytes(address_filter.match_table(levels), "big")
+            self._match_tables[levels] = combined.to_bytes(
+                GroupAddress.MAX_FREE + 1, "big"
+            )
+            return self._match_tables[levels]
 
         def is_within_filter(self, telegram: Telegram) -> bool:
             """Test if callback is filtering for group address."""
@@ -55,24 +309,49 @@ class TelegramQueue:
                 return False
             if self._match_all:
                 return True
-            if isinstance(
-                telegram.destination_address, (GroupAddress, InternalGroupAddress)
-            ):
-                for address_filter in self.address_filters:
-                    if address_filter.match(telegram.destination_address):
-                        return True
-                for group_address in self.group_addresses:
-                    if telegram.destination_address == group_address:
-                        return True
+            address = telegram.destination_address
+            if isinstance(address, GroupAddress):
+                return address in self._group_address_set or bool(
+                    self._address_filters
+                    and self._match_table(address.levels)[address.raw]
+                )
+            if isinstance(address, InternalGroupAddress):
+                return address in self._group_address_set or any(
+                    address_filter.match(address)
+                    for address_filter in self._internal_filters
+                )
             return False
 
     def __init__(self, xknx: XKNX):
         """Initialize TelegramQueue class."""
         self.xknx = xknx
         self.telegram_received_cbs: list[TelegramQueue.Callback] = []
-        self.outgoing_queue: asyncio.Queue[Telegram | None] = asyncio.Queue()
-        self._consumer_task: Awaitable[tuple[None, None]] | None = None
-        self._rate_limiter: asyncio.Task[None] | None = None
+        # callbacks only matching explicit group addresses are looked up by address
+        self._indexed_cbs: dict[
+            GroupAddress | InternalGroupAddress, list[TelegramQueue.Callback]
+        ] = {}
+        self._unindexed_cbs: list[TelegramQueue.Callback] = []
+        # unindexed and indexed callbacks of an address in order of registration
+        self._address_cbs: dict[
+            GroupAddress | InternalGroupAddress, list[TelegramQueue.Callback]
+        ] = {}
+        self._callback_index_keys: dict[
+            TelegramQueue.Callback, frozenset[GroupAddress | InternalGroupAddress]
+        ] = {}
+        # position in `telegram_received_cbs` - callbacks are run in order of registration
+        self._callback_order: dict[TelegramQueue.Callback, int] = {}
+        self._callback_counter = 0
+        self.outgoing_queue: asyncio.Queue[Telegram | None] = _OutgoingLanes()
+        # newest GroupValueWrite per group address not sent yet - used if `xknx.coalesce_group_writes`
+        self._pending_group_writes: dict[GroupAddress, Telegram] = {}
+        self._consumer_task: Awaitable[list[None]] | None = None
+        # one queue per worker task if incoming telegrams are processed concurrently
+        self._incoming_shards: list[asyncio.Queue[Telegram | None]] = []
+        self.rate_limiter = RateLimiter(xknx)
+        # number of telegrams sent to or received from the bus - used to measure bus load
+        self.bus_telegram_count = 0
+        self._reconnect_buffer = _ReconnectBuffer()
+        self._connected = False
 
     def register_telegram_received_cb(
         self,
@@ -89,6 +368,10 @@ class TelegramQueue:
             match_for_outgoing_telegrams=match_for_outgoing,
         )
         self.telegram_received_cbs.append(callback)
+        self._callback_order[callback] = self._callback_counter
+        self._callback_counter += 1
+        self._index_callback(callback)
+        callback.filters_changed_cb = self._reindex_callback
         return callback
 
     def unregister_telegram_received_cb(
@@ -96,52 +379,182 @@ class TelegramQueue:
     ) -> None:
         """Unregister callback for a telegram beeing received from KNX bus."""
         self.telegram_received_cbs.remove(telegram_received_cb)
+        telegram_received_cb.filters_changed_cb = None
+        self._unindex_callback(telegram_received_cb)
+        del self._callback_order[telegram_received_cb]
+
+    def _index_callback(self, callback: TelegramQueue.Callback) -> None:
+        """Add callback to the lookup structures."""
+        if not callback.indexable:
+            self._unindexed_cbs.append(callback)
+            self._unindexed_cbs.sort(key=self._callback_order.__getitem__)
+            self._merge_address_cbs(self._indexed_cbs)
+            return
+        indexed_addresses = callback.indexed_group_addresses()
+        for group_address in indexed_addresses:
+            address_cbs = self._indexed_cbs.setdefault(group_address, [])
+            address_cbs.append(callback)
+            address_cbs.sort(key=self._callback_order.__getitem__)
+        self._callback_index_keys[callback] = indexed_addresses
+        self._merge_address_cbs(indexed_addresses)
+
+    def _unindex_callback(self, callback: TelegramQueue.Callback) -> None:
+        """Remove callback from the lookup structures."""
+        indexed_addresses = self._callback_index_keys.pop(callback, None)
+        if indexed_addresses is None:
+            self._unindexed_cbs.remove(callback)
+            self._merge_address_cbs(self._indexed_cbs)
+            return
+        for group_address in indexed_addresses:
+            address_cbs = self._indexed_cbs[group_address]
+            address_cbs.remove(callback)
+            if not address_cbs:
+                del self._indexed_cbs[group_address]
+        self._merge_address_cbs(indexed_addresses)
+
+    def _merge_address_cbs(
+        self, addresses: Iterable[GroupAddress | InternalGroupAddress]
+    ) -> None:
+        """Update the callbacks run for telegrams to addresses."""
+        for group_address in list(addresses):
+            indexed_cbs = self._indexed_cbs.get(group_address)
+            if indexed_cbs is None:
+                self._address_cbs.pop(group_address, None)
+                continue
+            self._address_cbs[group_address] = sorted(
+                self._unindexed_cbs + indexed_cbs,
+                key=self._callback_order.__getitem__,
+            )
+
+    def _reindex_callback(self, callback: TelegramQueue.Callback) -> None:
+        """Update lookup structures after filters of a callback changed."""
+        self._unindex_callback(callback)
+        self._index_callback(callback)
+
+    @property
+    def incoming_queue_depths(self) -> list[int]:
+        """Return number of incoming telegrams waiting for each worker."""
+        return [shard.qsize() for shard in self._incoming_shards]
 
     async def start(self) -> None:
         """Start telegram queue."""
+        workers = self.xknx.incoming_workers
+        self._incoming_shards = (
+            [asyncio.Queue() for _ in range(workers)] if workers > 1 else []
+        )
+        self._connected = self.xknx.connection_manager.state is (
+            XknxConnectionState.CONNECTED
+        )
+        self.xknx.connection_manager.register_connection_state_changed_cb(
+            self._connection_state_changed
+        )
         self._consumer_task = asyncio.gather(
-            self._telegram_consumer(), self._outgoing_rate_limiter()
+            self._telegram_consumer(),
+            self._outgoing_rate_limiter(),
+            *(self._incoming_worker(shard) for shard in self._incoming_shards),
         )
 
     async def stop(self) -> None:
         """Stop telegram queue."""
         logger.debug("Stopping TelegramQueue")
+        self.xknx.connection_manager.unregister_connection_state_changed_cb(
+            self._connection_state_changed
+        )
         # If a None object is pushed to the queue, the queue stops
         await self.xknx.telegrams.put(None)
         if self._consumer_task is not None:
             await self._consumer_task
 
+    async def _connection_state_changed(self, state: XknxConnectionState) -> None:
+        """Buffer outgoing telegrams while the connection is lost. Send them when reconnected."""
+        if state is XknxConnectionState.CONNECTED:
+            self._connected = True
+            self._reconnect_buffer.active = False
+            self._replay_reconnect_buffer()
+        elif self._connected:
+            self._connected = False
+            self._reconnect_buffer.active = bool(self.xknx.reconnect_buffer_ttl)
+
+    def _replay_reconnect_buffer(self) -> None:
+        """Queue buffered telegrams that didn't expire."""
+        buffered = len(self._reconnect_buffer)
+        if not buffered:
+            return
+        telegrams = self._reconnect_buffer.pop_all(self.xknx.reconnect_buffer_ttl)
+        logger.debug(
+            "Sending %s telegrams buffered during reconnect, %s expired",
+            len(telegrams),
+            buffered - len(telegrams),
+        )
+        # outgoing telegrams never wait for room in `xknx.telegrams` - this doesn't
+        # block the connection state callbacks
+        for telegram in telegrams:
+            self.xknx.telegrams.put_nowait(telegram)
+
     async def _telegram_consumer(self) -> None:
         """Endless loop for processing telegrams."""
         while True:
             telegram = await self.xknx.telegrams.get()
             # Breaking up queue if None is pushed to the queue
             if telegram is None:
+                for shard in self._incoming_shards:
+                    shard.put_nowait(None)
                 self.outgoing_queue.put_nowait(None)
                 await self.outgoing_queue.join()
                 self.xknx.telegrams.task_done()
                 break
 
             if telegram.direction == TelegramDirection.INCOMING:
+                if self._incoming_shards:
+                    # counts against `telegram_queue_size` until the worker is done with it
+                    self.xknx.telegrams.hold()
+                    # same destination address - same worker to keep the order
+                    self._incoming_shards[
+                        hash(telegram.destination_address) % len(self._incoming_shards)
+                    ].put_nowait(telegram)
+                    # self.xknx.telegrams.task_done() is called in _incoming_worker.
+                    continue
                 try:
-                    await self.process_telegram_incoming(telegram)
-                except XKNXException:
-                    logger.exception(
-                        "Unexpected xknx error while processing incoming telegram %s",
-                        telegram,
-                    )
-                except Exception:  # pylint: disable=broad-except
-                    # prevent the parser Task from stalling when unexpected errors occur
-                    logger.exception(
-                        "Unexpected error while processing incoming telegram %s",
-                        telegram,
-                    )
+                    await self._process_incoming(telegram)
                 finally:
                     self.xknx.telegrams.task_done()
             elif telegram.direction == TelegramDirection.OUTGOING:
+                if self._coalesce_outgoing(telegram):
+                    self.xknx.telegrams.task_done()
+                    continue
                 self.outgoing_queue.put_nowait(telegram)
                 # self.xknx.telegrams.task_done() for outgoing is called in _outgoing_rate_limiter.
 
+    async def _incoming_worker(self, shard: asyncio.Queue[Telegram | None]) -> None:
+        """Endless loop for processing incoming telegrams of one shard."""
+        while True:
+            telegram = await shard.get()
+            if telegram is None:
+                shard.task_done()
+                break
+            try:
+                await self._process_incoming(telegram)
+            finally:
+                shard.task_done()
+                self.xknx.telegrams.release()
+                self.xknx.telegrams.task_done()
+
+    async def _process_incoming(self, telegram: Telegram) -> None:
+        """Process incoming telegram. Log exceptions."""
+        try:
+            await self.process_telegram_incoming(telegram)
+        except XKNXException:
+            logger.exception(
+                "Unexpected xknx error while processing incoming telegram %s",
+                telegram,
+            )
+        except Exception:  # pylint: disable=broad-except
+            # prevent the parser Task from stalling when unexpected errors occur
+            logger.exception(
+                "Unexpected error while processing incoming telegram %s",
+                telegram,
+            )
+
     async def _outgoing_rate_limiter(self) -> None:
         """Endless loop for processing outgoing telegrams."""
         while True:
@@ -149,24 +562,36 @@ class TelegramQueue:
             # Breaking up queue if None is pushed to the queue
             if telegram is None:
                 self.outgoing_queue.task_done()
-                if self._rate_limiter:
-                    self._rate_limiter.cancel()
                 break
 
+            to_bus = not isinstance(telegram.destination_address, InternalGroupAddress)
             # limit rate to knx bus - defaults to 20 per second
-            if self.xknx.rate_limit and not isinstance(
-                telegram.destination_address, InternalGroupAddress
+            # pauses (eg. ROUTING_BUSY) apply even if rate_limit is 0
+            if to_bus:
+                await self.rate_limiter.wait(telegram)
+
+            if (
+                self._pending_group_writes
+                and isinstance(telegram.payload, GroupValueWrite)
+                and isinstance(telegram.destination_address, GroupAddress)
             ):
-                if self._rate_limiter is not None:
-                    await self._rate_limiter
-                self._rate_limiter = asyncio.create_task(
-                    asyncio.sleep(1 / self.xknx.rate_limit)
+                # send the newest value received while this telegram was waiting
+                newest = self._pending_group_writes.pop(
+                    telegram.destination_address, None
                 )
+                if newest is not None:
+                    telegram = newest
 
             try:
+                if to_bus and self._reconnect_buffer.active:
+                    self._reconnect_buffer.add(telegram)
+                    continue
                 await self.process_telegram_outgoing(telegram)
             except CommunicationError as ex:
-                if ex.should_log:
+                if to_bus and self._reconnect_buffer.active:
+                    # send again when the connection is reestablished
+                    self._reconnect_buffer.add(telegram)
+                elif ex.should_log:
                     logger.warning(ex)
             except XKNXException as ex:
                 logger.error("Error while processing outgoing telegram %s", ex)
@@ -179,6 +604,26 @@ class TelegramQueue:
                 self.outgoing_queue.task_done()
                 self.xknx.telegrams.task_done()
 
+    def _coalesce_outgoing(self, telegram: Telegram) -> bool:
+        """
+        Replace a pending GroupValueWrite to the same group address by telegram.
+
+        Return True if telegram was coalesced and must not be queued.
+        """
+        if not (
+            self.xknx.coalesce_group_writes
+            and isinstance(telegram.payload, GroupValueWrite)
+            and isinstance(telegram.destination_address, GroupAddress)
+        ):
+            return False
+        coalesced = telegram.destination_address in self._pending_group_writes
+        if coalesced:
+            logger.debug(
+                "Replacing pending GroupValueWrite to %s", telegram.destination_address
+            )
+        self._pending_group_writes[telegram.destination_address] = telegram
+        return coalesced
+
     async def _process_all_telegrams(self) -> None:
         """Process all telegrams being queued. Used in unit tests."""
         while not self.xknx.telegrams.empty():
@@ -202,6 +647,7 @@ class TelegramQueue:
             if self.xknx.knxip_interface is None:
                 raise CommunicationError("No KNXIP interface defined")
             await self.xknx.knxip_interface.send_telegram(telegram)
+            self.bus_telegram_count += 1
 
         await self.xknx.devices.process(telegram)
         await self._run_telegram_received_cbs(telegram)
@@ -209,15 +655,19 @@ class TelegramQueue:
     async def process_telegram_incoming(self, telegram: Telegram) -> None:
         """Process incoming telegram."""
         telegram_logger.debug(telegram)
+        self.bus_telegram_count += 1
         await self._run_telegram_received_cbs(telegram)
         await self.xknx.devices.process(telegram)
 
     async def _run_telegram_received_cbs(self, telegram: Telegram) -> None:
         """Run registered callbacks. Don't propagate exceptions."""
+        candidates = self._unindexed_cbs
+        if isinstance(
+            telegram.destination_address, (GroupAddress, InternalGroupAddress)
+        ):
+            candidates = self._address_cbs.get(telegram.destination_address, candidates)
         callbacks = [
-            cb.callback(telegram)
-            for cb in self.telegram_received_cbs
-            if cb.is_within_filter(telegram)
+            cb.callback(telegram) for cb in candidates if cb.is_within_filter(telegram)
         ]
         try:
             await asyncio.gather(*callbacks)
@@ -144,6 +144,12 @@ class Climate(Device):
         yield self.active
         yield self.command_value
 
+    def group_addresses(self) -> Iterator[DeviceGroupAddress]:
+        """Yield all group addresses the device listens on."""
+        yield from super().group_addresses()
+        if self.mode is not None:
+            yield from self.mode.group_addresses()
+
     def has_group_address(self, group_address: DeviceGroupAddress) -> bool:
         """Test if device has given group address."""
         if self.mode is not None and self.mode.has_group_address(group_address):
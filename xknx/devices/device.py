@@ -121,6 +121,11 @@ class Device(ABC):
         """Return name of device."""
         return self.name
 
+    def group_addresses(self) -> Iterator[DeviceGroupAddress]:
+        """Yield all group addresses the device listens on."""
+        for remote_value in self._iter_remote_values():
+            yield from remote_value.group_addresses()
+
     def has_group_address(self, group_address: DeviceGroupAddress) -> bool:
         """Test if device has given group address."""
         for remote_value in self._iter_remote_values():
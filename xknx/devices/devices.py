@@ -21,6 +21,7 @@ class Devices:
     def __init__(self) -> None:
         """Initialize Devices class."""
         self.__devices: list[Device] = []
+        self.__group_address_index: dict[DeviceGroupAddress, list[Device]] | None = None
         self.device_updated_cbs: list[DeviceCallbackType] = []
 
     def register_device_updated_cb(self, device_updated_cb: DeviceCallbackType) -> None:
@@ -37,13 +38,25 @@ class Devices:
         """Iterate registered devices."""
         yield from self.__devices
 
+    def invalidate_group_address_index(self) -> None:
+        """Drop the group address index. It is rebuilt on next lookup."""
+        self.__group_address_index = None
+
+    def _group_address_index(self) -> dict[DeviceGroupAddress, list[Device]]:
+        """Return index of group addresses to devices listening on them."""
+        if self.__group_address_index is None:
+            index: dict[DeviceGroupAddress, list[Device]] = {}
+            for device in self.__devices:
+                for group_address in dict.fromkeys(device.group_addresses()):
+                    index.setdefault(group_address, []).append(device)
+            self.__group_address_index = index
+        return self.__group_address_index
+
     def devices_by_group_address(
         self, group_address: DeviceGroupAddress
     ) -> Iterator[Device]:
         """Return device(s) by group address."""
-        for device in self.__devices:
-            if device.has_group_address(group_address):
-                yield device
+        yield from self._group_address_index().get(group_address, ())
 
     def __getitem__(self, key: str | int) -> Device:
         """Return device by name or by index."""
@@ -71,10 +84,12 @@ class Devices:
             raise TypeError()
         device.register_device_updated_cb(self.device_updated)
         self.__devices.append(device)
+        self.invalidate_group_address_index()
 
     def remove(self, device: Device) -> None:
         """Remove device from devices vector."""
         self.__devices.remove(device)
+        self.invalidate_group_address_index()
 
     async def device_updated(self, device: Device) -> None:
         """Call all registered device updated callbacks of device."""
@@ -4,11 +4,28 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from inspect import isabstract
 from typing import Any, Iterator, TypeVar, cast
+import weakref
 
 from xknx.exceptions import ConversionError
 
 T = TypeVar("T", bound=type["DPTBase"])  # pylint: disable=invalid-name
 
+# lookup tables of concrete subclasses per base class - built on first lookup,
+# cleared when a subclass is defined or garbage collected. They only hold weak
+# references so they don't keep subclasses alive.
+_DPT_NUMBER_INDEX: weakref.WeakKeyDictionary[
+    type[DPTBase], weakref.WeakValueDictionary[tuple[int, int | None], type[DPTBase]]
+] = weakref.WeakKeyDictionary()
+_VALUE_TYPE_INDEX: weakref.WeakKeyDictionary[
+    type[DPTBase], weakref.WeakValueDictionary[str, type[DPTBase]]
+] = weakref.WeakKeyDictionary()
+
+
+def _clear_transcoder_indexes() -> None:
+    """Clear transcoder lookup tables so they are rebuilt from current subclasses."""
+    _DPT_NUMBER_INDEX.clear()
+    _VALUE_TYPE_INDEX.clear()
+
 
 class DPTBase(ABC):
     """
@@ -78,6 +95,12 @@ class DPTBase(ABC):
         ):
             raise ConversionError("Invalid raw bytes", raw=raw)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Invalidate transcoder lookup tables when a subclass is defined or removed."""
+        super().__init_subclass__(**kwargs)
+        _clear_transcoder_indexes()
+        weakref.finalize(cls, _clear_transcoder_indexes).atexit = False
+
     @classmethod
     def __recursive_subclasses__(cls: T) -> Iterator[T]:
         """Yield all subclasses and their subclasses."""
@@ -96,25 +119,50 @@ class DPTBase(ABC):
         """Return True if value_type is defined (not inherited)."""
         return "value_type" in cls.__dict__
 
+    @classmethod
+    def _dpt_number_index(
+        cls,
+    ) -> weakref.WeakValueDictionary[tuple[int, int | None], type[DPTBase]]:
+        """Return subclasses with distinct DPT numbers by (main, sub) number."""
+        try:
+            return _DPT_NUMBER_INDEX[cls]
+        except KeyError:
+            index: weakref.WeakValueDictionary[
+                tuple[int, int | None], type[DPTBase]
+            ] = weakref.WeakValueDictionary()
+            for dpt in cls.__recursive_subclasses__():
+                if dpt.has_distinct_dpt_numbers() and dpt.dpt_main_number is not None:
+                    # first match wins - same order as iterating subclasses
+                    index.setdefault((dpt.dpt_main_number, dpt.dpt_sub_number), dpt)
+            _DPT_NUMBER_INDEX[cls] = index
+            return index
+
+    @classmethod
+    def _value_type_index(cls) -> weakref.WeakValueDictionary[str, type[DPTBase]]:
+        """Return subclasses with distinct value_type by value_type."""
+        try:
+            return _VALUE_TYPE_INDEX[cls]
+        except KeyError:
+            index: weakref.WeakValueDictionary[
+                str, type[DPTBase]
+            ] = weakref.WeakValueDictionary()
+            for dpt in cls.__recursive_subclasses__():
+                if dpt.has_distinct_value_type() and dpt.value_type is not None:
+                    index.setdefault(dpt.value_type, dpt)
+            _VALUE_TYPE_INDEX[cls] = index
+            return index
+
     @classmethod
     def transcoder_by_dpt(
         cls: T, dpt_main: int, dpt_sub: int | None = None
     ) -> T | None:
         """Return Class reference of DPTBase subclass with matching DPT number."""
-        for dpt in cls.__recursive_subclasses__():
-            if dpt.has_distinct_dpt_numbers():
-                if dpt_main == dpt.dpt_main_number and dpt_sub == dpt.dpt_sub_number:
-                    return dpt
-        return None
+        return cast("T | None", cls._dpt_number_index().get((dpt_main, dpt_sub)))
 
     @classmethod
     def transcoder_by_value_type(cls: T, value_type: str) -> T | None:
         """Return Class reference of DPTBase subclass with matching value_type."""
-        for dpt in cls.__recursive_subclasses__():
-            if dpt.has_distinct_value_type():
-                if value_type == dpt.value_type:
-                    return dpt
-        return None
+        return cast("T | None", cls._value_type_index().get(value_type))
 
     @classmethod
     def parse_transcoder(cls: T, value_type: int | str) -> T | None:
@@ -160,6 +208,8 @@ class DPTNumeric(DPTBase):
 class DPTBinary:
     """The DPTBinary is a base class for all datatypes encoded directly into the last 6 bit of the APCI (mostly integer)."""
 
+    __slots__ = ("value",)
+
     # APCI (application layer control information)
     APCI_BITMASK = 0x3F
     APCI_MAX_VALUE = APCI_BITMASK
@@ -193,12 +243,16 @@ class DPTBinary:
 class DPTArray:
     """The DPTArray is a base class for all datatypes appended to the KNX telegram."""
 
-    def __init__(self, value: int | bytes | tuple[int, ...] | list[int]) -> None:
+    __slots__ = ("value",)
+
+    def __init__(
+        self, value: int | bytes | memoryview | tuple[int, ...] | list[int]
+    ) -> None:
         """Initialize DPTArray class."""
         self.value: tuple[int, ...]
         if isinstance(value, int):
             self.value = (value,)
-        elif isinstance(value, (list, bytes)):
+        elif isinstance(value, (list, bytes, bytearray, memoryview)):
             self.value = tuple(value)
         elif isinstance(value, tuple):
             self.value = value
@@ -5,15 +5,19 @@ This package contains all objects managing Tunneling and Routing Connections..
 - GatewayScanner searches for available KNX/IP devices in the local network.
 - Routing uses UDP/Multicast to communicate with KNX/IP device.
 - Tunnel uses UDP packets and builds a static tunnel with KNX/IP device.
+- TunnelPool uses multiple tunnels to the same KNX/IP device.
+- MultiGateway connects to multiple KNX/IP devices at once.
 """
 # flake8: noqa
 from .connection import ConnectionConfig, ConnectionType
 from .const import DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT
 from .gateway_scanner import GatewayDescriptor, GatewayScanFilter, GatewayScanner
 from .knxip_interface import KNXIPInterface, knx_interface_factory
+from .multi_gateway import MultiGateway
 from .routing import Routing
 from .self_description import DescriptionQuery
 from .tunnel import TCPTunnel, UDPTunnel
+from .tunnel_pool import TunnelPool
 
 __all__ = [
     "DEFAULT_MCAST_GRP",
@@ -24,7 +28,9 @@ __all__ = [
     "ConnectionConfig",
     "ConnectionType",
     "KNXIPInterface",
+    "MultiGateway",
     "Routing",
     "TCPTunnel",
+    "TunnelPool",
     "UDPTunnel",
 ]
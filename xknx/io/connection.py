@@ -2,10 +2,14 @@
 from __future__ import annotations
 
 from enum import Enum, auto
+from typing import TYPE_CHECKING
 
 from .const import DEFAULT_MCAST_PORT
 from .gateway_scanner import GatewayScanFilter
 
+if TYPE_CHECKING:
+    from xknx.telegram.address import GroupAddressableType
+
 
 class ConnectionType(Enum):
     """Enum class for different types of KNX/IP Connections."""
@@ -33,8 +37,26 @@ class ConnectionConfig:
         The KNXnet/IP Server shall use the IP address and port in the received IP package
         as the target IP address or port number for the response to the KNXnet/IP Client.
     * auto_reconnect: Auto reconnect to KNX/IP tunneling device if connection cannot be established.
-    * auto_reconnect_wait: Wait n seconds before trying to reconnect to KNX/IP tunneling device.
+    * auto_reconnect_wait: Wait n seconds before the second attempt to reconnect to KNX/IP tunneling
+        device. The first attempt is immediate, the wait time doubles for every further attempt.
     * scan_filter: For AUTOMATIC connection, limit scan with the given filter
+    * send_window_size: For TUNNELING and TUNNELING_TCP connections. Number of telegrams
+        sent before receiving their confirmation. Only use values > 1 with
+        tunnelling servers supporting it.
+    * tunnel_pool_size: For TUNNELING and TUNNELING_TCP connections. Number of tunnels
+        opened to the KNX/IP interface. Outgoing telegrams are distributed by destination
+        address; if a tunnel is disconnected the remaining tunnels are used.
+    * batch_receive: For ROUTING connection. Read and parse all pending datagrams at once
+        and put the received telegrams into the queue together.
+    * gateways: Connect to multiple KNX/IP interfaces at once - one ConnectionConfig per
+        interface. All other options of this ConnectionConfig are ignored. Received telegrams
+        of all interfaces are merged. Outgoing group telegrams are sent to the interfaces
+        configured in `group_addresses` or learned from received telegrams - to all
+        interfaces if the group address is unknown.
+    * group_addresses: For gateways of a multi-gateway connection. Group addresses sent
+        to this KNX/IP interface. Takes precedence over learned group addresses.
+    * rate_limit: For gateways of a multi-gateway connection. Maximum number of telegrams
+        sent to this KNX/IP interface per second. 0 for no limit.
     """
 
     def __init__(
@@ -49,6 +71,12 @@ class ConnectionConfig:
         auto_reconnect_wait: int = 3,
         scan_filter: GatewayScanFilter = GatewayScanFilter(),
         threaded: bool = False,
+        batch_receive: bool = False,
+        send_window_size: int = 1,
+        tunnel_pool_size: int = 1,
+        gateways: list[ConnectionConfig] | None = None,
+        group_addresses: list[GroupAddressableType] | None = None,
+        rate_limit: float = 0,
     ):
         """Initialize ConnectionConfig class."""
         self.connection_type = connection_type
@@ -61,6 +89,12 @@ class ConnectionConfig:
         self.auto_reconnect_wait = auto_reconnect_wait
         self.scan_filter = scan_filter
         self.threaded = threaded
+        self.batch_receive = batch_receive
+        self.send_window_size = send_window_size
+        self.tunnel_pool_size = tunnel_pool_size
+        self.gateways = gateways or []
+        self.group_addresses = group_addresses or []
+        self.rate_limit = rate_limit
 
     def __eq__(self, other: object) -> bool:
         """Equality for ConnectionConfig class (used in unit tests)."""
@@ -3,6 +3,9 @@
 DEFAULT_MCAST_GRP = "224.0.23.12"
 DEFAULT_MCAST_PORT = 3671
 
+# maximum number of datagrams read from a socket at once in batch receive mode
+RECEIVE_BATCH_SIZE = 64
+
 CONNECTION_ALIVE_TIME = 120
 CONNECTIONSTATE_REQUEST_TIMEOUT = 10
 HEARTBEAT_RATE = CONNECTION_ALIVE_TIME - (CONNECTIONSTATE_REQUEST_TIMEOUT * 5)
@@ -5,14 +5,36 @@ Abstract base for a specific KNX/IP connection (Tunneling or Routing).
 * It starts and stops a udp transport
 * It packs Telegrams into KNX Frames and passes them to a udp transport
 """
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
+from xknx.core import XknxConnectionState
+from xknx.core.connection_manager import AsyncConnectionStateCallback
 from xknx.telegram import Telegram
 
+if TYPE_CHECKING:
+    from xknx.xknx import XKNX
+
 
 class Interface(ABC):
     """Abstract base class for KNX/IP connections."""
 
+    xknx: XKNX
+    # called instead of `xknx.connection_manager.connection_state_changed` if set
+    connection_state_changed_cb: AsyncConnectionStateCallback | None = None
+    # only the primary tunnel sets `xknx.current_address` - False for all but the
+    # first tunnel of a TunnelPool or gateway of a MultiGateway
+    primary: bool = True
+
+    async def _connection_state_changed(self, state: XknxConnectionState) -> None:
+        """Report connection state of the interface."""
+        if self.connection_state_changed_cb is not None:
+            await self.connection_state_changed_cb(state)
+        else:
+            await self.xknx.connection_manager.connection_state_changed(state)
+
     @abstractmethod
     async def connect(self) -> bool:
         """Connect to KNX bus. Returns True on success."""
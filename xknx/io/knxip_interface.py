@@ -11,24 +11,29 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
-from typing import TYPE_CHECKING, Awaitable, TypeVar
+from typing import TYPE_CHECKING, Awaitable, Callable, TypeVar
 
 from xknx.exceptions import CommunicationError, XKNXException
 
 from .connection import ConnectionConfig, ConnectionType
 from .gateway_scanner import GatewayDescriptor, GatewayScanFilter, GatewayScanner
+from .multi_gateway import MultiGateway
 from .routing import Routing
 from .tunnel import TCPTunnel, UDPTunnel, _Tunnel
+from .tunnel_pool import TunnelPool
 from .util import find_local_ip, validate_ip
 
 if TYPE_CHECKING:
     import concurrent
 
+    from xknx.core.connection_manager import AsyncConnectionStateCallback
     from xknx.telegram import Telegram
     from xknx.xknx import XKNX
 
     from .interface import Interface
 
+    TelegramCallbackType = Callable[[Telegram], None]
+
 logger = logging.getLogger("xknx.log")
 
 T = TypeVar("T")  # pylint: disable=invalid-name
@@ -56,6 +61,10 @@ class KNXIPInterface:
         self.connection_config = connection_config
         self._gateway_info: GatewayDescriptor | None = None
         self._interface: Interface | None = None
+        # set by MultiGateway to receive telegrams and connection states of this gateway
+        self.telegram_received_callback: TelegramCallbackType | None = None
+        self.connection_state_changed_cb: AsyncConnectionStateCallback | None = None
+        self.primary = True
 
     async def start(self) -> None:
         """Start KNX/IP interface. Raise `CommunicationError` if connection fails."""
@@ -63,7 +72,9 @@ class KNXIPInterface:
 
     async def _start(self) -> None:
         """Start interface. Connecting KNX/IP device with the selected method."""
-        if self.connection_config.connection_type == ConnectionType.ROUTING:
+        if self.connection_config.gateways:
+            await self._start_multi_gateway()
+        elif self.connection_config.connection_type == ConnectionType.ROUTING:
             await self._start_routing(local_ip=self.connection_config.local_ip)
         elif (
             self.connection_config.connection_type == ConnectionType.TUNNELING
@@ -124,15 +135,22 @@ class KNXIPInterface:
             gateway_ip,
             gateway_port,
         )
-        self._interface = TCPTunnel(
-            self.xknx,
-            gateway_ip=gateway_ip,
-            gateway_port=gateway_port,
-            telegram_received_callback=self.telegram_received,
-            auto_reconnect=auto_reconnect,
-            auto_reconnect_wait=auto_reconnect_wait,
+        await self._connect_interface(
+            self._pool_tunnels(
+                [
+                    TCPTunnel(
+                        self.xknx,
+                        gateway_ip=gateway_ip,
+                        gateway_port=gateway_port,
+                        telegram_received_callback=self.telegram_received,
+                        auto_reconnect=auto_reconnect,
+                        auto_reconnect_wait=auto_reconnect_wait,
+                        send_window_size=self.connection_config.send_window_size,
+                    )
+                    for _ in range(self.connection_config.tunnel_pool_size)
+                ]
+            )
         )
-        await self._interface.connect()
 
     async def _start_tunnelling_udp(
         self,
@@ -156,18 +174,34 @@ class KNXIPInterface:
             gateway_ip,
             gateway_port,
         )
-        self._interface = UDPTunnel(
-            self.xknx,
-            gateway_ip=gateway_ip,
-            gateway_port=gateway_port,
-            local_ip=local_ip,
-            local_port=local_port,
-            route_back=route_back,
-            telegram_received_callback=self.telegram_received,
-            auto_reconnect=auto_reconnect,
-            auto_reconnect_wait=auto_reconnect_wait,
+        await self._connect_interface(
+            self._pool_tunnels(
+                [
+                    UDPTunnel(
+                        self.xknx,
+                        gateway_ip=gateway_ip,
+                        gateway_port=gateway_port,
+                        local_ip=local_ip,
+                        # every tunnel needs its own port
+                        local_port=local_port + index if local_port else 0,
+                        route_back=route_back,
+                        telegram_received_callback=self.telegram_received,
+                        auto_reconnect=auto_reconnect,
+                        auto_reconnect_wait=auto_reconnect_wait,
+                        send_window_size=self.connection_config.send_window_size,
+                    )
+                    for index in range(self.connection_config.tunnel_pool_size)
+                ]
+            )
+        )
+
+    def _pool_tunnels(self, tunnels: list[_Tunnel]) -> Interface:
+        """Return a TunnelPool for multiple tunnels."""
+        if len(tunnels) == 1:
+            return tunnels[0]
+        return TunnelPool(
+            self.xknx, tunnels, telegram_received_callback=self.telegram_received
         )
-        await self._interface.connect()
 
     async def _start_routing(self, local_ip: str | None = None) -> None:
         """Start KNX/IP Routing."""
@@ -178,8 +212,38 @@ class KNXIPInterface:
             self._gateway_info = _gateway
         validate_ip(local_ip, address_name="Local IP address")
         logger.debug("Starting Routing from %s as %s", local_ip, self.xknx.own_address)
-        self._interface = Routing(self.xknx, self.telegram_received, local_ip)
-        await self._interface.connect()
+        await self._connect_interface(
+            Routing(
+                self.xknx,
+                self.telegram_received,
+                local_ip,
+                batch_receive=self.connection_config.batch_receive,
+                telegrams_received_callback=self.telegrams_received,
+            )
+        )
+
+    async def _start_multi_gateway(self) -> None:
+        """Connect to all gateways of the connection config."""
+        logger.debug(
+            "Starting connections to %s gateways", len(self.connection_config.gateways)
+        )
+        await self._connect_interface(
+            MultiGateway(
+                self.xknx,
+                [
+                    KNXIPInterface(self.xknx, connection_config=gateway_config)
+                    for gateway_config in self.connection_config.gateways
+                ],
+                telegram_received_callback=self.telegram_received,
+            )
+        )
+
+    async def _connect_interface(self, interface: Interface) -> None:
+        """Connect interface."""
+        self._interface = interface
+        interface.connection_state_changed_cb = self.connection_state_changed_cb
+        interface.primary = self.primary
+        await interface.connect()
 
     async def stop(self) -> None:
         """Stop connected interfae (either Tunneling or Routing)."""
@@ -189,8 +253,16 @@ class KNXIPInterface:
 
     def telegram_received(self, telegram: Telegram) -> None:
         """Put received telegram into queue. Callback for having received telegram."""
+        if self.telegram_received_callback is not None:
+            self.telegram_received_callback(telegram)
+            return
         self.xknx.telegrams.put_nowait(telegram)
 
+    def telegrams_received(self, telegrams: list[Telegram]) -> None:
+        """Put received telegrams into queue. Callback for having received a batch of telegrams."""
+        for telegram in telegrams:
+            self.telegram_received(telegram)
+
     async def send_telegram(self, telegram: "Telegram") -> None:
         """Send telegram to connected device (either Tunneling or Routing)."""
         if self._interface is None:
@@ -203,6 +275,10 @@ class KNXIPInterface:
             return self._gateway_info
         if isinstance(self._interface, _Tunnel):
             return await self._interface.request_description()
+        if isinstance(self._interface, TunnelPool):
+            return await self._interface.tunnels[0].request_description()
+        if isinstance(self._interface, MultiGateway):
+            return await self._interface.gateways[0].gateway_info()
         return None
 
     async def find_gateway(
@@ -280,6 +356,15 @@ class KNXIPInterfaceThreaded(KNXIPInterface):
         """Put received telegram into queue. Callback for having received telegram."""
         self._main_loop.call_soon_threadsafe(self.xknx.telegrams.put_nowait, telegram)
 
+    def telegrams_received(self, telegrams: list[Telegram]) -> None:
+        """Put received telegrams into queue. Callback for having received a batch of telegrams."""
+        self._main_loop.call_soon_threadsafe(self._put_telegrams, telegrams)
+
+    def _put_telegrams(self, telegrams: list[Telegram]) -> None:
+        """Put telegrams into queue. Called in the main loop."""
+        for telegram in telegrams:
+            self.xknx.telegrams.put_nowait(telegram)
+
     async def send_telegram(self, telegram: "Telegram") -> None:
         """Send telegram to connected device (either Tunneling or Routing)."""
         if self._interface is None:
@@ -0,0 +1,206 @@
+"""
+Abstraction for connecting to multiple KNX/IP interfaces at once.
+
+Installations segmented into lines behind separate KNX/IP interfaces are handled
+by one XKNX instance. Every gateway is connected with its own KNXIPInterface.
+Received telegrams of all gateways are passed to the same callback.
+
+Outgoing group telegrams are sent to the gateways configured for their group
+address in `ConnectionConfig.group_addresses`. Otherwise they are sent to the
+gateways a telegram to this group address was received from - or to all gateways
+if the group address is unknown. Individually addressed telegrams are sent to the
+gateway the line of the destination was seen on. Every gateway has its own bounded
+send queue and rate limit so a slow or rate limited gateway doesn't delay telegrams
+sent only to other gateways. Errors of sending a telegram are raised to the caller
+of `send_telegram()`.
+"""
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+import logging
+from typing import TYPE_CHECKING, Callable
+
+from xknx.core import XknxConnectionState
+from xknx.core.rate_limiter import TokenBucket
+from xknx.exceptions import CommunicationError, XKNXException
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram
+
+from .interface import Interface
+
+if TYPE_CHECKING:
+    from xknx.xknx import XKNX
+
+    from .knxip_interface import KNXIPInterface
+
+    TelegramCallbackType = Callable[[Telegram], None]
+
+logger = logging.getLogger("xknx.log")
+
+
+class MultiGateway(Interface):
+    """Class for sending and receiving telegrams over multiple KNX/IP interfaces."""
+
+    # telegrams waiting to be sent per gateway
+    GATEWAY_QUEUE_SIZE = 2
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        gateways: list[KNXIPInterface],
+        telegram_received_callback: TelegramCallbackType | None = None,
+    ):
+        """Initialize MultiGateway class."""
+        self.xknx = xknx
+        self.gateways = gateways
+        self.telegram_received_callback = telegram_received_callback
+        # indices of gateways per group address - learned from received telegrams
+        self.learned_group_addresses: dict[GroupAddress, set[int]] = {}
+        # index of gateway per line (area, main) - learned from source addresses
+        self.learned_lines: dict[tuple[int, int], int] = {}
+        self._configured_group_addresses: dict[GroupAddress, set[int]] = {}
+        self._states = [XknxConnectionState.DISCONNECTED] * len(gateways)
+        # telegrams and futures for the result of sending them
+        self._queues: list[asyncio.Queue[tuple[Telegram, asyncio.Future[None]]]] = [
+            asyncio.Queue(maxsize=self.GATEWAY_QUEUE_SIZE) for _ in gateways
+        ]
+        self._buckets = [TokenBucket(xknx.rate_limit_burst) for _ in gateways]
+        self._senders: list[asyncio.Task[None]] = []
+
+        for index, gateway in enumerate(gateways):
+            for address in gateway.connection_config.group_addresses:
+                self._configured_group_addresses.setdefault(
+                    GroupAddress(address), set()
+                ).add(index)
+            gateway.telegram_received_callback = partial(self._telegram_received, index)
+            gateway.connection_state_changed_cb = partial(
+                self._gateway_state_changed, index
+            )
+
+    async def connect(self) -> bool:
+        """Connect all gateways. Raise CommunicationError if no gateway could be connected."""
+        await self._connection_state_changed(XknxConnectionState.CONNECTING)
+        for index, gateway in enumerate(self.gateways):
+            gateway.primary = self.primary and index == 0
+        results = await asyncio.gather(
+            *(gateway.start() for gateway in self.gateways), return_exceptions=True
+        )
+        for index, result in enumerate(results):
+            if isinstance(result, XKNXException):
+                logger.warning(
+                    "Gateway %s of %s could not be connected: %s",
+                    index + 1,
+                    len(self.gateways),
+                    result,
+                )
+            elif isinstance(result, BaseException):
+                raise result
+        if XknxConnectionState.CONNECTED not in self._states:
+            await self._connection_state_changed(XknxConnectionState.DISCONNECTED)
+            raise CommunicationError("No gateway could be connected")
+        self._senders = [
+            asyncio.create_task(self._sender(index))
+            for index in range(len(self.gateways))
+        ]
+        return True
+
+    async def disconnect(self) -> None:
+        """Disconnect all gateways."""
+        for task in self._senders:
+            task.cancel()
+        self._senders = []
+        await asyncio.gather(
+            *(gateway.stop() for gateway in self.gateways), return_exceptions=True
+        )
+        await self._connection_state_changed(XknxConnectionState.DISCONNECTED)
+
+    async def _gateway_state_changed(
+        self, index: int, state: XknxConnectionState
+    ) -> None:
+        """Set connection state from the states of all gateways."""
+        self._states[index] = state
+        for combined_state in (
+            XknxConnectionState.CONNECTED,
+            XknxConnectionState.CONNECTING,
+        ):
+            if combined_state in self._states:
+                state = combined_state
+                break
+        await self._connection_state_changed(state)
+
+    def _connected(self, index: int) -> bool:
+        """Return True if the gateway at index is connected."""
+        return self._states[index] is XknxConnectionState.CONNECTED
+
+    def _gateway_indices(self, telegram: Telegram) -> list[int]:
+        """Return indices of the gateways to send telegram to."""
+        address = telegram.destination_address
+        indices: set[int] | None = None
+        if isinstance(address, GroupAddress):
+            indices = self._configured_group_addresses.get(
+                address
+            ) or self.learned_group_addresses.get(address)
+        elif isinstance(address, IndividualAddress):
+            line_index = self.learned_lines.get((address.area, address.main))
+            if line_index is not None:
+                indices = {line_index}
+        connected = [
+            index
+            for index in range(len(self.gateways))
+            if self._connected(index) and (indices is None or index in indices)
+        ]
+        if not connected:
+            raise CommunicationError(
+                f"No gateway connected to send telegram to {address}"
+            )
+        return connected
+
+    async def send_telegram(self, telegram: Telegram) -> None:
+        """Send telegram to the gateways of its destination address. Raise errors of sending it."""
+        loop = asyncio.get_running_loop()
+        results = []
+        for index in self._gateway_indices(telegram):
+            result = loop.create_future()
+            # wait for room in the queue if the gateway falls behind
+            await self._queues[index].put((telegram, result))
+            results.append(result)
+        for error in await asyncio.gather(*results, return_exceptions=True):
+            if isinstance(error, BaseException):
+                raise error
+
+    async def _sender(self, index: int) -> None:
+        """Send queued telegrams to the gateway at index."""
+        gateway = self.gateways[index]
+        queue = self._queues[index]
+        bucket = self._buckets[index]
+        rate_limit = gateway.connection_config.rate_limit
+        loop = asyncio.get_running_loop()
+        while True:
+            telegram, result = await queue.get()
+            try:
+                if rate_limit:
+                    delay = bucket.reserve(
+                        loop.time(), rate_limit, self.xknx.rate_limit_burst
+                    )
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                await gateway.send_telegram(telegram)
+            except Exception as ex:  # pylint: disable=broad-except
+                if not result.done():
+                    result.set_exception(ex)
+            else:
+                if not result.done():
+                    result.set_result(None)
+            finally:
+                queue.task_done()
+
+    def _telegram_received(self, index: int, telegram: Telegram) -> None:
+        """Learn the gateway of source line and group address and pass telegram."""
+        source = telegram.source_address
+        self.learned_lines[(source.area, source.main)] = index
+        if isinstance(telegram.destination_address, GroupAddress):
+            self.learned_group_addresses.setdefault(
+                telegram.destination_address, set()
+            ).add(index)
+        if self.telegram_received_callback is not None:
+            self.telegram_received_callback(telegram)
@@ -14,7 +14,8 @@ from xknx.knxip import (
 from .request_response import RequestResponse
 
 if TYPE_CHECKING:
-    from xknx.io.transport import UDPTransport
+    from xknx.io.transport import KNXIPTransport, UDPTransport
+    from xknx.knxip import HPAI
     from xknx.telegram import IndividualAddress, Telegram
     from xknx.xknx import XKNX
 
@@ -44,6 +45,17 @@ class Tunnelling(RequestResponse):
         self.sequence_counter = sequence_counter
         self.communication_channel_id = communication_channel_id
 
+    def response_rec_callback(
+        self, knxipframe: KNXIPFrame, source: HPAI, transport: KNXIPTransport
+    ) -> None:
+        """Verify and handle knxipframe. Ignore ACKs for other sequence counters."""
+        if (
+            isinstance(knxipframe.body, TunnellingAck)
+            and knxipframe.body.sequence_counter != self.sequence_counter
+        ):
+            return
+        super().response_rec_callback(knxipframe, source, transport)
+
     async def send_request(self) -> None:
         """Build knxipframe (within derived class) and send via UDP."""
         self.transport.send(self.create_knxipframe(), addr=self.data_endpoint_addr)
@@ -2,10 +2,16 @@
 Abstraction for handling KNX/IP routing.
 
 Routing uses UDP Multicast to broadcast and receive KNX/IP messages.
+KNX/IP routers signal overflowing queues with ROUTING_BUSY - sending is paused
+for the requested wait time plus a random time growing with the number of
+recent busy frames (KNXnet/IP Routing 2.3.5). Routing indications discarded by
+routers are reported with ROUTING_LOST_MESSAGE and counted in `lost_messages`.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 from typing import TYPE_CHECKING, Callable
 
 from xknx.core import XknxConnectionState
@@ -16,7 +22,9 @@ from xknx.knxip import (
     CEMIMessageCode,
     KNXIPFrame,
     KNXIPServiceType,
+    RoutingBusy,
     RoutingIndication,
+    RoutingLostMessage,
 )
 from xknx.telegram import TelegramDirection
 
@@ -28,6 +36,7 @@ if TYPE_CHECKING:
     from xknx.xknx import XKNX
 
     TelegramCallbackType = Callable[[Telegram], None]
+    TelegramsCallbackType = Callable[[list[Telegram]], None]
 
 logger = logging.getLogger("xknx.log")
 
@@ -35,46 +44,140 @@ logger = logging.getLogger("xknx.log")
 class Routing(Interface):
     """Class for handling KNX/IP routing."""
 
+    # seconds - ROUTING_BUSY frames closer than this increment the busy counter only once
+    BUSY_COUNTER_INTERVAL = 0.01
+    # seconds per busy counter - maximum additional random wait time after ROUTING_BUSY
+    BUSY_RANDOM_WAIT = 0.05
+    # seconds per busy counter - time without ROUTING_BUSY before decrementing the counter
+    BUSY_SLOW_DURATION = 0.1
+    # seconds - the busy counter is decremented by one every interval after BUSY_SLOW_DURATION
+    BUSY_DECREMENT_INTERVAL = 0.005
+
     def __init__(
         self,
         xknx: XKNX,
         telegram_received_callback: TelegramCallbackType,
         local_ip: str,
+        batch_receive: bool = False,
+        telegrams_received_callback: TelegramsCallbackType | None = None,
     ):
-        """Initialize Routing class."""
+        """
+        Initialize Routing class.
+
+        If `batch_receive` is set, pending datagrams are read and parsed at once.
+        The resulting telegrams are passed to `telegrams_received_callback`
+        together if it is set.
+        """
         self.xknx = xknx
         self.telegram_received_callback = telegram_received_callback
+        self.telegrams_received_callback = telegrams_received_callback
         self.local_ip = local_ip
+        # number of routing indications KNX/IP routers reported as lost
+        self.lost_messages = 0
+        self.busy_counter = 0
+        self._last_busy_time = -float("inf")
 
         self.udp_transport = UDPTransport(
             self.xknx,
             (local_ip, 0),
             (self.xknx.multicast_group, self.xknx.multicast_port),
             multicast=True,
+            batch_receive=batch_receive,
         )
 
         self.udp_transport.register_callback(
-            self.response_rec_callback, [KNXIPServiceType.ROUTING_INDICATION]
+            self.response_rec_callback,
+            [KNXIPServiceType.ROUTING_INDICATION],
+            batch_callback=self.response_batch_rec_callback,
+        )
+        self.udp_transport.register_callback(
+            self.flow_control_rec_callback,
+            [KNXIPServiceType.ROUTING_BUSY, KNXIPServiceType.ROUTING_LOST_MESSAGE],
         )
 
-    def response_rec_callback(
-        self, knxipframe: KNXIPFrame, source: HPAI, _: KNXIPTransport
-    ) -> None:
-        """Verify and handle knxipframe. Callback from internal udp_transport."""
+    def _telegram_from_knxipframe(self, knxipframe: KNXIPFrame) -> Telegram | None:
+        """Verify knxipframe and return its incoming Telegram."""
         if not isinstance(knxipframe.body, RoutingIndication):
             logger.warning("Service type not implemented: %s", knxipframe)
         elif knxipframe.body.cemi is None:
             # ignore unsupported CEMI frame
-            return
+            return None
         elif knxipframe.body.cemi.src_addr == self.xknx.own_address:
             logger.debug("Ignoring own packet")
         else:
             telegram = knxipframe.body.cemi.telegram
             telegram.direction = TelegramDirection.INCOMING
+            return telegram
+        return None
 
-            if self.telegram_received_callback is not None:
+    def response_rec_callback(
+        self, knxipframe: KNXIPFrame, source: HPAI, _: KNXIPTransport
+    ) -> None:
+        """Verify and handle knxipframe. Callback from internal udp_transport."""
+        telegram = self._telegram_from_knxipframe(knxipframe)
+        if telegram is not None and self.telegram_received_callback is not None:
+            self.telegram_received_callback(telegram)
+
+    def response_batch_rec_callback(
+        self, knxipframes: list[tuple[KNXIPFrame, HPAI]], _: KNXIPTransport
+    ) -> None:
+        """Verify and handle a batch of knxipframes. Callback from internal udp_transport."""
+        telegrams = []
+        for knxipframe, _source in knxipframes:
+            telegram = self._telegram_from_knxipframe(knxipframe)
+            if telegram is not None:
+                telegrams.append(telegram)
+        if not telegrams:
+            return
+        if self.telegrams_received_callback is not None:
+            self.telegrams_received_callback(telegrams)
+        elif self.telegram_received_callback is not None:
+            for telegram in telegrams:
                 self.telegram_received_callback(telegram)
 
+    def flow_control_rec_callback(
+        self, knxipframe: KNXIPFrame, source: HPAI, _: KNXIPTransport
+    ) -> None:
+        """Handle ROUTING_BUSY and ROUTING_LOST_MESSAGE. Callback from internal udp_transport."""
+        if isinstance(knxipframe.body, RoutingBusy):
+            self._routing_busy_received(knxipframe.body, source)
+        elif isinstance(knxipframe.body, RoutingLostMessage):
+            self.lost_messages += knxipframe.body.lost_messages
+            logger.warning(
+                "KNX/IP router %s lost %s routing indications (device state %s)",
+                source.ip_addr,
+                knxipframe.body.lost_messages,
+                knxipframe.body.device_state,
+            )
+
+    def _routing_busy_received(self, routing_busy: RoutingBusy, source: HPAI) -> None:
+        """Pause sending for the wait time of a ROUTING_BUSY frame plus a random time."""
+        if routing_busy.control_field != 0:
+            # reserved for future use - only 0x0000 applies to all devices
+            return
+        now = asyncio.get_running_loop().time()
+        since_last_busy = now - self._last_busy_time
+        slow_duration = self.busy_counter * self.BUSY_SLOW_DURATION
+        if self.busy_counter and since_last_busy > slow_duration:
+            self.busy_counter = max(
+                0,
+                self.busy_counter
+                - int((since_last_busy - slow_duration) / self.BUSY_DECREMENT_INTERVAL),
+            )
+        if since_last_busy >= self.BUSY_COUNTER_INTERVAL:
+            self.busy_counter += 1
+        self._last_busy_time = now
+        wait_time = (
+            routing_busy.wait_time / 1000
+            + random.random() * self.busy_counter * self.BUSY_RANDOM_WAIT
+        )
+        logger.debug(
+            "KNX/IP router %s is busy. Pausing for %.3f seconds",
+            source.ip_addr,
+            wait_time,
+        )
+        self.xknx.telegram_queue.rate_limiter.pause(wait_time)
+
     async def send_telegram(self, telegram: "Telegram") -> None:
         """Send Telegram to routing connected device."""
         cemi = CEMIFrame.init_from_telegram(
@@ -92,9 +195,7 @@ class Routing(Interface):
 
     async def connect(self) -> bool:
         """Start routing."""
-        await self.xknx.connection_manager.connection_state_changed(
-            XknxConnectionState.CONNECTING
-        )
+        await self._connection_state_changed(XknxConnectionState.CONNECTING)
         try:
             await self.udp_transport.connect()
         except OSError as ex:
@@ -103,20 +204,14 @@ class Routing(Interface):
                 type(ex).__name__,
                 ex,
             )
-            await self.xknx.connection_manager.connection_state_changed(
-                XknxConnectionState.DISCONNECTED
-            )
+            await self._connection_state_changed(XknxConnectionState.DISCONNECTED)
             # close udp transport to prevent open file descriptors
             self.udp_transport.stop()
             raise CommunicationError("Routing could not be started") from ex
-        await self.xknx.connection_manager.connection_state_changed(
-            XknxConnectionState.CONNECTED
-        )
+        await self._connection_state_changed(XknxConnectionState.CONNECTED)
         return True
 
     async def disconnect(self) -> None:
         """Stop routing."""
         self.udp_transport.stop()
-        await self.xknx.connection_manager.connection_state_changed(
-            XknxConnectionState.DISCONNECTED
-        )
+        await self._connection_state_changed(XknxConnectionState.DISCONNECTED)
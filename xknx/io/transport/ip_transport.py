@@ -15,6 +15,9 @@ from xknx.exceptions import CommunicationError
 from xknx.knxip import HPAI, KNXIPFrame, KNXIPServiceType
 
 TransportCallbackType = Callable[[KNXIPFrame, HPAI, "KNXIPTransport"], None]
+TransportBatchCallbackType = Callable[
+    [list[tuple[KNXIPFrame, HPAI]], "KNXIPTransport"], None
+]
 
 knx_logger = logging.getLogger("xknx.knx")
 
@@ -34,10 +37,12 @@ class KNXIPTransport(ABC):
             self,
             callback: TransportCallbackType,
             service_types: list[KNXIPServiceType] | None = None,
+            batch_callback: TransportBatchCallbackType | None = None,
         ):
             """Initialize Callback class."""
             self.callback = callback
             self.service_types = service_types or []
+            self.batch_callback = batch_callback
 
         def has_service(self, service_type: KNXIPServiceType) -> bool:
             """Test if callback is listening for given service type."""
@@ -47,12 +52,18 @@ class KNXIPTransport(ABC):
         self,
         callback: TransportCallbackType,
         service_types: list[KNXIPServiceType] | None = None,
+        batch_callback: TransportBatchCallbackType | None = None,
     ) -> KNXIPTransport.Callback:
-        """Register callback."""
+        """
+        Register callback.
+
+        `batch_callback` is called instead of `callback` with all matching frames
+        if frames are received in batches.
+        """
         if service_types is None:
             service_types = []
 
-        callb = KNXIPTransport.Callback(callback, service_types)
+        callb = KNXIPTransport.Callback(callback, service_types, batch_callback)
         self.callbacks.append(callb)
         return callb
 
@@ -74,10 +85,38 @@ class KNXIPTransport(ABC):
                 source,
             )
 
+    def handle_knxipframes(self, knxipframes: list[tuple[KNXIPFrame, HPAI]]) -> None:
+        """Handle a batch of KNXIP Frames and call all callbacks matching their service type ident."""
+        handled = [False] * len(knxipframes)
+        for callback in self.callbacks:
+            matching = []
+            for index, (knxipframe, source) in enumerate(knxipframes):
+                if callback.has_service(knxipframe.header.service_type_ident):
+                    matching.append((knxipframe, source))
+                    handled[index] = True
+            if not matching:
+                continue
+            if callback.batch_callback is not None:
+                callback.batch_callback(matching, self)
+            else:
+                for knxipframe, source in matching:
+                    callback.callback(knxipframe, source, self)
+        for (knxipframe, source), frame_handled in zip(knxipframes, handled):
+            if not frame_handled:
+                knx_logger.debug(
+                    "Unhandled: %s from: %s",
+                    knxipframe.header.service_type_ident,
+                    source,
+                )
+
     @abstractmethod
     async def connect(self) -> None:
         """Connect transport."""
 
+    def is_connected(self) -> bool:
+        """Return True if the socket is open."""
+        return self.transport is not None and not self.transport.is_closing()
+
     @abstractmethod
     def send(self, knxipframe: KNXIPFrame, addr: tuple[str, int] | None = None) -> None:
         """Send KNXIPFrame via transport."""
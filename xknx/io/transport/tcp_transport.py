@@ -65,48 +65,65 @@ class TCPTransport(KNXIPTransport):
 
         self.callbacks = []
         self.transport: asyncio.Transport | None = None
-        self._buffer = bytes()
+        self._buffer = bytearray()
 
     def data_received_callback(self, raw: bytes) -> None:
-        """Parse and process KNXIP frame. Callback for having received data over TCP."""
+        """Parse and process KNXIP frames. Callback for having received data over TCP."""
         if self._buffer:
-            raw = self._buffer + raw
-            self._buffer = b""
-        if not raw:
-            return
-        try:
+            # append to the pending incomplete frame
+            self._buffer += raw
+            data: bytes | bytearray = self._buffer
+        else:
+            data = raw
+        view = memoryview(data)
+        data_length = len(view)
+        read_offset = 0
+        while read_offset < data_length:
             knxipframe = KNXIPFrame(self.xknx)
-            frame_length = knxipframe.from_knx(raw)
-        except IncompleteKNXIPFrame:
-            self._buffer = raw
-            raw_socket_logger.debug(
-                "Incomplete KNX/IP frame. Waiting for rest: %s", raw.hex()
-            )
+            try:
+                frame_length = knxipframe.from_knx(view[read_offset:])
+            except IncompleteKNXIPFrame:
+                raw_socket_logger.debug(
+                    "Incomplete KNX/IP frame. Waiting for rest: %s",
+                    view[read_offset:].hex(),
+                )
+                break
+            except CouldNotParseKNXIP as couldnotparseknxip:
+                knx_logger.debug(
+                    "Unsupported KNXIPFrame from %s at %s: %s in %s",
+                    self.remote_hpai,
+                    time.time(),
+                    couldnotparseknxip.description,
+                    view[read_offset:].hex(),
+                )
+                if not (frame_length := knxipframe.header.total_length):
+                    # frame boundary is unknown - discard remaining data
+                    read_offset = data_length
+                    break
+                if read_offset + frame_length > data_length:
+                    # wait for the rest of the unsupported frame to skip it
+                    break
+            else:
+                knx_logger.debug(
+                    "Received from %s at %s:\n%s",
+                    self.remote_hpai,
+                    time.time(),
+                    knxipframe,
+                )
+                self.handle_knxipframe(knxipframe, self.remote_hpai)
+            read_offset += frame_length
+
+        if read_offset == 0 and data is self._buffer:
+            # nothing consumed - keep growing the buffer in place
+            view.release()
             return
-        except CouldNotParseKNXIP as couldnotparseknxip:
-            knx_logger.debug(
-                "Unsupported KNXIPFrame from %s at %s: %s in %s",
-                self.remote_hpai,
-                time.time(),
-                couldnotparseknxip.description,
-                raw.hex(),
-            )
-            if not (frame_length := knxipframe.header.total_length):
-                return
-        else:
-            knx_logger.debug(
-                "Received from %s at %s:\n%s",
-                self.remote_hpai,
-                time.time(),
-                knxipframe,
-            )
-            self.handle_knxipframe(knxipframe, self.remote_hpai)
-        # parse data after current KNX/IP frame
-        if len(raw) > frame_length:
-            self.data_received_callback(raw[frame_length:])
+        # keep only the remaining incomplete frame
+        self._buffer = bytearray(view[read_offset:])
+        view.release()
 
     async def connect(self) -> None:
         """Connect TCP socket."""
+        self._buffer = bytearray()
         tcp_transport_factory = TCPTransport.TCPTransportFactory(
             data_received_callback=self.data_received_callback,
             connection_lost_callback=self.stop,
@@ -131,4 +148,7 @@ class TCPTransport(KNXIPTransport):
         if self.transport is None:
             raise CommunicationError("Transport not connected")
 
-        self.transport.write(knxipframe.to_knx())
+        # serialize into one buffer handed to the socket without copying it to bytes
+        raw = bytearray(knxipframe.calculated_length())
+        knxipframe.to_knx_into(raw, 0)
+        self.transport.write(raw)
@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Callable, cast
 from xknx.exceptions import CommunicationError, CouldNotParseKNXIP
 from xknx.knxip import HPAI, KNXIPFrame
 
+from ..const import RECEIVE_BATCH_SIZE
 from .ip_transport import KNXIPTransport
 
 if TYPE_CHECKING:
@@ -29,6 +30,8 @@ knx_logger = logging.getLogger("xknx.knx")
 class UDPTransport(KNXIPTransport):
     """Class for handling (sending and receiving) UDP packets."""
 
+    MAX_DATAGRAM_SIZE = 65507
+
     class UDPTransportFactory(asyncio.DatagramProtocol):
         """Abstraction for managing the asyncio-udp transports."""
 
@@ -69,8 +72,14 @@ class UDPTransport(KNXIPTransport):
         local_addr: tuple[str, int],
         remote_addr: tuple[str, int],
         multicast: bool = False,
+        batch_receive: bool = False,
     ):
-        """Initialize UDPTransport class."""
+        """
+        Initialize UDPTransport class.
+
+        If `batch_receive` is set all datagrams pending on a multicast socket are
+        read and parsed at once and passed to `handle_knxipframes()`.
+        """
         if not isinstance(local_addr, tuple):
             raise TypeError()
         if not isinstance(remote_addr, tuple):
@@ -79,35 +88,78 @@ class UDPTransport(KNXIPTransport):
         self.local_addr = local_addr
         self.remote_addr = remote_addr
         self.multicast = multicast
+        self.batch_receive = batch_receive
 
         self.callbacks = []
         self.transport: asyncio.DatagramTransport | None = None
+        self._sock: socket.socket | None = None
+        self._receive_buffer = bytearray()
+
+    def _parse_knxipframe(
+        self, raw: bytes, source: tuple[str, int]
+    ) -> KNXIPFrame | None:
+        """Parse KNXIP frame. Return None if raw could not be parsed."""
+        try:
+            knxipframe = KNXIPFrame(self.xknx)
+            knxipframe.from_knx(raw)
+        except CouldNotParseKNXIP as couldnotparseknxip:
+            knx_logger.debug(
+                "Unsupported KNXIPFrame from %s:%s at %s: %s in %s",
+                source[0],
+                source[1],
+                time.time(),
+                couldnotparseknxip.description,
+                raw.hex(),
+            )
+            return None
+        knx_logger.debug(
+            "Received from %s:%s at %s:\n %s",
+            source[0],
+            source[1],
+            time.time(),
+            knxipframe,
+        )
+        return knxipframe
 
     def data_received_callback(self, raw: bytes, source: tuple[str, int]) -> None:
         """Parse and process KNXIP frame. Callback for having received an UDP packet."""
         if raw:
-            try:
-                knxipframe = KNXIPFrame(self.xknx)
-                knxipframe.from_knx(raw)
-            except CouldNotParseKNXIP as couldnotparseknxip:
-                knx_logger.debug(
-                    "Unsupported KNXIPFrame from %s:%s at %s: %s in %s",
-                    source[0],
-                    source[1],
-                    time.time(),
-                    couldnotparseknxip.description,
-                    raw.hex(),
-                )
-            else:
-                knx_logger.debug(
-                    "Received from %s:%s at %s:\n %s",
-                    source[0],
-                    source[1],
-                    time.time(),
-                    knxipframe,
-                )
+            knxipframe = self._parse_knxipframe(raw, source)
+            if knxipframe is not None:
                 self.handle_knxipframe(knxipframe, HPAI(*source))
 
+    def batch_received_callback(self, raw: bytes, source: tuple[str, int]) -> None:
+        """Read pending datagrams, parse and process them at once. Callback for having received an UDP packet."""
+        datagrams = [(raw, source)]
+        datagrams.extend(self._read_pending_datagrams())
+        knxipframes = []
+        for _raw, _source in datagrams:
+            if _raw:
+                knxipframe = self._parse_knxipframe(_raw, _source)
+                if knxipframe is not None:
+                    knxipframes.append((knxipframe, HPAI(*_source)))
+        if knxipframes:
+            self.handle_knxipframes(knxipframes)
+
+    def _read_pending_datagrams(self) -> list[tuple[bytes, tuple[str, int]]]:
+        """Read datagrams from the non-blocking socket until it would block."""
+        datagrams: list[tuple[bytes, tuple[str, int]]] = []
+        if self._sock is None:
+            return datagrams
+        buffer = self._receive_buffer
+        while len(datagrams) < RECEIVE_BATCH_SIZE - 1:
+            try:
+                nbytes, source = self._sock.recvfrom_into(buffer)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as exc:
+                logger.warning("Error received: %s", exc)
+                break
+            raw = bytes(buffer[:nbytes])
+            raw_socket_logger.debug("Received from %s: %s", source, raw.hex())
+            datagrams.append((raw, source))
+        return datagrams
+
     @staticmethod
     def create_multicast_sock(
         own_ip: str, remote_addr: tuple[str, int]
@@ -147,16 +199,22 @@ class UDPTransport(KNXIPTransport):
 
     async def connect(self) -> None:
         """Connect UDP socket. Open UDP port and build mulitcast socket if necessary."""
+        batch_receive = self.batch_receive and self.multicast
         udp_transport_factory = UDPTransport.UDPTransportFactory(
             self.local_addr[0],
             multicast=self.multicast,
-            data_received_callback=self.data_received_callback,
+            data_received_callback=self.batch_received_callback
+            if batch_receive
+            else self.data_received_callback,
         )
         loop = asyncio.get_running_loop()
         if self.multicast:
             sock = UDPTransport.create_multicast_sock(
                 self.local_addr[0], self.remote_addr
             )
+            if batch_receive:
+                self._sock = sock
+                self._receive_buffer = bytearray(self.MAX_DATAGRAM_SIZE)
             (transport, _) = await loop.create_datagram_endpoint(
                 lambda: udp_transport_factory, sock=sock
             )
@@ -180,12 +238,20 @@ class UDPTransport(KNXIPTransport):
         if self.transport is None:
             raise CommunicationError("Transport not connected")
 
+        # serialize into one buffer handed to the socket without copying it to bytes
+        raw = bytearray(knxipframe.calculated_length())
+        knxipframe.to_knx_into(raw, 0)
         if self.multicast:
             if addr is not None:
                 logger.warning(
                     "Multicast send to specific address is invalid. %s",
                     knxipframe,
                 )
-            self.transport.sendto(knxipframe.to_knx(), self.remote_addr)
+            self.transport.sendto(raw, self.remote_addr)
         else:
-            self.transport.sendto(knxipframe.to_knx(), addr=_addr)
+            self.transport.sendto(raw, addr=_addr)
+
+    def stop(self) -> None:
+        """Stop socket."""
+        super().stop()
+        self._sock = None
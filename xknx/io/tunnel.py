@@ -2,12 +2,17 @@
 Abstraction for handling KNX/IP tunnels.
 
 Tunnels connect to KNX/IP devices directly via UDP or TCP and build a static connection.
+
+A lost tunnel is reconnected immediately, further attempts wait exponentially
+longer (with jitter) starting at `auto_reconnect_wait`. The socket is kept open
+for reconnecting if the transport is still usable.
 """
 from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
 import logging
+import random
 from typing import TYPE_CHECKING, Awaitable, Callable
 
 from xknx.core import XknxConnectionState
@@ -49,17 +54,31 @@ class _Tunnel(Interface):
 
     transport: KNXIPTransport
 
+    # seconds - maximum wait time between reconnect attempts
+    RECONNECT_MAX_WAIT = 60
+    # reconnect wait times are reduced by up to this fraction
+    RECONNECT_JITTER = 0.2
+
     def __init__(
         self,
         xknx: XKNX,
         telegram_received_callback: TelegramCallbackType | None = None,
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
+        send_window_size: int = 1,
     ):
-        """Initialize Tunnel class."""
+        """
+        Initialize Tunnel class.
+
+        `send_window_size` is the number of TUNNELLING_REQUEST frames that may be
+        awaiting their ACK and L_DATA_CON confirmation at the same time.
+        The default of 1 waits for the confirmation of every frame before sending
+        the next one. Higher values must be supported by the tunnelling server.
+        """
         self.xknx = xknx
         self.auto_reconnect = auto_reconnect
         self.auto_reconnect_wait = auto_reconnect_wait
+        self.send_window_size = send_window_size
 
         self.communication_channel: int | None = None
         self.local_hpai: HPAI = HPAI()
@@ -69,9 +88,13 @@ class _Tunnel(Interface):
         self._heartbeat_task: asyncio.Task[None] | None = None
         self._initial_connection = True
         self._is_reconnecting = False
+        self._reconnect_attempts = 0
         self._reconnect_task: asyncio.Task[None] | None = None
-        self._src_address = xknx.own_address
+        self._src_address: IndividualAddress = xknx.own_address
         self._tunnelling_request_confirmation_event = asyncio.Event()
+        self._send_window = asyncio.Semaphore(send_window_size)
+        self._pending_confirmations: list[tuple[Telegram, asyncio.Future[None]]] = []
+        self._pipelined_requests: set[asyncio.Task[None]] = set()
 
         self._init_transport()
         self.transport.register_callback(
@@ -97,11 +120,10 @@ class _Tunnel(Interface):
 
     async def connect(self) -> bool:
         """Connect to a KNX tunneling interface. Returns True on success."""
-        await self.xknx.connection_manager.connection_state_changed(
-            XknxConnectionState.CONNECTING
-        )
+        await self._connection_state_changed(XknxConnectionState.CONNECTING)
         try:
-            await self.transport.connect()
+            if not self.transport.is_connected():
+                await self.transport.connect()
             self.local_hpai = self._get_hpai()
             await self._connect_request()
         except (OSError, CommunicationError) as ex:
@@ -110,9 +132,7 @@ class _Tunnel(Interface):
                 type(ex).__name__,
                 ex,
             )
-            await self.xknx.connection_manager.connection_state_changed(
-                XknxConnectionState.DISCONNECTED
-            )
+            await self._connection_state_changed(XknxConnectionState.DISCONNECTED)
             if not self._initial_connection and self.auto_reconnect:
                 self._reconnect_task = asyncio.create_task(self._reconnect())
                 return False
@@ -123,42 +143,52 @@ class _Tunnel(Interface):
             ) from ex
         else:
             self._tunnel_established()
-            await self.xknx.connection_manager.connection_state_changed(
-                XknxConnectionState.CONNECTED
-            )
+            await self._connection_state_changed(XknxConnectionState.CONNECTED)
             return True
 
     def _tunnel_established(self) -> None:
         """Set up interface when the tunnel is ready."""
         self._initial_connection = False
+        self._reconnect_attempts = 0
         self.sequence_number = 0
         self.start_heartbeat()
 
-    def _tunnel_lost(self) -> None:
-        """Prepare for reconnection or shutdown when the connection is lost. Callback."""
+    def _tunnel_lost(self) -> asyncio.Task[None]:
+        """
+        Prepare for reconnection or shutdown when the connection is lost. Callback.
+
+        Return the task reporting the lost connection.
+        """
         self.stop_heartbeat()
-        asyncio.create_task(
-            self.xknx.connection_manager.connection_state_changed(
-                XknxConnectionState.DISCONNECTED
-            )
+        disconnected_task = asyncio.create_task(
+            self._connection_state_changed(XknxConnectionState.DISCONNECTED)
         )
         self._data_endpoint_addr = None
         if self.auto_reconnect:
             self._reconnect_task = asyncio.create_task(self._reconnect())
         else:
             raise CommunicationError("Tunnel connection closed.")
+        return disconnected_task
 
     async def _reconnect(self) -> None:
         """Reconnect to tunnel device."""
-        await self.xknx.connection_manager.connection_state_changed(
-            XknxConnectionState.CONNECTING
-        )
+        await self._connection_state_changed(XknxConnectionState.CONNECTING)
         await self._disconnect_request(True)
-        self.transport.stop()
-        await asyncio.sleep(self.auto_reconnect_wait)
+        await asyncio.sleep(self._reconnect_wait())
+        self._reconnect_attempts += 1
         if await self.connect():
             logger.info("Successfully reconnected to KNX bus.")
 
+    def _reconnect_wait(self) -> float:
+        """Return seconds to wait before the next reconnect attempt."""
+        if not self._reconnect_attempts:
+            return 0
+        wait = min(
+            self.RECONNECT_MAX_WAIT,
+            self.auto_reconnect_wait * 2.0 ** min(self._reconnect_attempts - 1, 16),
+        )
+        return wait * (1 - self.RECONNECT_JITTER * random.random())
+
     def _stop_reconnect(self) -> None:
         """Stop reconnect task if running."""
         if self._reconnect_task is not None:
@@ -168,11 +198,10 @@ class _Tunnel(Interface):
     async def disconnect(self) -> None:
         """Disconnect tunneling connection."""
         self.stop_heartbeat()
-        await self.xknx.connection_manager.connection_state_changed(
-            XknxConnectionState.DISCONNECTED
-        )
+        await self._connection_state_changed(XknxConnectionState.DISCONNECTED)
         self._data_endpoint_addr = None
         self._stop_reconnect()
+        self._stop_pipelined_requests()
         await self._disconnect_request(False)
         self.transport.stop()
 
@@ -199,7 +228,8 @@ class _Tunnel(Interface):
             )
             # Use the individual address provided by the tunnelling server
             self._src_address = IndividualAddress(connect.identifier)
-            self.xknx.current_address = self._src_address
+            if self.primary:
+                self.xknx.current_address = self._src_address
             logger.debug(
                 "Tunnel established communication_channel=%s, address=%s",
                 connect.communication_channel,
@@ -267,29 +297,127 @@ class _Tunnel(Interface):
         connection by sending a DISCONNECT_REQUEST frame to the other device’s
         control endpoint.
         """
+        if self.send_window_size > 1:
+            await self._send_telegram_pipelined(telegram)
+            return
         success = await self._tunnelling_request(telegram)
         if not success:
             logger.debug("Sending of telegram failed. Retrying a second time.")
             success = await self._tunnelling_request(telegram)
             if not success:
                 logger.debug("Resending telegram failed. Reconnecting to tunnel.")
-                # TODO: How to test this?
                 if self._reconnect_task is None or self._reconnect_task.done():
-                    self._tunnel_lost()
-                await self.xknx.connection_manager.connected.wait()
-                success = await self._tunnelling_request(telegram)
-                if not success:
-                    raise CommunicationError(
-                        "Resending the telegram repeatedly failed.", True
-                    )
+                    # wait until the lost connection is reported before raising so
+                    # the TelegramQueue buffers the telegram if reconnect_buffer_ttl is set
+                    await self._tunnel_lost()
+                # don't block the outgoing queue until the tunnel is reconnected
+                raise CommunicationError(
+                    "Resending the telegram repeatedly failed. Reconnecting.", True
+                )
         self._increase_sequence_number()
 
     @abstractmethod
     async def _tunnelling_request(self, telegram: Telegram) -> bool:
         """Send Telegram to tunnelling device."""
 
+    @abstractmethod
+    async def _send_tunnelling_request(
+        self, telegram: Telegram, sequence_number: int
+    ) -> bool:
+        """Send Telegram to tunnelling device. Don't wait for its L_DATA_CON confirmation."""
+
+    async def _send_telegram_pipelined(self, telegram: Telegram) -> None:
+        """Send Telegram as soon as the send window allows it. Confirmation is awaited in a background task."""
+        await self._send_window.acquire()
+        try:
+            sequence_number = self.sequence_number
+            self._increase_sequence_number()
+            confirmation = asyncio.get_running_loop().create_future()
+            self._pending_confirmations.append((telegram, confirmation))
+            task = asyncio.create_task(
+                self._pipelined_request(telegram, sequence_number, confirmation)
+            )
+        except BaseException:
+            self._send_window.release()
+            raise
+        self._pipelined_requests.add(task)
+        task.add_done_callback(self._pipelined_requests.discard)
+
+    async def _pipelined_request(
+        self,
+        telegram: Telegram,
+        sequence_number: int,
+        confirmation: asyncio.Future[None],
+    ) -> None:
+        """Send Telegram, repeat it if it is not acknowledged and wait for its confirmation."""
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        try:
+            if not await self._send_tunnelling_request(telegram, sequence_number):
+                logger.debug("Sending of telegram failed. Retrying a second time.")
+                if not await self._send_tunnelling_request(telegram, sequence_number):
+                    logger.debug("Resending telegram failed. Reconnecting to tunnel.")
+                    if self._reconnect_task is None or self._reconnect_task.done():
+                        self._tunnel_lost()
+                    # free the send window slot instead of waiting for the reconnect
+                    raise CommunicationError(
+                        "Resending the telegram repeatedly failed. Reconnecting.", True
+                    )
+            await asyncio.wait_for(
+                confirmation, timeout=REQUEST_TO_CONFIRMATION_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "L_DATA_CON Data Link Layer confirmation timed out for %s", telegram
+            )
+            self.xknx.telegram_queue.rate_limiter.confirmation_received(
+                loop.time() - start_time
+            )
+        except CommunicationError as ex:
+            if ex.should_log:
+                logger.warning(ex)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Unexpected error while sending %s", telegram)
+        else:
+            self.xknx.telegram_queue.rate_limiter.confirmation_received(
+                loop.time() - start_time
+            )
+        finally:
+            self._pending_confirmations = [
+                pending
+                for pending in self._pending_confirmations
+                if pending[1] is not confirmation
+            ]
+            self._send_window.release()
+
+    def _confirmation_received(self, telegram: Telegram) -> None:
+        """Resolve the oldest pending confirmation for a pipelined Telegram."""
+        for index, (pending_telegram, confirmation) in enumerate(
+            self._pending_confirmations
+        ):
+            if (
+                pending_telegram.destination_address == telegram.destination_address
+                and pending_telegram.payload == telegram.payload
+            ):
+                break
+        else:
+            if not self._pending_confirmations:
+                return
+            # confirmations are sent in order - fall back to the oldest request
+            index = 0
+            confirmation = self._pending_confirmations[0][1]
+        del self._pending_confirmations[index]
+        if not confirmation.done():
+            confirmation.set_result(None)
+
+    def _stop_pipelined_requests(self) -> None:
+        """Cancel background tasks of pipelined requests."""
+        for task in self._pipelined_requests:
+            task.cancel()
+        self._pipelined_requests.clear()
+
     async def _wait_for_tunnelling_request_confirmation(
-        self, send_tunneling_request_aw: Awaitable[None], telegram: Telegram
+        self, send_tunneling_request_aw: Awaitable[object], telegram: Telegram
     ) -> None:
         """Wait for confirmation of tunnelling request."""
         self._tunnelling_request_confirmation_event.clear()
@@ -297,6 +425,8 @@ class _Tunnel(Interface):
             send_tunneling_request_aw,
             self._tunnelling_request_confirmation_event.wait(),
         )
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         try:
             await asyncio.wait_for(
                 send_and_wait_for_confirmation, timeout=REQUEST_TO_CONFIRMATION_TIMEOUT
@@ -308,6 +438,9 @@ class _Tunnel(Interface):
                 "L_DATA_CON Data Link Layer confirmation timed out for %s", telegram
             )
             # could return False here to retry sending the telegram (tcp without ACK)
+        self.xknx.telegram_queue.rate_limiter.confirmation_received(
+            loop.time() - start_time
+        )
 
     def _increase_sequence_number(self) -> None:
         """Increase sequence number."""
@@ -347,6 +480,8 @@ class _Tunnel(Interface):
         elif tunneling_request.cemi.code is CEMIMessageCode.L_DATA_CON:
             # L_DATA_CON confirmation frame signals ready to send next telegram
             self._tunnelling_request_confirmation_event.set()
+            if self._pending_confirmations:
+                self._confirmation_received(tunneling_request.cemi.telegram)
         elif tunneling_request.cemi.code is CEMIMessageCode.L_DATA_REQ:
             # L_DATA_REQ frames should only be outgoing.
             logger.warning(
@@ -419,6 +554,7 @@ class TCPTunnel(_Tunnel):
         telegram_received_callback: TelegramCallbackType | None = None,
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
+        send_window_size: int = 1,
     ):
         """Initialize Tunnel class."""
         self.gateway_ip = gateway_ip
@@ -429,6 +565,7 @@ class TCPTunnel(_Tunnel):
             telegram_received_callback=telegram_received_callback,
             auto_reconnect=auto_reconnect,
             auto_reconnect_wait=auto_reconnect_wait,
+            send_window_size=send_window_size,
         )
 
     def _init_transport(self) -> None:
@@ -445,6 +582,18 @@ class TCPTunnel(_Tunnel):
 
     async def _tunnelling_request(self, telegram: Telegram) -> bool:
         """Send Telegram to tunnelling device."""
+        await self._wait_for_tunnelling_request_confirmation(
+            send_tunneling_request_aw=self._send_tunnelling_request(
+                telegram, self.sequence_number
+            ),
+            telegram=telegram,
+        )
+        return True
+
+    async def _send_tunnelling_request(
+        self, telegram: Telegram, sequence_number: int
+    ) -> bool:
+        """Send Telegram to tunnelling device. TCP connections don't use ACK frames."""
         if self.communication_channel is None:
             raise CommunicationError(
                 "Sending telegram failed. No active communication channel."
@@ -458,17 +607,10 @@ class TCPTunnel(_Tunnel):
         tunnelling_request = TunnellingRequest(
             self.xknx,
             communication_channel_id=self.communication_channel,
-            sequence_counter=self.sequence_number,
+            sequence_counter=sequence_number,
             cemi=cemi,
         )
-
-        async def _async_wrapper() -> None:
-            self.transport.send(KNXIPFrame.init_from_body(tunnelling_request))
-
-        await self._wait_for_tunnelling_request_confirmation(
-            send_tunneling_request_aw=_async_wrapper(),
-            telegram=telegram,
-        )
+        self.transport.send(KNXIPFrame.init_from_body(tunnelling_request))
         return True
 
 
@@ -488,6 +630,7 @@ class UDPTunnel(_Tunnel):
         telegram_received_callback: TelegramCallbackType | None = None,
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
+        send_window_size: int = 1,
     ):
         """Initialize Tunnel class."""
         self.gateway_ip = gateway_ip
@@ -501,6 +644,7 @@ class UDPTunnel(_Tunnel):
             telegram_received_callback=telegram_received_callback,
             auto_reconnect=auto_reconnect,
             auto_reconnect_wait=auto_reconnect_wait,
+            send_window_size=send_window_size,
         )
 
     def _init_transport(self) -> None:
@@ -521,26 +665,40 @@ class UDPTunnel(_Tunnel):
 
     # OUTGOING REQUESTS
 
-    async def _tunnelling_request(self, telegram: Telegram) -> bool:
-        """Send Telegram to tunnelling device."""
+    def _create_tunnelling(
+        self, telegram: Telegram, sequence_number: int
+    ) -> Tunnelling:
+        """Create Tunnelling request/response object for Telegram."""
         if self.communication_channel is None:
             raise CommunicationError(
                 "Sending telegram failed. No active communication channel."
             )
-        tunnelling = Tunnelling(
+        return Tunnelling(
             self.xknx,
             self.transport,
             self._data_endpoint_addr,
             telegram,
             self._src_address,
-            self.sequence_number,
+            sequence_number,
             self.communication_channel,
         )
+
+    async def _tunnelling_request(self, telegram: Telegram) -> bool:
+        """Send Telegram to tunnelling device."""
+        tunnelling = self._create_tunnelling(telegram, self.sequence_number)
         await self._wait_for_tunnelling_request_confirmation(
             send_tunneling_request_aw=tunnelling.start(), telegram=telegram
         )
         return tunnelling.success
 
+    async def _send_tunnelling_request(
+        self, telegram: Telegram, sequence_number: int
+    ) -> bool:
+        """Send Telegram to tunnelling device and wait for its ACK."""
+        tunnelling = self._create_tunnelling(telegram, sequence_number)
+        await tunnelling.start()
+        return tunnelling.success
+
     # INCOMING REQUESTS
 
     def _tunnelling_request_received(
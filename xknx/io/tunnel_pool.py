@@ -0,0 +1,204 @@
+"""
+Abstraction for using multiple tunnels to the same KNX/IP interface.
+
+KNX/IP interfaces usually provide several tunnelling connections. A tunnel waits
+for the confirmation of a telegram before sending the next one, so the pool spreads
+concurrently sent telegrams over all connected tunnels. Telegrams for the same
+destination address are always sent over the same tunnel to keep their order.
+If a tunnel is disconnected its telegrams are sent over the remaining tunnels.
+Errors of sending a telegram are raised to the caller of `send_telegram()`.
+
+Incoming telegrams are received by every tunnel - duplicates and telegrams sent by
+other tunnels of the pool are discarded.
+"""
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+import logging
+from typing import TYPE_CHECKING, Callable, Hashable
+
+from xknx.core import XknxConnectionState
+from xknx.exceptions import CommunicationError
+from xknx.telegram import Telegram
+
+from .interface import Interface
+
+if TYPE_CHECKING:
+    from xknx.xknx import XKNX
+
+    from .tunnel import _Tunnel
+
+    TelegramCallbackType = Callable[[Telegram], None]
+
+logger = logging.getLogger("xknx.log")
+
+
+class TunnelPool(Interface):
+    """Class for sending and receiving telegrams over multiple tunnels."""
+
+    # seconds - the same telegram received by another tunnel within this time is a duplicate
+    DUPLICATE_WINDOW = 1.0
+    # telegrams waiting to be sent per tunnel
+    TUNNEL_QUEUE_SIZE = 2
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        tunnels: list[_Tunnel],
+        telegram_received_callback: TelegramCallbackType | None = None,
+    ):
+        """Initialize TunnelPool class."""
+        self.xknx = xknx
+        self.tunnels = tunnels
+        self.telegram_received_callback = telegram_received_callback
+        self._states = [XknxConnectionState.DISCONNECTED] * len(tunnels)
+        # telegrams and futures for the result of sending them
+        self._queues: list[asyncio.Queue[tuple[Telegram, asyncio.Future[None]]]] = [
+            asyncio.Queue(maxsize=self.TUNNEL_QUEUE_SIZE) for _ in tunnels
+        ]
+        self._senders: list[asyncio.Task[None]] = []
+        # received telegrams by (source, destination, APDU) - loop time and indices of receiving tunnels
+        self._received: dict[Hashable, tuple[float, set[int]]] = {}
+
+        for index, tunnel in enumerate(tunnels):
+            tunnel.telegram_received_callback = partial(self._telegram_received, index)
+            tunnel.connection_state_changed_cb = partial(
+                self._tunnel_state_changed, index
+            )
+
+    async def connect(self) -> bool:
+        """Connect all tunnels. Raise CommunicationError if no tunnel could be connected."""
+        await self._connection_state_changed(XknxConnectionState.CONNECTING)
+        for index, tunnel in enumerate(self.tunnels):
+            tunnel.primary = self.primary and index == 0
+        results = await asyncio.gather(
+            *(tunnel.connect() for tunnel in self.tunnels), return_exceptions=True
+        )
+        for index, result in enumerate(results):
+            if isinstance(result, CommunicationError):
+                logger.warning(
+                    "Tunnel %s of %s could not be connected: %s",
+                    index + 1,
+                    len(self.tunnels),
+                    result,
+                )
+            elif isinstance(result, BaseException):
+                raise result
+        if XknxConnectionState.CONNECTED not in self._states:
+            await self._connection_state_changed(XknxConnectionState.DISCONNECTED)
+            raise CommunicationError("No tunnel of the pool could be connected")
+        self._senders = [
+            asyncio.create_task(self._sender(index))
+            for index in range(len(self.tunnels))
+        ]
+        return True
+
+    async def disconnect(self) -> None:
+        """Disconnect all tunnels."""
+        for task in self._senders:
+            task.cancel()
+        self._senders = []
+        await asyncio.gather(
+            *(tunnel.disconnect() for tunnel in self.tunnels), return_exceptions=True
+        )
+        await self._connection_state_changed(XknxConnectionState.DISCONNECTED)
+
+    async def _tunnel_state_changed(
+        self, index: int, state: XknxConnectionState
+    ) -> None:
+        """Set connection state of the pool from the states of its tunnels."""
+        self._states[index] = state
+        for pool_state in (
+            XknxConnectionState.CONNECTED,
+            XknxConnectionState.CONNECTING,
+        ):
+            if pool_state in self._states:
+                state = pool_state
+                break
+        await self._connection_state_changed(state)
+
+    def _connected(self, index: int) -> bool:
+        """Return True if the tunnel at index is connected."""
+        return self._states[index] is XknxConnectionState.CONNECTED
+
+    def _tunnel_index(self, telegram: Telegram) -> int:
+        """Return index of the tunnel to send telegram over."""
+        connected = [
+            index for index in range(len(self.tunnels)) if self._connected(index)
+        ]
+        if not connected:
+            raise CommunicationError("No tunnel of the pool is connected")
+        key = hash(telegram.destination_address)
+        index = key % len(self.tunnels)
+        if self._connected(index):
+            return index
+        return connected[key % len(connected)]
+
+    async def send_telegram(self, telegram: Telegram) -> None:
+        """Send telegram over the tunnel of its destination address. Raise errors of sending it."""
+        result = asyncio.get_running_loop().create_future()
+        await self._queues[self._tunnel_index(telegram)].put((telegram, result))
+        await result
+
+    async def _sender(self, index: int) -> None:
+        """Send queued telegrams over the tunnel at index."""
+        tunnel = self.tunnels[index]
+        queue = self._queues[index]
+        while True:
+            telegram, result = await queue.get()
+            try:
+                if self._connected(index):
+                    try:
+                        await tunnel.send_telegram(telegram)
+                    except CommunicationError:
+                        if self._connected(index):
+                            # the tunnel is still connected - don't retry on another one
+                            raise
+                    else:
+                        _set_result(result)
+                        continue
+                # the tunnel was disconnected - send over the remaining tunnels
+                await self.send_telegram(telegram)
+                _set_result(result)
+            except Exception as ex:  # pylint: disable=broad-except
+                if not result.done():
+                    result.set_exception(ex)
+            finally:
+                queue.task_done()
+
+    def _telegram_received(self, index: int, telegram: Telegram) -> None:
+        """Pass telegram received by the tunnel at index if it is no duplicate."""
+        # pylint: disable=protected-access
+        if any(
+            telegram.source_address == tunnel._src_address for tunnel in self.tunnels
+        ):
+            # sent by a tunnel of the pool
+            return
+        now = asyncio.get_running_loop().time()
+        while self._received:
+            oldest = next(iter(self._received))
+            if self._received[oldest][0] > now - self.DUPLICATE_WINDOW:
+                break
+            del self._received[oldest]
+
+        key = (
+            telegram.source_address,
+            telegram.destination_address,
+            telegram.payload.to_knx() if telegram.payload is not None else None,
+        )
+        received = self._received.get(key)
+        if received is not None and index not in received[1]:
+            received[1].add(index)
+            return
+        # a telegram received again by the same tunnel was sent again
+        self._received.pop(key, None)
+        self._received[key] = (now, {index})
+        if self.telegram_received_callback is not None:
+            self.telegram_received_callback(telegram)
+
+
+def _set_result(result: asyncio.Future[None]) -> None:
+    """Resolve the result of a queued telegram unless the sender was cancelled."""
+    if not result.done():
+        result.set_result(None)
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import logging
-from typing import TYPE_CHECKING, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from .error_code import ErrorCode
 from .knxip_enum import KNXIPServiceType
@@ -18,6 +18,14 @@ class KNXIPBody(ABC):
     """Base class for all KNX/IP bodies."""
 
     SERVICE_TYPE: ClassVar[KNXIPServiceType] = cast(KNXIPServiceType, None)
+    # body classes by raw service type value - used by KNXIPFrame to parse frames
+    body_classes: ClassVar[dict[int, type[KNXIPBody]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Register body classes defining a SERVICE_TYPE."""
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("SERVICE_TYPE") is not None:
+            KNXIPBody.body_classes[cls.SERVICE_TYPE.value] = cls
 
     def __init__(self, xknx: XKNX):
         """Initialize KNXIPBody object."""
@@ -35,6 +43,12 @@ class KNXIPBody(ABC):
     def to_knx(self) -> bytes:
         """Serialize to KNX/IP raw data."""
 
+    def to_knx_into(self, buffer: bytearray, offset: int) -> int:
+        """Serialize to KNX/IP raw data into buffer at offset. Return number of bytes written."""
+        raw = self.to_knx()
+        buffer[offset : offset + len(raw)] = raw
+        return len(raw)
+
     def __eq__(self, other: object) -> bool:
         """Equal operator."""
         return self.__dict__ == other.__dict__
@@ -13,10 +13,10 @@ Documentation within:
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from xknx.exceptions import ConversionError, CouldNotParseKNXIP, UnsupportedCEMIMessage
-from xknx.telegram import GroupAddress, IndividualAddress, Telegram
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram, TelegramPriority
 from xknx.telegram.apci import APCI
 
 from .knxip_enum import CEMIFlags, CEMIMessageCode
@@ -24,10 +24,21 @@ from .knxip_enum import CEMIFlags, CEMIMessageCode
 if TYPE_CHECKING:
     from xknx.xknx import XKNX
 
+_PRIORITY_MASK: Final = 0x0C00
+_PRIORITY_FLAGS: Final = {
+    TelegramPriority.SYSTEM: CEMIFlags.PRIORITY_SYSTE,
+    TelegramPriority.NORMAL: CEMIFlags.PRIORITY_NORMAL,
+    TelegramPriority.URGENT: CEMIFlags.PRIORITY_URGENT,
+    TelegramPriority.LOW: CEMIFlags.PRIORITY_LOW,
+}
+_FLAGS_PRIORITY: Final = {flag: priority for priority, flag in _PRIORITY_FLAGS.items()}
+
 
 class CEMIFrame:
     """Representation of a CEMI Frame."""
 
+    __slots__ = ("xknx", "code", "flags", "src_addr", "dst_addr", "mpdu_len", "payload")
+
     def __init__(
         self,
         xknx: XKNX,
@@ -68,6 +79,7 @@ class CEMIFrame:
             destination_address=self.dst_addr,
             payload=self.payload,
             source_address=self.src_addr,
+            priority=_FLAGS_PRIORITY[self.flags & _PRIORITY_MASK],
         )
 
     @telegram.setter
@@ -79,7 +91,7 @@ class CEMIFrame:
             CEMIFlags.FRAME_TYPE_STANDARD
             | CEMIFlags.DO_NOT_REPEAT
             | CEMIFlags.BROADCAST
-            | CEMIFlags.PRIORITY_LOW
+            | _PRIORITY_FLAGS[telegram.priority]
             | CEMIFlags.NO_ACK_REQUESTED
             | CEMIFlags.CONFIRM_NO_ERROR
             | CEMIFlags.HOP_COUNT_1ST
@@ -144,14 +156,15 @@ class CEMIFrame:
         # Control field 1 and Control field 2 - first 2 octets after Additional information
         self.flags = cemi[2 + addil] * 256 + cemi[3 + addil]
 
-        self.src_addr = IndividualAddress((cemi[4 + addil], cemi[5 + addil]))
+        self.src_addr = IndividualAddress((cemi[4 + addil] << 8) + cemi[5 + addil])
 
         if self.flags & CEMIFlags.DESTINATION_GROUP_ADDRESS:
             self.dst_addr = GroupAddress(
-                (cemi[6 + addil], cemi[7 + addil]), levels=self.xknx.address_format
+                (cemi[6 + addil] << 8) + cemi[7 + addil],
+                levels=self.xknx.address_format,
             )
         else:
-            self.dst_addr = IndividualAddress((cemi[6 + addil], cemi[7 + addil]))
+            self.dst_addr = IndividualAddress((cemi[6 + addil] << 8) + cemi[7 + addil])
 
         self.mpdu_len = cemi[8 + addil]
 
@@ -179,6 +192,12 @@ class CEMIFrame:
 
     def to_knx(self) -> bytes:
         """Serialize to KNX/IP raw data."""
+        buffer = bytearray(self.calculated_length())
+        self.to_knx_into(buffer, 0)
+        return bytes(buffer)
+
+    def to_knx_into(self, buffer: bytearray, offset: int) -> int:
+        """Serialize to KNX/IP raw data into buffer at offset. Return number of bytes written."""
         if not isinstance(self.payload, APCI):
             raise TypeError()
         if not isinstance(self.src_addr, (GroupAddress, IndividualAddress)):
@@ -186,23 +205,21 @@ class CEMIFrame:
         if not isinstance(self.dst_addr, (GroupAddress, IndividualAddress)):
             raise ConversionError("dst_addr not set")
 
-        return (
-            bytes(
-                (
-                    self.code.value,
-                    0x00,  # Additional information length
-                )
-            )
-            + self.flags.to_bytes(2, "big")
-            + bytes(
-                (
-                    *self.src_addr.to_knx(),
-                    *self.dst_addr.to_knx(),
-                    self.payload.calculated_length(),
-                )
-            )
-            + self.payload.to_knx()
+        flags = self.flags
+        src_raw = self.src_addr.raw
+        dst_raw = self.dst_addr.raw
+        buffer[offset : offset + 9] = (
+            self.code.value,
+            0x00,  # Additional information length
+            flags >> 8 & 0xFF,
+            flags & 0xFF,
+            src_raw >> 8,
+            src_raw & 0xFF,
+            dst_raw >> 8,
+            dst_raw & 0xFF,
+            self.payload.calculated_length(),
         )
+        return 9 + self.payload.to_knx_into(buffer, offset + 9)
 
     def __str__(self) -> str:
         """Return object as readable string."""
@@ -217,4 +234,6 @@ class CEMIFrame:
 
     def __eq__(self, other: object) -> bool:
         """Equal operator."""
-        return self.__dict__ == other.__dict__
+        return isinstance(other, CEMIFrame) and all(
+            getattr(self, attr) == getattr(other, attr) for attr in self.__slots__
+        )
@@ -95,7 +95,7 @@ class DIBGeneric(DIB):
             self.dtc = DIBTypeCode(raw[1])
         except ValueError:
             self.dtc = raw[1]
-        self.data = raw[2:dib_length]
+        self.data = bytes(raw[2:dib_length])
 
         return dib_length
 
@@ -231,7 +231,9 @@ class DIBDeviceInformation(DIB):
         self.serial_number = raw[8:14].hex(":")
         self.multicast_address = socket.inet_ntoa(raw[14:18])
         self.mac_address = raw[18:24].hex(":")
-        self.name = raw[24:54].decode(encoding="latin_1", errors="replace").rstrip("\0")
+        self.name = (
+            bytes(raw[24:54]).decode(encoding="latin_1", errors="replace").rstrip("\0")
+        )
         return DIBDeviceInformation.LENGTH
 
     def to_knx(self) -> bytes:
@@ -8,6 +8,9 @@ from xknx.exceptions import CouldNotParseKNXIP, IncompleteKNXIPFrame
 from .body import KNXIPBody
 from .knxip_enum import KNXIPServiceType
 
+# lookup by raw value is faster than calling the Enum
+_SERVICE_TYPES: Final = {service.value: service for service in KNXIPServiceType}
+
 
 class KNXIPHeader:
     """Class for serialization and deserialization of KNX/IP Header."""
@@ -33,8 +36,8 @@ class KNXIPHeader:
             raise CouldNotParseKNXIP("wrong protocol version")
 
         try:
-            self.service_type_ident = KNXIPServiceType(data[2] * 256 + data[3])
-        except ValueError:
+            self.service_type_ident = _SERVICE_TYPES[data[2] * 256 + data[3]]
+        except KeyError:
             raise CouldNotParseKNXIP(
                 f"KNXIPServiceType unknown: {hex(data[2] * 256 + data[3])}"
             )
@@ -55,6 +58,19 @@ class KNXIPHeader:
             + self.total_length.to_bytes(2, "big")
         )
 
+    def to_knx_into(self, buffer: bytearray, offset: int) -> int:
+        """Serialize to KNX/IP raw data into buffer at offset. Return number of bytes written."""
+        service_type = self.service_type_ident.value
+        buffer[offset : offset + KNXIPHeader.HEADERLENGTH] = (
+            KNXIPHeader.HEADERLENGTH,
+            KNXIPHeader.PROTOCOLVERSION,
+            service_type >> 8,
+            service_type & 0xFF,
+            self.total_length >> 8,
+            self.total_length & 0xFF,
+        )
+        return KNXIPHeader.HEADERLENGTH
+
     def __str__(self) -> str:
         """Return object as readable string."""
         return (
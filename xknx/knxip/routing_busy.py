@@ -0,0 +1,67 @@
+"""
+Module for Serialization and Deserialization of KNX Routing Busy.
+
+A KNXnet/IP router sends a routing busy frame if its incoming queue is about to overflow.
+Receiving devices pause sending routing indications for the given wait time.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from xknx.exceptions import CouldNotParseKNXIP
+
+from .body import KNXIPBody
+from .knxip_enum import KNXIPServiceType
+
+if TYPE_CHECKING:
+    from xknx.xknx import XKNX
+
+
+class RoutingBusy(KNXIPBody):
+    """Representation of a KNX Routing Busy."""
+
+    SERVICE_TYPE = KNXIPServiceType.ROUTING_BUSY
+    LENGTH = 6
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        device_state: int = 0,
+        wait_time: int = 100,
+        control_field: int = 0,
+    ):
+        """Initialize RoutingBusy object. `wait_time` in milliseconds."""
+        super().__init__(xknx)
+        self.device_state = device_state
+        self.wait_time = wait_time
+        self.control_field = control_field
+
+    def calculated_length(self) -> int:
+        """Get length of KNX/IP body."""
+        return RoutingBusy.LENGTH
+
+    def from_knx(self, raw: bytes) -> int:
+        """Parse/deserialize from KNX/IP raw data."""
+        if len(raw) < RoutingBusy.LENGTH or raw[0] != RoutingBusy.LENGTH:
+            raise CouldNotParseKNXIP("RoutingBusy has wrong length")
+        self.device_state = raw[1]
+        self.wait_time = raw[2] << 8 | raw[3]
+        self.control_field = raw[4] << 8 | raw[5]
+        return RoutingBusy.LENGTH
+
+    def to_knx(self) -> bytes:
+        """Serialize to KNX/IP raw data."""
+        return (
+            bytes((RoutingBusy.LENGTH, self.device_state))
+            + self.wait_time.to_bytes(2, "big")
+            + self.control_field.to_bytes(2, "big")
+        )
+
+    def __str__(self) -> str:
+        """Return object as readable string."""
+        return (
+            "<RoutingBusy "
+            f'device_state="{self.device_state}" '
+            f'wait_time="{self.wait_time}" '
+            f'control_field="{self.control_field}" />'
+        )
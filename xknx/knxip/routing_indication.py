@@ -55,6 +55,12 @@ class RoutingIndication(KNXIPBody):
             raise CouldNotParseKNXIP("No CEMIFrame defined.")
         return self.cemi.to_knx()
 
+    def to_knx_into(self, buffer: bytearray, offset: int) -> int:
+        """Serialize to KNX/IP raw data into buffer at offset. Return number of bytes written."""
+        if self.cemi is None:
+            raise CouldNotParseKNXIP("No CEMIFrame defined.")
+        return self.cemi.to_knx_into(buffer, offset)
+
     def __str__(self) -> str:
         """Return object as readable string."""
         return f'<RoutingIndication cemi="{self.cemi}" />'
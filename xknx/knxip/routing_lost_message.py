@@ -0,0 +1,56 @@
+"""
+Module for Serialization and Deserialization of KNX Routing Lost Message.
+
+A KNXnet/IP router sends a routing lost message frame if it had to discard
+routing indications because its incoming queue overflowed.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from xknx.exceptions import CouldNotParseKNXIP
+
+from .body import KNXIPBody
+from .knxip_enum import KNXIPServiceType
+
+if TYPE_CHECKING:
+    from xknx.xknx import XKNX
+
+
+class RoutingLostMessage(KNXIPBody):
+    """Representation of a KNX Routing Lost Message."""
+
+    SERVICE_TYPE = KNXIPServiceType.ROUTING_LOST_MESSAGE
+    LENGTH = 4
+
+    def __init__(self, xknx: XKNX, device_state: int = 0, lost_messages: int = 0):
+        """Initialize RoutingLostMessage object."""
+        super().__init__(xknx)
+        self.device_state = device_state
+        self.lost_messages = lost_messages
+
+    def calculated_length(self) -> int:
+        """Get length of KNX/IP body."""
+        return RoutingLostMessage.LENGTH
+
+    def from_knx(self, raw: bytes) -> int:
+        """Parse/deserialize from KNX/IP raw data."""
+        if len(raw) < RoutingLostMessage.LENGTH or raw[0] != RoutingLostMessage.LENGTH:
+            raise CouldNotParseKNXIP("RoutingLostMessage has wrong length")
+        self.device_state = raw[1]
+        self.lost_messages = raw[2] << 8 | raw[3]
+        return RoutingLostMessage.LENGTH
+
+    def to_knx(self) -> bytes:
+        """Serialize to KNX/IP raw data."""
+        return bytes(
+            (RoutingLostMessage.LENGTH, self.device_state)
+        ) + self.lost_messages.to_bytes(2, "big")
+
+    def __str__(self) -> str:
+        """Return object as readable string."""
+        return (
+            "<RoutingLostMessage "
+            f'device_state="{self.device_state}" '
+            f'lost_messages="{self.lost_messages}" />'
+        )
@@ -59,6 +59,16 @@ class TunnellingAck(KNXIPBodyResponse):
             )
         )
 
+    def to_knx_into(self, buffer: bytearray, offset: int) -> int:
+        """Serialize to KNX/IP raw data into buffer at offset. Return number of bytes written."""
+        buffer[offset : offset + TunnellingAck.BODY_LENGTH] = (
+            TunnellingAck.BODY_LENGTH,
+            self.communication_channel_id,
+            self.sequence_counter,
+            self.status_code.value,
+        )
+        return TunnellingAck.BODY_LENGTH
+
     def __str__(self) -> str:
         """Return object as readable string."""
         return (
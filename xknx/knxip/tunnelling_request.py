@@ -89,6 +89,20 @@ class TunnellingRequest(KNXIPBody):
             + self.cemi.to_knx()
         )
 
+    def to_knx_into(self, buffer: bytearray, offset: int) -> int:
+        """Serialize to KNX/IP raw data into buffer at offset. Return number of bytes written."""
+        if self.cemi is None:
+            raise CouldNotParseKNXIP("No CEMIFrame defined.")
+        buffer[offset : offset + TunnellingRequest.HEADER_LENGTH] = (
+            TunnellingRequest.HEADER_LENGTH,
+            self.communication_channel_id,
+            self.sequence_counter,
+            0x00,  # Reserved
+        )
+        return TunnellingRequest.HEADER_LENGTH + self.cemi.to_knx_into(
+            buffer, offset + TunnellingRequest.HEADER_LENGTH
+        )
+
     def __str__(self) -> str:
         """Return object as readable string."""
         return (
@@ -65,13 +65,16 @@ class RemoteValue(ABC, Generic[DPTPayloadType, ValueType]):
             self.passive_group_addresses.extend(passive)  # type: ignore
             return active
 
-        self.group_address = unpack_group_addresses(group_address)
-        self.group_address_state = unpack_group_addresses(group_address_state)
+        self._group_address = unpack_group_addresses(group_address)
+        self._group_address_state = unpack_group_addresses(group_address_state)
+        self.xknx.devices.invalidate_group_address_index()
 
         self.device_name: str = "Unknown" if device_name is None else device_name
         self.feature_name: str = "Unknown" if feature_name is None else feature_name
         self._value: ValueType | None = None
         self.telegram: Telegram | None = None
+        # value was restored from StateStore and not received from the bus yet
+        self.stale = False
         self.after_update_cb: AsyncCallbackType | None = after_update_cb
 
         if sync_state and self.group_address_state:
@@ -88,6 +91,28 @@ class RemoteValue(ABC, Generic[DPTPayloadType, ValueType]):
             # AttributeError if instantiation failed (tests mostly)
             pass
 
+    @property
+    def group_address(self) -> DeviceGroupAddress | None:
+        """Return the group address used for sending."""
+        return self._group_address
+
+    @group_address.setter
+    def group_address(self, group_address: DeviceGroupAddress | None) -> None:
+        """Set the group address used for sending."""
+        self._group_address = group_address
+        self.xknx.devices.invalidate_group_address_index()
+
+    @property
+    def group_address_state(self) -> DeviceGroupAddress | None:
+        """Return the group address used for reading state."""
+        return self._group_address_state
+
+    @group_address_state.setter
+    def group_address_state(self, group_address: DeviceGroupAddress | None) -> None:
+        """Set the group address used for reading state."""
+        self._group_address_state = group_address
+        self.xknx.devices.invalidate_group_address_index()
+
     @property
     def value(self) -> ValueType | None:
         """Get current value."""
@@ -126,16 +151,17 @@ class RemoteValue(ABC, Generic[DPTPayloadType, ValueType]):
         """Evaluate if remote value has a group_address set."""
         return bool(self.group_address)
 
+    def group_addresses(self) -> Iterator[DeviceGroupAddress]:
+        """Yield all group addresses of this remote value."""
+        if self._group_address is not None:
+            yield self._group_address
+        if self._group_address_state is not None:
+            yield self._group_address_state
+        yield from self.passive_group_addresses
+
     def has_group_address(self, group_address: DeviceGroupAddress) -> bool:
         """Test if device has given group address."""
-
-        def remote_value_addresses() -> Iterator[DeviceGroupAddress | None]:
-            """Yield all group_addresses."""
-            yield self.group_address
-            yield self.group_address_state
-            yield from self.passive_group_addresses
-
-        return group_address in remote_value_addresses()
+        return group_address in self.group_addresses()
 
     @abstractmethod
     def payload_valid(self, payload: DPTArray | DPTBinary | None) -> DPTPayloadType:
@@ -184,6 +210,7 @@ class RemoteValue(ABC, Generic[DPTPayloadType, ValueType]):
                 err,
             )
             return False
+        self.stale = False
         self.xknx.state_updater.update_received(self)
         if self._value is None or always_callback or self._value != decoded_payload:
             self._value = decoded_payload
@@ -8,7 +8,7 @@ Module for handling KNX primitves.
 # flake8: noqa
 from .address import GroupAddress, GroupAddressType, IndividualAddress
 from .address_filter import AddressFilter
-from .telegram import Telegram, TelegramDirection
+from .telegram import Telegram, TelegramDirection, TelegramPriority
 
 __all__ = [
     "AddressFilter",
@@ -17,4 +17,5 @@ __all__ = [
     "IndividualAddress",
     "Telegram",
     "TelegramDirection",
+    "TelegramPriority",
 ]
@@ -65,6 +65,8 @@ def address_tuple_to_int(address: tuple[int, int]) -> int:
 class BaseAddress(ABC):
     """Base class for all knx address types."""
 
+    __slots__ = ("raw",)
+
     def __init__(self) -> None:
         """Initialize instance variables needed by all subclasses."""
         self.raw: int = 0
@@ -96,6 +98,8 @@ class BaseAddress(ABC):
 class IndividualAddress(BaseAddress):
     """Class for handling KNX individual addresses."""
 
+    __slots__ = ()
+
     MAX_AREA = 15
     MAX_MAIN = 15
     MAX_LINE = 255
@@ -197,6 +201,8 @@ class GroupAddressType(Enum):
 class GroupAddress(BaseAddress):
     """Class for handling KNX group addresses."""
 
+    __slots__ = ("levels",)
+
     MAX_MAIN = 31
     MAX_MIDDLE = 7
     MAX_SUB_LONG = 255
@@ -216,7 +222,9 @@ class GroupAddress(BaseAddress):
         super().__init__()
         self.levels = levels
 
-        if isinstance(address, GroupAddress):
+        if isinstance(address, int):
+            self.raw = address
+        elif isinstance(address, GroupAddress):
             self.raw = address.raw
         elif isinstance(address, str):
             if address.isdigit():
@@ -225,8 +233,6 @@ class GroupAddress(BaseAddress):
                 self.raw = self.__string_to_int(address)
         elif isinstance(address, tuple) and len(address) == 2:
             self.raw = address_tuple_to_int(address)
-        elif isinstance(address, int):
-            self.raw = address
         elif address is None:
             self.raw = 0
         else:
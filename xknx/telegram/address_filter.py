@@ -33,7 +33,32 @@ from fnmatch import fnmatch
 
 from xknx.exceptions import ConversionError
 
-from .address import GroupAddress, InternalGroupAddress, parse_device_group_address
+from .address import (
+    GroupAddress,
+    GroupAddressType,
+    InternalGroupAddress,
+    parse_device_group_address,
+)
+
+# (level name, bit shift, maximum value) of the parts of a raw group address
+_GROUP_ADDRESS_LEVELS: dict[GroupAddressType, tuple[tuple[str, int, int], ...]] = {
+    GroupAddressType.LONG: (
+        ("main", 11, GroupAddress.MAX_MAIN),
+        ("middle", 8, GroupAddress.MAX_MIDDLE),
+        ("sub", 0, GroupAddress.MAX_SUB_LONG),
+    ),
+    GroupAddressType.SHORT: (
+        ("main", 11, GroupAddress.MAX_MAIN),
+        ("sub", 0, GroupAddress.MAX_SUB_SHORT),
+    ),
+    GroupAddressType.FREE: (("sub", 0, GroupAddress.MAX_FREE),),
+}
+# level names the level filters of a pattern apply to - by number of filters
+_FILTER_LEVELS: dict[int, tuple[str, ...]] = {
+    1: ("sub",),
+    2: ("main", "sub"),
+    3: ("main", "middle", "sub"),
+}
 
 
 class AddressFilter:
@@ -43,6 +68,7 @@ class AddressFilter:
         """Initialize AddressFilter class."""
         self.level_filters: list[AddressFilter.LevelFilter] = []
         self.internal_group_address_pattern: str | None = None
+        self._match_tables: dict[GroupAddressType, bytes] = {}
         self._parse_pattern(pattern)
 
     def _parse_pattern(self, pattern: str) -> None:
@@ -75,6 +101,38 @@ class AddressFilter:
 
         return False
 
+    def match_table(self, levels: GroupAddressType = GroupAddressType.LONG) -> bytes:
+        """
+        Return a lookup table for GroupAddresses using `levels`.
+
+        The table has an entry for every raw group address value. It is non-zero
+        if the address matches the filter. Tables are built once per level type.
+        """
+        try:
+            return self._match_tables[levels]
+        except KeyError:
+            pass
+        table = bytearray(GroupAddress.MAX_FREE + 1)
+        filters = dict(
+            zip(_FILTER_LEVELS.get(len(self.level_filters), ()), self.level_filters)
+        )
+        address_levels = _GROUP_ADDRESS_LEVELS[levels]
+        # a filter using levels not available for the address type never matches
+        if filters and filters.keys() <= {name for name, _, _ in address_levels}:
+            raws = [0]
+            for name, shift, maximum in address_levels:
+                level_filter = filters.get(name)
+                values = [
+                    value << shift
+                    for value in range(maximum + 1)
+                    if level_filter is None or level_filter.match(value)
+                ]
+                raws = [raw | value for raw in raws for value in values]
+            for raw in raws:
+                table[raw] = 1
+        self._match_tables[levels] = bytes(table)
+        return self._match_tables[levels]
+
     def _match_level3(self, address: GroupAddress) -> bool:
         if address.main is None or address.middle is None:
             raise ConnectionError(
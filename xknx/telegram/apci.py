@@ -34,7 +34,25 @@ def encode_cmd_and_payload(
         ]
     )
     data.extend(appended_payload)
-    return data
+    return bytes(data)
+
+
+def encode_cmd_and_payload_into(
+    buffer: bytearray,
+    offset: int,
+    cmd: APCIService | APCIUserService | APCIExtendedService,
+    encoded_payload: int = 0,
+    appended_payload: tuple[int, ...] = (),
+) -> int:
+    """Encode cmd and payload into buffer at offset. Return number of bytes written."""
+    value = cmd.value
+    length = 2 + len(appended_payload)
+    buffer[offset : offset + length] = (
+        (value >> 8) & 0xFF,
+        (value & 0xFF) | (encoded_payload & DPTBinary.APCI_BITMASK),
+        *appended_payload,
+    )
+    return length
 
 
 class APCIService(Enum):
@@ -105,6 +123,8 @@ class APCI(ABC):
     This base class is only the interface for the derived classes.
     """
 
+    __slots__: tuple[str, ...] = ()
+
     CODE: ClassVar[APCIService | APCIUserService | APCIExtendedService] = cast(
         APCIService, None
     )
@@ -121,9 +141,17 @@ class APCI(ABC):
     def to_knx(self) -> bytes:
         """Serialize to KNX/IP raw data - to be implemented in derived class."""
 
+    def to_knx_into(self, buffer: bytearray, offset: int) -> int:
+        """Serialize to KNX/IP raw data into buffer at offset. Return number of bytes written."""
+        raw = self.to_knx()
+        buffer[offset : offset + len(raw)] = raw
+        return len(raw)
+
     def __eq__(self, other: object) -> bool:
         """Equal operator."""
-        return self.__dict__ == other.__dict__
+        return type(self) is type(other) and all(
+            getattr(self, attr) == getattr(other, attr) for attr in self.__slots__
+        )
 
     @staticmethod
     def resolve_apci(apci: int) -> APCI:
@@ -132,78 +160,12 @@ class APCI(ABC):
 
         There are only 16 possible APCI services. The
         `APCIService.USER_MESSAGE` and `APCIService.ESCAPE` service have
-        several sub-services.
+        several sub-services. The 10 bit APCI is looked up in a precomputed table.
         """
-        service = apci & 0x03C0
-
-        if service == APCIService.GROUP_READ.value:
-            return GroupValueRead()
-        if service == APCIService.GROUP_WRITE.value:
-            return GroupValueWrite()
-        if service == APCIService.GROUP_RESPONSE.value:
-            return GroupValueResponse()
-        if service == APCIService.INDIVIDUAL_ADDRESS_WRITE.value:
-            return IndividualAddressWrite()
-        if service == APCIService.INDIVIDUAL_ADDRESS_READ.value:
-            return IndividualAddressRead()
-        if service == APCIService.INDIVIDUAL_ADDRESS_RESPONSE.value:
-            return IndividualAddressResponse()
-        if service == APCIService.ADC_READ.value:
-            return ADCRead()
-        if service == APCIService.ADC_RESPONSE.value:
-            return ADCResponse()
-        if service == APCIService.MEMORY_READ.value:
-            return MemoryRead()
-        if service == APCIService.MEMORY_WRITE.value:
-            return MemoryWrite()
-        if service == APCIService.MEMORY_RESPONSE.value:
-            return MemoryResponse()
-        if service == APCIService.USER_MESSAGE.value:
-            if apci == APCIUserService.USER_MEMORY_READ.value:
-                return UserMemoryRead()
-            if apci == APCIUserService.USER_MEMORY_RESPONSE.value:
-                return UserMemoryResponse()
-            if apci == APCIUserService.USER_MEMORY_WRITE.value:
-                return UserMemoryWrite()
-            if apci == APCIUserService.USER_MANUFACTURER_INFO_READ.value:
-                return UserManufacturerInfoRead()
-            if apci == APCIUserService.USER_MANUFACTURER_INFO_RESPONSE.value:
-                return UserManufacturerInfoResponse()
-            if apci == APCIUserService.FUNCTION_PROPERTY_COMMAND.value:
-                return FunctionPropertyCommand()
-            if apci == APCIUserService.FUNCTION_PROPERTY_STATE_READ.value:
-                return FunctionPropertyStateRead()
-            if apci == APCIUserService.FUNCTION_PROPERTY_STATE_RESPONSE.value:
-                return FunctionPropertyStateResponse()
-        if service == APCIService.DEVICE_DESCRIPTOR_READ.value:
-            return DeviceDescriptorRead()
-        if service == APCIService.DEVICE_DESCRIPTOR_RESPONSE.value:
-            return DeviceDescriptorResponse()
-        if service == APCIService.RESTART.value:
-            return Restart()
-        if service == APCIService.ESCAPE.value:
-            if apci == APCIExtendedService.AUTHORIZE_REQUEST.value:
-                return AuthorizeRequest()
-            if apci == APCIExtendedService.AUTHORIZE_RESPONSE.value:
-                return AuthorizeResponse()
-            if apci == APCIExtendedService.PROPERTY_VALUE_READ.value:
-                return PropertyValueRead()
-            if apci == APCIExtendedService.PROPERTY_VALUE_WRITE.value:
-                return PropertyValueWrite()
-            if apci == APCIExtendedService.PROPERTY_VALUE_RESPONSE.value:
-                return PropertyValueResponse()
-            if apci == APCIExtendedService.PROPERTY_DESCRIPTION_READ.value:
-                return PropertyDescriptionRead()
-            if apci == APCIExtendedService.PROPERTY_DESCRIPTION_RESPONSE.value:
-                return PropertyDescriptionResponse()
-            if apci == APCIExtendedService.INDIVIDUAL_ADDRESS_SERIAL_READ.value:
-                return IndividualAddressSerialRead()
-            if apci == APCIExtendedService.INDIVIDUAL_ADDRESS_SERIAL_RESPONSE.value:
-                return IndividualAddressSerialResponse()
-            if apci == APCIExtendedService.INDIVIDUAL_ADDRESS_SERIAL_WRITE.value:
-                return IndividualAddressSerialWrite()
-
-        raise ConversionError(f"Class not implemented for APCI {apci:#012b}.")
+        apci_class = _APCI_CLASSES[apci & 0x03FF]
+        if apci_class is None:
+            raise ConversionError(f"Class not implemented for APCI {apci:#012b}.")
+        return apci_class()
 
 
 class GroupValueRead(APCI):
@@ -213,6 +175,8 @@ class GroupValueRead(APCI):
     Does not have any payload.
     """
 
+    __slots__ = ()
+
     CODE = APCIService.GROUP_READ
 
     def calculated_length(self) -> int:
@@ -229,6 +193,10 @@ class GroupValueRead(APCI):
         """Serialize to KNX/IP raw data."""
         return encode_cmd_and_payload(self.CODE)
 
+    def to_knx_into(self, buffer: bytearray, offset: int) -> int:
+        """Serialize to KNX/IP raw data into buffer at offset. Return number of bytes written."""
+        return encode_cmd_and_payload_into(buffer, offset, self.CODE)
+
     def __str__(self) -> str:
         """Return object as readable string."""
         return "<GroupValueRead />"
@@ -241,6 +209,8 @@ class GroupValueWrite(APCI):
     Takes a value (DPT) as payload.
     """
 
+    __slots__ = ("value",)
+
     CODE = APCIService.GROUP_WRITE
 
     def __init__(self, value: DPTBinary | DPTArray | None = None) -> None:
@@ -272,6 +242,18 @@ class GroupValueWrite(APCI):
             )
         raise TypeError()
 
+    def to_knx_into(self, buffer: bytearray, offset: int) -> int:
+        """Serialize to KNX/IP raw data into buffer at offset. Return number of bytes written."""
+        if isinstance(self.value, DPTBinary):
+            return encode_cmd_and_payload_into(
+                buffer, offset, self.CODE, encoded_payload=self.value.value
+            )
+        if isinstance(self.value, DPTArray):
+            return encode_cmd_and_payload_into(
+                buffer, offset, self.CODE, appended_payload=self.value.value
+            )
+        raise TypeError()
+
     def __str__(self) -> str:
         """Return object as readable string."""
         return f'<GroupValueWrite value="{self.value}" />'
@@ -284,6 +266,8 @@ class GroupValueResponse(APCI):
     Takes a value (DPT) as payload.
     """
 
+    __slots__ = ("value",)
+
     CODE = APCIService.GROUP_RESPONSE
 
     def __init__(self, value: DPTBinary | DPTArray | None = None) -> None:
@@ -315,6 +299,18 @@ class GroupValueResponse(APCI):
             )
         raise TypeError()
 
+    def to_knx_into(self, buffer: bytearray, offset: int) -> int:
+        """Serialize to KNX/IP raw data into buffer at offset. Return number of bytes written."""
+        if isinstance(self.value, DPTBinary):
+            return encode_cmd_and_payload_into(
+                buffer, offset, self.CODE, encoded_payload=self.value.value
+            )
+        if isinstance(self.value, DPTArray):
+            return encode_cmd_and_payload_into(
+                buffer, offset, self.CODE, appended_payload=self.value.value
+            )
+        raise TypeError()
+
     def __str__(self) -> str:
         """Return object as readable string."""
         return f'<GroupValueResponse value="{self.value}" />'
@@ -327,6 +323,8 @@ class IndividualAddressWrite(APCI):
     Payload contains the serial number and (new) address of the device.
     """
 
+    __slots__ = ("address",)
+
     CODE = APCIService.INDIVIDUAL_ADDRESS_WRITE
 
     def __init__(
@@ -363,6 +361,8 @@ class IndividualAddressWrite(APCI):
 class IndividualAddressRead(APCI):
     """IndividualAddressRead service."""
 
+    __slots__ = ()
+
     CODE = APCIService.INDIVIDUAL_ADDRESS_READ
 
     def calculated_length(self) -> int:
@@ -392,6 +392,8 @@ class IndividualAddressResponse(APCI):
     response address.
     """
 
+    __slots__ = ()
+
     CODE = APCIService.INDIVIDUAL_ADDRESS_RESPONSE
 
     def calculated_length(self) -> int:
@@ -420,6 +422,8 @@ class ADCRead(APCI):
     Payload contains the channel and number of samples to take.
     """
 
+    __slots__ = ("channel", "count")
+
     CODE = APCIService.ADC_READ
 
     def __init__(self, channel: int = 0, count: int = 0) -> None:
@@ -457,6 +461,8 @@ class ADCResponse(APCI):
     Payload contains the channel, number of samples and value.
     """
 
+    __slots__ = ("channel", "count", "value")
+
     CODE = APCIService.ADC_RESPONSE
 
     def __init__(self, channel: int = 0, count: int = 0, value: int = 0) -> None:
@@ -495,6 +501,8 @@ class MemoryRead(APCI):
     Payload indicates address (64 KiB) and count (1-63 bytes).
     """
 
+    __slots__ = ("address", "count")
+
     CODE = APCIService.MEMORY_READ
 
     def __init__(self, address: int = 0, count: int = 0) -> None:
@@ -537,6 +545,8 @@ class MemoryWrite(APCI):
     Payload indicates address (64 KiB), count (1-63 bytes) and data.
     """
 
+    __slots__ = ("address", "count", "data")
+
     CODE = APCIService.MEMORY_WRITE
 
     def __init__(
@@ -589,6 +599,8 @@ class MemoryResponse(APCI):
     Payload indicates address (64 KiB), count (1-63 bytes) and data.
     """
 
+    __slots__ = ("address", "count", "data")
+
     CODE = APCIService.MEMORY_RESPONSE
 
     def __init__(
@@ -641,6 +653,8 @@ class DeviceDescriptorRead(APCI):
     Payload contains the descriptor.
     """
 
+    __slots__ = ("descriptor",)
+
     CODE = APCIService.DEVICE_DESCRIPTOR_READ
 
     def __init__(self, descriptor: int = 0) -> None:
@@ -674,6 +688,8 @@ class DeviceDescriptorResponse(APCI):
     Payload contains the descriptor and value.
     """
 
+    __slots__ = ("descriptor", "value")
+
     CODE = APCIService.DEVICE_DESCRIPTOR_RESPONSE
 
     def __init__(self, descriptor: int = 0, value: int = 0) -> None:
@@ -714,6 +730,8 @@ class Restart(APCI):
     Does not take any payload.
     """
 
+    __slots__ = ()
+
     CODE = APCIService.RESTART
 
     def calculated_length(self) -> int:
@@ -742,6 +760,8 @@ class UserMemoryRead(APCI):
     Payload indicates address (1 MiB) and count (1-15 bytes).
     """
 
+    __slots__ = ("address", "count")
+
     CODE = APCIUserService.USER_MEMORY_READ
 
     def __init__(self, address: int = 0, count: int = 0) -> None:
@@ -786,6 +806,8 @@ class UserMemoryWrite(APCI):
     Payload indicates address (1 MiB), count and data.
     """
 
+    __slots__ = ("address", "count", "data")
+
     CODE = APCIUserService.USER_MEMORY_WRITE
 
     def __init__(
@@ -840,6 +862,8 @@ class UserMemoryResponse(APCI):
     Payload indicates address (1 MiB), count and data.
     """
 
+    __slots__ = ("address", "count", "data")
+
     CODE = APCIUserService.USER_MEMORY_RESPONSE
 
     def __init__(
@@ -890,6 +914,8 @@ class UserMemoryResponse(APCI):
 class UserManufacturerInfoRead(APCI):
     """UserManufacturerInfoRead service."""
 
+    __slots__ = ()
+
     CODE = APCIUserService.USER_MANUFACTURER_INFO_READ
 
     def calculated_length(self) -> int:
@@ -915,6 +941,8 @@ class UserManufacturerInfoRead(APCI):
 class UserManufacturerInfoResponse(APCI):
     """UserManufacturerInfoResponse service."""
 
+    __slots__ = ("manufacturer_id", "data")
+
     CODE = APCIUserService.USER_MANUFACTURER_INFO_RESPONSE
 
     def __init__(self, manufacturer_id: int = 0, data: bytes | None = None) -> None:
@@ -947,6 +975,8 @@ class UserManufacturerInfoResponse(APCI):
 class FunctionPropertyCommand(APCI):
     """FunctionPropertyCommand service."""
 
+    __slots__ = ("object_index", "property_id", "data")
+
     CODE = APCIUserService.FUNCTION_PROPERTY_COMMAND
 
     def __init__(
@@ -989,6 +1019,8 @@ class FunctionPropertyCommand(APCI):
 class FunctionPropertyStateRead(APCI):
     """FunctionPropertyStateRead service."""
 
+    __slots__ = ("object_index", "property_id", "data")
+
     CODE = APCIUserService.FUNCTION_PROPERTY_STATE_READ
 
     def __init__(
@@ -1031,6 +1063,8 @@ class FunctionPropertyStateRead(APCI):
 class FunctionPropertyStateResponse(APCI):
     """FunctionPropertyStateResponse service."""
 
+    __slots__ = ("object_index", "property_id", "return_code", "data")
+
     CODE = APCIUserService.FUNCTION_PROPERTY_STATE_READ
 
     def __init__(
@@ -1085,6 +1119,8 @@ class FunctionPropertyStateResponse(APCI):
 class AuthorizeRequest(APCI):
     """AuthorizeRequest service."""
 
+    __slots__ = ("key",)
+
     CODE = APCIExtendedService.AUTHORIZE_REQUEST
 
     def __init__(self, key: int = 0) -> None:
@@ -1113,6 +1149,8 @@ class AuthorizeRequest(APCI):
 class AuthorizeResponse(APCI):
     """AuthorizeResponse service."""
 
+    __slots__ = ("level",)
+
     CODE = APCIExtendedService.AUTHORIZE_RESPONSE
 
     def __init__(self, level: int = 0) -> None:
@@ -1145,6 +1183,8 @@ class PropertyValueRead(APCI):
     Payload indicates object, property, count and start.
     """
 
+    __slots__ = ("object_index", "property_id", "count", "start_index")
+
     CODE = APCIExtendedService.PROPERTY_VALUE_READ
 
     def __init__(
@@ -1209,6 +1249,8 @@ class PropertyValueWrite(APCI):
     Payload indicates object, property, count, start and data itself.
     """
 
+    __slots__ = ("object_index", "property_id", "count", "start_index", "data")
+
     CODE = APCIExtendedService.PROPERTY_VALUE_WRITE
 
     def __init__(
@@ -1288,6 +1330,8 @@ class PropertyValueResponse(APCI):
     the payload depends on the data.
     """
 
+    __slots__ = ("object_index", "property_id", "count", "start_index", "data")
+
     CODE = APCIExtendedService.PROPERTY_VALUE_RESPONSE
 
     def __init__(
@@ -1362,6 +1406,8 @@ class PropertyValueResponse(APCI):
 class PropertyDescriptionRead(APCI):
     """PropertyDescriptionRead service."""
 
+    __slots__ = ("object_index", "property_id", "property_index")
+
     CODE = APCIExtendedService.PROPERTY_DESCRIPTION_READ
 
     def __init__(
@@ -1398,6 +1444,15 @@ class PropertyDescriptionRead(APCI):
 class PropertyDescriptionResponse(APCI):
     """PropertyDescriptionResponse service."""
 
+    __slots__ = (
+        "object_index",
+        "property_id",
+        "property_index",
+        "type",
+        "max_count",
+        "access",
+    )
+
     CODE = APCIExtendedService.PROPERTY_DESCRIPTION_RESPONSE
 
     def __init__(
@@ -1459,6 +1514,8 @@ class PropertyDescriptionResponse(APCI):
 class IndividualAddressSerialRead(APCI):
     """IndividualAddressSerialRead service."""
 
+    __slots__ = ("serial",)
+
     CODE = APCIExtendedService.INDIVIDUAL_ADDRESS_SERIAL_READ
 
     def __init__(self, serial: bytes | None = None) -> None:
@@ -1493,6 +1550,8 @@ class IndividualAddressSerialRead(APCI):
 class IndividualAddressSerialResponse(APCI):
     """IndividualAddressSerialResponse service."""
 
+    __slots__ = ("serial", "address")
+
     CODE = APCIExtendedService.INDIVIDUAL_ADDRESS_SERIAL_RESPONSE
 
     def __init__(
@@ -1537,6 +1596,8 @@ class IndividualAddressSerialResponse(APCI):
 class IndividualAddressSerialWrite(APCI):
     """IndividualAddressSerialWrite service."""
 
+    __slots__ = ("serial", "address")
+
     CODE = APCIExtendedService.INDIVIDUAL_ADDRESS_SERIAL_WRITE
 
     def __init__(
@@ -1576,3 +1637,57 @@ class IndividualAddressSerialWrite(APCI):
     def __str__(self) -> str:
         """Return object as readable string."""
         return f'<IndividualAddressSerialWrite serial="{self.serial.hex()}" address="{self.address}" />'
+
+
+def _build_apci_classes() -> tuple[type[APCI] | None, ...]:
+    """Return a table mapping every 10 bit APCI value to its payload class."""
+    service_classes: dict[
+        APCIService | APCIUserService | APCIExtendedService, type[APCI]
+    ] = {
+        APCIService.GROUP_READ: GroupValueRead,
+        APCIService.GROUP_WRITE: GroupValueWrite,
+        APCIService.GROUP_RESPONSE: GroupValueResponse,
+        APCIService.INDIVIDUAL_ADDRESS_WRITE: IndividualAddressWrite,
+        APCIService.INDIVIDUAL_ADDRESS_READ: IndividualAddressRead,
+        APCIService.INDIVIDUAL_ADDRESS_RESPONSE: IndividualAddressResponse,
+        APCIService.ADC_READ: ADCRead,
+        APCIService.ADC_RESPONSE: ADCResponse,
+        APCIService.MEMORY_READ: MemoryRead,
+        APCIService.MEMORY_WRITE: MemoryWrite,
+        APCIService.MEMORY_RESPONSE: MemoryResponse,
+        APCIService.DEVICE_DESCRIPTOR_READ: DeviceDescriptorRead,
+        APCIService.DEVICE_DESCRIPTOR_RESPONSE: DeviceDescriptorResponse,
+        APCIService.RESTART: Restart,
+        APCIUserService.USER_MEMORY_READ: UserMemoryRead,
+        APCIUserService.USER_MEMORY_RESPONSE: UserMemoryResponse,
+        APCIUserService.USER_MEMORY_WRITE: UserMemoryWrite,
+        APCIUserService.USER_MANUFACTURER_INFO_READ: UserManufacturerInfoRead,
+        APCIUserService.USER_MANUFACTURER_INFO_RESPONSE: UserManufacturerInfoResponse,
+        APCIUserService.FUNCTION_PROPERTY_COMMAND: FunctionPropertyCommand,
+        APCIUserService.FUNCTION_PROPERTY_STATE_READ: FunctionPropertyStateRead,
+        APCIUserService.FUNCTION_PROPERTY_STATE_RESPONSE: FunctionPropertyStateResponse,
+        APCIExtendedService.AUTHORIZE_REQUEST: AuthorizeRequest,
+        APCIExtendedService.AUTHORIZE_RESPONSE: AuthorizeResponse,
+        APCIExtendedService.PROPERTY_VALUE_READ: PropertyValueRead,
+        APCIExtendedService.PROPERTY_VALUE_WRITE: PropertyValueWrite,
+        APCIExtendedService.PROPERTY_VALUE_RESPONSE: PropertyValueResponse,
+        APCIExtendedService.PROPERTY_DESCRIPTION_READ: PropertyDescriptionRead,
+        APCIExtendedService.PROPERTY_DESCRIPTION_RESPONSE: PropertyDescriptionResponse,
+        APCIExtendedService.INDIVIDUAL_ADDRESS_SERIAL_READ: IndividualAddressSerialRead,
+        APCIExtendedService.INDIVIDUAL_ADDRESS_SERIAL_RESPONSE: IndividualAddressSerialResponse,
+        APCIExtendedService.INDIVIDUAL_ADDRESS_SERIAL_WRITE: IndividualAddressSerialWrite,
+    }
+    table: list[type[APCI] | None] = [None] * 0x0400
+    for service in APCIService:
+        if service in service_classes:
+            # the lower 6 bits are payload - every value maps to the service
+            table[service.value : service.value + 0x40] = [
+                service_classes[service]
+            ] * 0x40
+    for sub_service in (*APCIUserService, *APCIExtendedService):
+        if sub_service in service_classes:
+            table[sub_service.value] = service_classes[sub_service]
+    return tuple(table)
+
+
+_APCI_CLASSES = _build_apci_classes()
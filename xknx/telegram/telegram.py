@@ -10,13 +10,15 @@ It contains
 
 * the direction (incoming or outgoing)
 * the group address (e.g. 1/2/3)
-* and the payload (e.g. GroupValueWrite("12%")).
+* the payload (e.g. GroupValueWrite("12%"))
+* and the priority.
 
 """
 from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
+import time
 
 from .address import GroupAddress, IndividualAddress, InternalGroupAddress
 from .apci import APCI
@@ -29,9 +31,28 @@ class TelegramDirection(Enum):
     OUTGOING = "Outgoing"
 
 
+class TelegramPriority(Enum):
+    """Enum class for the KNX priority of a telegram."""
+
+    SYSTEM = "System"
+    URGENT = "Urgent"  # "Alarm" in ETS
+    NORMAL = "Normal"  # "High" in ETS
+    LOW = "Low"
+
+
 class Telegram:
     """Class for KNX telegrams."""
 
+    __slots__ = (
+        "destination_address",
+        "direction",
+        "payload",
+        "source_address",
+        "priority",
+        "monotonic_time",
+        "_timestamp",
+    )
+
     def __init__(
         self,
         destination_address: GroupAddress
@@ -40,13 +61,31 @@ class Telegram:
         direction: TelegramDirection = TelegramDirection.OUTGOING,
         payload: APCI | None = None,
         source_address: IndividualAddress = IndividualAddress(0),
+        priority: TelegramPriority = TelegramPriority.LOW,
     ) -> None:
         """Initialize Telegram class."""
         self.destination_address = destination_address
         self.direction = direction
         self.payload = payload
         self.source_address = source_address
-        self.timestamp = datetime.now()
+        self.priority = priority
+        # time.monotonic() of creation - cheaper than datetime.now()
+        self.monotonic_time = time.monotonic()
+        self._timestamp: datetime | None = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Return the local time the telegram was created at."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(
+                time.time() - (time.monotonic() - self.monotonic_time)
+            )
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, timestamp: datetime) -> None:
+        """Set the local time the telegram was created at."""
+        self._timestamp = timestamp
 
     def __str__(self) -> str:
         """Return object as readable string."""
@@ -60,18 +99,15 @@ class Telegram:
         )
 
     def __eq__(self, other: object) -> bool:
-        """Equal operator."""
-        for key, value in self.__dict__.items():
-            if key == "timestamp":
-                continue
-            if key not in other.__dict__:
-                return False
-            if other.__dict__[key] != value:
-                return False
-        for key, value in other.__dict__.items():
-            if key not in self.__dict__:
-                return False
-        return True
+        """Equal operator. Timestamps are not compared."""
+        return (
+            isinstance(other, Telegram)
+            and self.destination_address == other.destination_address
+            and self.direction == other.direction
+            and self.payload == other.payload
+            and self.source_address == other.source_address
+            and self.priority == other.priority
+        )
 
     def __hash__(self) -> int:
         """Hash function."""
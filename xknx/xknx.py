@@ -8,10 +8,14 @@ import os
 import signal
 from sys import platform
 from types import TracebackType
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Iterable
 
 from xknx.core import (
+    BoundedTelegramQueue,
     ConnectionManager,
+    OverflowPolicy,
+    PendingReads,
+    StateStore,
     StateUpdater,
     TaskRegistry,
     TelegramQueue,
@@ -26,6 +30,7 @@ from xknx.io import (
     knx_interface_factory,
 )
 from xknx.telegram import GroupAddressType, IndividualAddress, Telegram
+from xknx.telegram.address import GroupAddress, InternalGroupAddress
 
 from .__version__ import __version__ as VERSION
 
@@ -37,6 +42,7 @@ class XKNX:
 
     DEFAULT_ADDRESS = "15.15.250"
     DEFAULT_RATE_LIMIT = 20
+    DEFAULT_RATE_LIMIT_BURST = 1
 
     def __init__(
         self,
@@ -53,21 +59,41 @@ class XKNX:
         state_updater: bool = False,
         daemon_mode: bool = False,
         connection_config: ConnectionConfig = ConnectionConfig(),
+        rate_limit_burst: int = DEFAULT_RATE_LIMIT_BURST,
+        coalesce_group_writes: bool = False,
+        incoming_workers: int = 1,
+        telegram_queue_size: int = 0,
+        telegram_queue_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        state_store_path: str | None = None,
+        state_store_interval: float = 60,
+        reconnect_buffer_ttl: float = 0,
     ) -> None:
         """Initialize XKNX class."""
         self.devices = Devices()
-        self.telegrams: asyncio.Queue[Telegram | None] = asyncio.Queue()
+        self.telegrams = BoundedTelegramQueue(
+            maxsize=telegram_queue_size, overflow_policy=telegram_queue_overflow
+        )
         self.sigint_received = asyncio.Event()
         self.telegram_queue = TelegramQueue(self)
+        self.pending_reads = PendingReads(self)
         self.state_updater = StateUpdater(self)
         self.connection_manager = ConnectionManager()
         self.task_registry = TaskRegistry(self)
         self.start_state_updater = state_updater
+        self.state_store = (
+            StateStore(self, state_store_path, save_interval=state_store_interval)
+            if state_store_path is not None
+            else None
+        )
         self.knxip_interface: KNXIPInterface | None = None
         self.started = asyncio.Event()
         self.address_format = address_format
         self.own_address = IndividualAddress(own_address)
         self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.coalesce_group_writes = coalesce_group_writes
+        self.reconnect_buffer_ttl = reconnect_buffer_ttl
+        self.incoming_workers = incoming_workers
         self.multicast_group = multicast_group
         self.multicast_port = multicast_port
         self.connection_config = connection_config
@@ -124,6 +150,9 @@ class XKNX:
             VERSION,
             self.connection_config.connection_type.name.lower(),
         )
+        if self.state_store is not None:
+            # restore before telegrams are received - they must not be overwritten by saved values
+            await self.state_store.start()
         await self.knxip_interface.start()
         await self.telegram_queue.start()
         if self.start_state_updater:
@@ -136,6 +165,18 @@ class XKNX:
         """Wait until all telegrams were processed."""
         await self.telegrams.join()
 
+    async def read_many(
+        self,
+        addresses: Iterable[GroupAddress | InternalGroupAddress],
+        timeout: float = 2.0,
+    ) -> dict[GroupAddress | InternalGroupAddress, Telegram | None]:
+        """
+        Read the values of group addresses from the KNX bus.
+
+        Return received telegrams by address - None if there was no response in time.
+        """
+        return await self.pending_reads.read_many(addresses, timeout_in_seconds=timeout)
+
     async def _stop_knxip_interface_if_exists(self) -> None:
         """Stop KNXIPInterface if initialized."""
         if self.knxip_interface is not None:
@@ -147,6 +188,8 @@ class XKNX:
         self.task_registry.stop()
         self.state_updater.stop()
         await self.join()
+        if self.state_store is not None:
+            await self.state_store.stop()
         await self.telegram_queue.stop()
         await self._stop_knxip_interface_if_exists()
         self.started.clear()